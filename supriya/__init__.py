@@ -1,17 +1,10 @@
 import configparser
+import importlib
 import logging
 import pathlib
 
 import appdirs
 
-try:
-    import pyximport
-
-    pyximport.install(language_level=3)
-    del pyximport
-except ImportError:
-    pass
-
 output_path = pathlib.Path(appdirs.user_cache_dir("supriya", "supriya"))
 if not output_path.exists():
     try:
@@ -46,7 +39,6 @@ def setup_logging(*loggers):
 
 from supriya._version import __version__, __version_info__  # noqa
 from supriya import utils  # noqa
-from supriya.clock import TempoClock  # noqa
 from supriya.enums import (  # noqa
     AddAction,
     BinaryOperator,
@@ -63,29 +55,108 @@ from supriya.enums import (  # noqa
     UnaryOperator,
     Unit,
 )
-from supriya.io import graph, play, render  # noqa
-from supriya.synthdefs import (  # noqa
-    Envelope,
-    Parameter,
-    Range,
-    SynthDef,
-    SynthDefBuilder,
-    SynthDefFactory,
+
+# Top-level names resolved on first access, so that ``import supriya`` does not
+# pull in the realtime, nonrealtime and patterns subpackages (and the Cython
+# interval tree they depend on) until something actually uses them.
+_lazy_attributes = {
+    "Assets": "supriya.system",
+    "Buffer": "supriya.realtime",
+    "BufferGroup": "supriya.realtime",
+    "Bus": "supriya.realtime",
+    "BusGroup": "supriya.realtime",
+    "Envelope": "supriya.synthdefs",
+    "Group": "supriya.realtime",
+    "Options": "supriya.scsynth",
+    "Parameter": "supriya.synthdefs",
+    "Provider": "supriya.provider",
+    "Range": "supriya.synthdefs",
+    "Say": "supriya.soundfiles",
+    "Server": "supriya.realtime",
+    "Session": "supriya.nonrealtime",
+    "SoundFile": "supriya.soundfiles",
+    "Synth": "supriya.realtime",
+    "SynthDef": "supriya.synthdefs",
+    "SynthDefBuilder": "supriya.synthdefs",
+    "SynthDefFactory": "supriya.synthdefs",
+    "TempoClock": "supriya.clock",
+    "graph": "supriya.io",
+    "play": "supriya.io",
+    "render": "supriya.io",
+}
+
+_lazy_submodules = frozenset(
+    [
+        "assets",
+        "clock",
+        "commands",
+        "conversions",
+        "exceptions",
+        "ext",
+        "intervals",
+        "io",
+        "nonrealtime",
+        "osc",
+        "patterns",
+        "provider",
+        "querytree",
+        "realtime",
+        "sclang",
+        "scsynth",
+        "soundfiles",
+        "synthdefs",
+        "system",
+        "typing",
+        "ugens",
+    ]
 )
-from supriya.realtime import (  # noqa
-    Buffer,
-    BufferGroup,
-    Bus,
-    BusGroup,
-    Group,
-    Synth,
-    Server,
+
+
+# Star imports resolve every lazy name, as the eager imports once did.
+__all__ = sorted(
+    [
+        "AddAction",
+        "BinaryOperator",
+        "CalculationRate",
+        "DoneAction",
+        "EnvelopeShape",
+        "HeaderFormat",
+        "NodeAction",
+        "ParameterRate",
+        "RequestId",
+        "RequestName",
+        "SampleFormat",
+        "SignalRange",
+        "UnaryOperator",
+        "Unit",
+        "__version__",
+        "__version_info__",
+        "assets",
+        "config",
+        "output_path",
+        "server",
+        "setup_logging",
+        "utils",
+    ]
+    + list(_lazy_attributes)
 )
-from supriya import assets  # noqa
-from supriya.nonrealtime import Session  # noqa
-from supriya.provider import Provider  # noqa
-from supriya.scsynth import Options  # noqa
-from supriya.soundfiles import Say, SoundFile  # noqa
-from supriya.system import Assets  # noqa
-
-server = Server.default()
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        module = importlib.import_module(_lazy_attributes[name])
+        value = getattr(module, name)
+    elif name in _lazy_submodules:
+        value = importlib.import_module("supriya.{}".format(name))
+    elif name == "server":
+        return __getattr__("Server").default()
+    else:
+        raise AttributeError("module 'supriya' has no attribute {!r}".format(name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(
+        set(globals()) | set(_lazy_attributes) | _lazy_submodules | {"server"}
+    )
@@ -1,5 +1,6 @@
 from .asynchronous import AsyncTempoClock
 from .ephemera import Moment, TimeUnit
+from .tempomap import TempoMap
 from .threaded import TempoClock
 
-__all__ = ["AsyncTempoClock", "Moment", "TempoClock", "TimeUnit"]
+__all__ = ["AsyncTempoClock", "Moment", "TempoClock", "TempoMap", "TimeUnit"]
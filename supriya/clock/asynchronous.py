@@ -34,10 +34,6 @@ class AsyncTempoClock(BaseTempoClock):
             event, (CallbackCommand, ChangeCommand)
         ):
             self._event_queue.remove(event)
-            if event.offset is not None:
-                self._offset_relative_event_ids.remove(event.event_id)
-                if event.measure is not None:
-                    self._measure_relative_event_ids.remove(event.event_id)
         return event
 
     async def _enqueue_command(self, command):
@@ -50,6 +46,7 @@ class AsyncTempoClock(BaseTempoClock):
             f"{desired_moment.seconds - self._state.initial_seconds}:s / "
             f"{desired_moment.offset}:o"
         )
+        self._record_lateness(event, desired_moment)
         try:
             result = event.procedure(
                 current_moment,
@@ -171,6 +168,7 @@ class AsyncTempoClock(BaseTempoClock):
                 beats_per_minute=beats_per_minute or self._state.beats_per_minute,
                 time_signature=time_signature or self._state.time_signature,
             )
+            self._reset_tempo_map()
             return None
         event_id = next(self._counter)
         command = ChangeCommand(
@@ -338,6 +336,7 @@ class AsyncTempoClock(BaseTempoClock):
             previous_time_signature_change_offset=float(initial_offset),
             time_signature=time_signature or self._state.time_signature,
         )
+        self._reset_tempo_map()
         self._is_running = True
         loop = asyncio.get_running_loop()
         self._task = loop.create_task(self._run())
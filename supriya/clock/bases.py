@@ -8,17 +8,18 @@ import time
 import traceback
 from typing import Optional, Tuple
 
-from .. import conversions
 from .ephemera import (
     CallbackCommand,
     CallbackEvent,
     ChangeEvent,
     ClockState,
     EventType,
+    LatenessStatistics,
     Moment,
     TimeUnit,
 )
-from .eventqueue import EventQueue
+from .eventqueue import TempoEventQueue
+from .tempomap import TempoMap
 
 logger = logging.getLogger("supriya.clock")
 
@@ -55,12 +56,13 @@ class BaseTempoClock:
         self._name = None
         self._counter = itertools.count()
         self._command_deque = collections.deque()
-        self._event_queue = EventQueue()
+        self._event_queue = TempoEventQueue(
+            self._measure_to_offset, self._offset_to_seconds
+        )
         self._is_running = False
+        self._lateness = LatenessStatistics()
         self._slop = 0.001
         self._events_by_id = {}
-        self._measure_relative_event_ids = set()
-        self._offset_relative_event_ids = set()
         self._state = ClockState(
             beats_per_minute=120.0,
             initial_seconds=0.0,
@@ -70,6 +72,7 @@ class BaseTempoClock:
             previous_time_signature_change_offset=0.0,
             time_signature=(4, 4),
         )
+        self._reset_tempo_map()
 
     ### TIME METHODS ###
 
@@ -113,75 +116,49 @@ class BaseTempoClock:
         return seconds, offset, measure
 
     def _measure_to_offset(self, measure: int) -> float:
-        return conversions.measure_to_offset(
-            measure,
-            self._state.time_signature,
-            self._state.previous_measure,
-            self._state.previous_time_signature_change_offset,
-        )
+        return self._tempo_map.measure_to_offset(measure)
 
     def _offset_to_measure(self, offset: float) -> int:
-        return conversions.offset_to_measure(
-            offset,
-            self._state.time_signature,
-            self._state.previous_measure,
-            self._state.previous_time_signature_change_offset,
-        )
+        return self._tempo_map.offset_to_measure(offset)
 
     def _offset_to_measure_offset(self, offset: float) -> float:
-        return conversions.offset_to_measure_offset(
-            offset,
-            self._state.time_signature,
-            self._state.previous_time_signature_change_offset,
-        )
+        return self._tempo_map.offset_to_measure_offset(offset)
 
     def _offset_to_moment(self, offset: float) -> Moment:
-        seconds = self._offset_to_seconds(offset)
-        measure, measure_offset = divmod(
-            offset - self._state.previous_time_signature_change_offset,
-            self._state.time_signature[0] / self._state.time_signature[1],
-        )
         return Moment(
             beats_per_minute=self._state.beats_per_minute,
-            measure=int(measure + self._state.previous_measure),
-            measure_offset=measure_offset,
+            measure=self._tempo_map.offset_to_measure(offset),
+            measure_offset=self._tempo_map.offset_to_measure_offset(offset),
             offset=offset,
-            seconds=seconds,
+            seconds=self._tempo_map.offset_to_seconds(offset),
             time_signature=self._state.time_signature,
         )
 
     def _offset_to_seconds(self, offset: float) -> float:
-        return conversions.offset_to_seconds(
+        return self._tempo_map.offset_to_seconds(offset)
+
+    def _reset_tempo_map(self):
+        self._tempo_map = TempoMap(
             beats_per_minute=self._state.beats_per_minute,
-            current_offset=offset,
-            previous_offset=self._state.previous_offset,
-            previous_seconds=self._state.previous_seconds,
-            beat_duration=1 / self._state.time_signature[1],
+            time_signature=self._state.time_signature,
+            initial_offset=self._state.previous_offset,
+            initial_seconds=self._state.previous_seconds,
+            initial_measure=self._state.previous_measure,
         )
 
     def _seconds_to_moment(self, seconds):
-        offset = self._seconds_to_offset(seconds)
-        measure, measure_offset = divmod(
-            offset - self._state.previous_time_signature_change_offset,
-            self._state.time_signature[0] / self._state.time_signature[1],
-        )
+        offset = self._tempo_map.seconds_to_offset(seconds)
         return Moment(
             beats_per_minute=self._state.beats_per_minute,
-            measure=int(measure + self._state.previous_measure),
-            measure_offset=measure_offset,
+            measure=self._tempo_map.offset_to_measure(offset),
+            measure_offset=self._tempo_map.offset_to_measure_offset(offset),
             offset=offset,
             seconds=seconds,
             time_signature=self._state.time_signature,
         )
 
     def _seconds_to_offset(self, seconds: float) -> float:
-        return conversions.seconds_to_offset(
-            beats_per_minute=self._state.beats_per_minute,
-            current_time=seconds,
-            previous_offset=self._state.previous_offset,
-            previous_seconds=self._state.previous_seconds,
-            beat_duration=1 / self._state.time_signature[1],
-        )
+        return self._tempo_map.seconds_to_offset(seconds)
 
     ### SCHEDULING METHODS ###
 
@@ -203,14 +180,8 @@ class BaseTempoClock:
     def _enqueue_event(self, event):
         self._events_by_id[event.event_id] = event
         self._event_queue.put(event)
-        if event.offset is not None:
-            self._offset_relative_event_ids.add(event.event_id)
-            if event.measure is not None:
-                self._measure_relative_event_ids.add(event.event_id)
 
     def _process_perform_event_loop(self, current_moment):
-        # There may be items in the queue which have been flagged "removed".
-        # They contribute to the queue's size, but cannot be retrieved by .get().
         try:
             event = self._event_queue.get()
         except queue.Empty:
@@ -236,6 +207,7 @@ class BaseTempoClock:
             f"{desired_moment.seconds - self._state.initial_seconds}:s / "
             f"{desired_moment.offset}:o"
         )
+        self._record_lateness(event, desired_moment)
         try:
             result = event.procedure(
                 current_moment,
@@ -280,6 +252,7 @@ class BaseTempoClock:
         )
         # TODO: current offset is misleading here
         if event.time_signature is not None:
+            previous_time_signature = self._state.time_signature
             new_duration = event.time_signature[0] / event.time_signature[1]
             if desired_moment.measure_offset < new_duration:
                 # On the downbeat
@@ -298,7 +271,15 @@ class BaseTempoClock:
                     previous_time_signature_change_offset=desired_moment.offset,
                     time_signature=event.time_signature,
                 )
-            self._reschedule_measure_relative_events()
+            self._tempo_map.change_time_signature(
+                self._state.previous_time_signature_change_offset,
+                self._state.time_signature,
+                self._state.previous_measure,
+            )
+            if event.time_signature[1] != previous_time_signature[1]:
+                self._tempo_map.change_tempo(
+                    desired_moment.offset, beat_duration=1 / event.time_signature[1]
+                )
             current_moment = dataclasses.replace(
                 current_moment,
                 time_signature=self._state.time_signature,
@@ -312,7 +293,9 @@ class BaseTempoClock:
                 previous_seconds=desired_moment.seconds,
                 previous_offset=desired_moment.offset,
             )
-            self._reschedule_offset_relative_events()
+            self._tempo_map.change_tempo(
+                desired_moment.offset, beats_per_minute=self._state.beats_per_minute
+            )
             new_current_offset = self._seconds_to_offset(current_moment.seconds)
             logger.debug(
                 f"[{self.name}] ... ... ... Revised offset from "
@@ -406,34 +389,10 @@ class BaseTempoClock:
                 f"({event.event_id}) for {event.seconds}:s / {event.offset}:o"
             )
 
-    def _reschedule_offset_relative_events(self):
-        for event_id in tuple(self._offset_relative_event_ids):
-            event = self._cancel(event_id)
-            if event is None:
-                self._offset_relative_event_ids.remove(event_id)
-                continue
-            seconds = self._offset_to_seconds(event.offset)
-            logger.debug(
-                f"[{self.name}] ... ... ... Rescheduling offset-relative event "
-                f"({event.event_id}) from "
-                f"{event.seconds - self._state.initial_seconds}:s to "
-                f"{seconds - self._state.initial_seconds}:s"
-            )
-            self._enqueue_event(event._replace(seconds=seconds))
-
-    def _reschedule_measure_relative_events(self):
-        for event_id in tuple(self._measure_relative_event_ids):
-            event = self._cancel(event_id)
-            if event is None:
-                self._measure_relative_event_ids.remove(event_id)
-                continue
-            offset = self._measure_to_offset(event.measure)
-            seconds = self._offset_to_seconds(offset)
-            logger.debug(
-                f"[{self.name}] ... ... ... Rescheduling measure-relative event from "
-                f"offset {event.offset} to {offset}"
-            )
-            self._enqueue_event(event._replace(offset=offset, seconds=seconds))
+    def _record_lateness(self, event, desired_moment):
+        self._lateness.record(
+            event.event_id, self.get_current_time() - desired_moment.seconds
+        )
 
     ### PUBLIC METHODS ###
 
@@ -463,6 +422,10 @@ class BaseTempoClock:
     def is_running(self):
         return self._is_running
 
+    @property
+    def lateness(self) -> LatenessStatistics:
+        return self._lateness
+
     @property
     def name(self) -> Optional[str]:
         return self._name
@@ -477,6 +440,10 @@ class BaseTempoClock:
             raise ValueError(slop)
         self._slop = float(slop)
 
+    @property
+    def tempo_map(self) -> TempoMap:
+        return self._tempo_map
+
     @property
     def time_signature(self):
         return self._state.time_signature
@@ -1,6 +1,7 @@
+import collections
 import dataclasses
 import enum
-from typing import Callable, Dict, NamedTuple, Optional, Tuple
+from typing import Callable, Deque, Dict, NamedTuple, Optional, Tuple
 
 
 class EventType(enum.IntEnum):
@@ -89,3 +90,59 @@ class ChangeEvent(NamedTuple):
 
     def __hash__(self):
         return hash((type(self), self.event_id))
+
+
+class LatenessStatistics:
+    """
+    Running statistics of how late a clock performs its events.
+
+    Lateness is the difference, in seconds, between when an event's procedure
+    was actually called and when it was scheduled for. The most recent
+    ``(event_id, lateness)`` samples are kept for inspection.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("count", "maximum", "minimum", "samples", "total")
+
+    ### INITIALIZER ###
+
+    def __init__(self, sample_count: int = 1024):
+        self.samples: Deque[Tuple[int, float]] = collections.deque(maxlen=sample_count)
+        self.clear()
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} count={self.count} mean={self.mean:f} "
+            f"minimum={self.minimum:f} maximum={self.maximum:f}>"
+        )
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        self.count = 0
+        self.maximum = 0.0
+        self.minimum = 0.0
+        self.total = 0.0
+        self.samples.clear()
+
+    def record(self, event_id: int, lateness: float):
+        if not self.count:
+            self.maximum = self.minimum = lateness
+        elif lateness > self.maximum:
+            self.maximum = lateness
+        elif lateness < self.minimum:
+            self.minimum = lateness
+        self.count += 1
+        self.total += lateness
+        self.samples.append((event_id, lateness))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def mean(self) -> float:
+        if not self.count:
+            return 0.0
+        return self.total / self.count
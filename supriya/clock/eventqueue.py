@@ -1,28 +1,82 @@
+import heapq
+import itertools
 import queue
+import threading
+
+
+class EventQueueEntry:
+    """
+    An entry in an ``EventQueue``'s heap.
+
+    Removing an item from the queue only flags its entry inactive, leaving a
+    tombstone in the heap.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("active", "item")
+
+    ### INITIALIZER ###
+
+    def __init__(self, item):
+        self.active = True
+        self.item = item
 
 
 class EventQueue(queue.PriorityQueue):
+    """
+    A priority queue of clock events, supporting removal.
+
+    ``key`` orders the queue's items. By default items are compared directly.
+
+    Removed items leave tombstones in the heap, which are discarded when they
+    reach its head, or all at once when they outnumber both the live items and
+    ``compaction_threshold``.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, key=None, compaction_threshold=1024):
+        self._key = key
+        self._compaction_threshold = int(compaction_threshold)
+        super().__init__()
 
     ### PRIVATE METHODS ###
 
+    def _compact(self):
+        self.queue = [entry for entry in self.queue if entry[-1].active]
+        heapq.heapify(self.queue)
+
+    def _discard_tombstones(self):
+        # Pop removed entries off the head of the heap, so the head is live.
+        while self.queue and not self.queue[0][-1].active:
+            heapq.heappop(self.queue)
+
     def _init(self, maxsize):
         self.queue = []
         self.items = {}
+        self.counter = itertools.count()
+
+    def _get(self):
+        self._discard_tombstones()
+        if not self.queue:
+            raise queue.Empty
+        entry = heapq.heappop(self.queue)[-1]
+        del self.items[entry.item]
+        self._discard_tombstones()
+        return entry.item
 
     def _put(self, item):
-        entry = [item, True]
-        if item in self.items:
-            self.items[item][-1] = False
+        entry = EventQueueEntry(item)
+        previous_entry = self.items.get(item)
+        if previous_entry is not None:
+            previous_entry.active = False
         self.items[item] = entry
-        super()._put(entry)
+        key = item if self._key is None else self._key(item)
+        heapq.heappush(self.queue, (key, next(self.counter), entry))
 
-    def _get(self):
-        while self.queue:
-            item, active = super()._get()
-            if active:
-                del self.items[item]
-                return item
-        raise queue.Empty
+    def _qsize(self):
+        return len(self.items)
 
     ### PUBLIC METHODS ###
 
@@ -32,14 +86,137 @@ class EventQueue(queue.PriorityQueue):
 
     def peek(self):
         with self.mutex:
-            item = self._get()
-            entry = [item, True]
-            self.items[item] = entry
-            super()._put(entry)
-        return item
+            self._discard_tombstones()
+            if not self.queue:
+                raise queue.Empty
+            return self.queue[0][-1].item
 
     def remove(self, item):
         with self.mutex:
             entry = self.items.pop(item, None)
-            if entry is not None:
-                entry[-1] = False
+            if entry is None:
+                return
+            entry.active = False
+            tombstone_count = len(self.queue) - len(self.items)
+            if (
+                tombstone_count > self._compaction_threshold
+                and tombstone_count > len(self.items)
+            ):
+                self._compact()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def size(self) -> int:
+        """
+        Gets the number of live items in the queue.
+        """
+        return len(self.items)
+
+    @property
+    def tombstone_count(self) -> int:
+        """
+        Gets the number of removed items still occupying the heap.
+        """
+        return len(self.queue) - len(self.items)
+
+
+class TempoEventQueue:
+    """
+    A queue of clock events, ordered by when they will occur in seconds.
+
+    Offset-relative and measure-relative events are kept in heaps ordered by
+    offset and by measure, and only mapped to seconds (and offsets) through
+    the clock's current tempo and time signature when they reach the head of
+    their heap. Tempo and time signature changes therefore don't require
+    rescheduling anything.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, measure_to_offset, offset_to_seconds):
+        self._measure_to_offset = measure_to_offset
+        self._offset_to_seconds = offset_to_seconds
+        self._lock = threading.RLock()
+        self._measure_queue = EventQueue(
+            key=lambda event: (event.measure, event.event_type, event.event_id)
+        )
+        self._offset_queue = EventQueue(
+            key=lambda event: (event.offset, event.event_type, event.event_id)
+        )
+        self._seconds_queue = EventQueue(
+            key=lambda event: (event.seconds, event.event_type, event.event_id)
+        )
+        self._queues = (self._seconds_queue, self._offset_queue, self._measure_queue)
+
+    ### PRIVATE METHODS ###
+
+    def _get_queue(self, event):
+        if event.measure is not None:
+            return self._measure_queue
+        elif event.offset is not None:
+            return self._offset_queue
+        return self._seconds_queue
+
+    def _peek(self):
+        next_queue, next_event, next_key = None, None, None
+        for event_queue in self._queues:
+            try:
+                event = self._resolve(event_queue.peek())
+            except queue.Empty:
+                continue
+            key = (event.seconds, event.event_type, event.event_id)
+            if next_key is None or key < next_key:
+                next_queue, next_event, next_key = event_queue, event, key
+        if next_queue is None:
+            raise queue.Empty
+        return next_queue, next_event
+
+    def _resolve(self, event):
+        if event.offset is None:
+            return event
+        offset = event.offset
+        if event.measure is not None:
+            offset = self._measure_to_offset(event.measure)
+        seconds = self._offset_to_seconds(offset)
+        if offset == event.offset and seconds == event.seconds:
+            return event
+        return event._replace(offset=offset, seconds=seconds)
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        with self._lock:
+            for event_queue in self._queues:
+                event_queue.clear()
+
+    def get(self):
+        with self._lock:
+            event_queue, event = self._peek()
+            event_queue.get()
+            return event
+
+    def peek(self):
+        with self._lock:
+            return self._peek()[1]
+
+    def put(self, event):
+        with self._lock:
+            self._get_queue(event).put(event)
+
+    def qsize(self):
+        return sum(event_queue.qsize() for event_queue in self._queues)
+
+    def remove(self, event):
+        with self._lock:
+            self._get_queue(event).remove(event)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def size(self) -> int:
+        return sum(event_queue.size for event_queue in self._queues)
+
+    @property
+    def tombstone_count(self) -> int:
+        return sum(event_queue.tombstone_count for event_queue in self._queues)
@@ -0,0 +1,302 @@
+import bisect
+from typing import List, Optional, Sequence, Tuple
+
+from .. import conversions
+
+
+class TempoMap:
+    """
+    A piecewise map between offsets, measures and seconds.
+
+    Offsets are measured in whole notes. The map is made of tempo segments,
+    each starting at an offset with a tempo which is either constant or
+    ramps linearly (in offset) until the next segment, and of time signature
+    segments, each starting at an offset on the downbeat of a numbered
+    measure.
+
+    ::
+
+        >>> from supriya.clock import TempoMap
+        >>> tempo_map = TempoMap(beats_per_minute=120)
+        >>> tempo_map.change(2.0, beats_per_minute=60, time_signature=(3, 4))
+        >>> tempo_map.offset_to_seconds(3.0)
+        8.0
+        >>> tempo_map.seconds_to_offset(8.0)
+        3.0
+        >>> tempo_map.offset_to_measure(3.0)
+        4
+
+    Tempos can ramp linearly between two offsets:
+
+    ::
+
+        >>> tempo_map = TempoMap(beats_per_minute=60)
+        >>> tempo_map.ramp(0.0, 1.0, beats_per_minute=120)
+        >>> round(tempo_map.offset_to_seconds(1.0), 6)
+        2.772589
+        >>> tempo_map.beats_per_minute_at(0.5)
+        90.0
+
+    Whole sequences of offsets or seconds can be converted at once, with
+    NumPy when it is installed.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        beats_per_minute: float = 120.0,
+        time_signature: Tuple[int, int] = (4, 4),
+        initial_offset: float = 0.0,
+        initial_seconds: float = 0.0,
+        initial_measure: int = 1,
+    ):
+        initial_offset = float(initial_offset)
+        # Tempo segments
+        self._offsets: List[float] = [initial_offset]
+        self._seconds: List[float] = [float(initial_seconds)]
+        self._beats_per_minute: List[float] = [float(beats_per_minute)]
+        self._slopes: List[float] = [0.0]
+        self._beat_durations: List[float] = [1 / time_signature[1]]
+        # Time signature segments
+        self._time_signature_offsets: List[float] = [initial_offset]
+        self._measures: List[int] = [int(initial_measure)]
+        self._time_signatures: List[Tuple[int, int]] = [tuple(time_signature)]
+        self._arrays = None
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        return "<{} tempo_segments={} time_signature_segments={}>".format(
+            type(self).__name__, len(self._offsets), len(self._time_signature_offsets)
+        )
+
+    ### PRIVATE METHODS ###
+
+    def _get_arrays(self):
+        import numpy
+
+        if self._arrays is None:
+            offsets = numpy.array(self._offsets)
+            seconds = numpy.array(self._seconds)
+            # Offsets per second, and its slope per offset.
+            rates = (
+                numpy.array(self._beats_per_minute)
+                * numpy.array(self._beat_durations)
+                / 60
+            )
+            slopes = numpy.array(self._slopes) * numpy.array(self._beat_durations) / 60
+            self._arrays = offsets, seconds, rates, slopes
+        return self._arrays
+
+    def _get_tempo_index(self, offset: float) -> int:
+        return max(bisect.bisect_right(self._offsets, offset) - 1, 0)
+
+    def _get_time_signature_index(self, offset: float) -> int:
+        return max(bisect.bisect_right(self._time_signature_offsets, offset) - 1, 0)
+
+    def _set_tempo_segment(self, offset, beats_per_minute, slope, beat_duration):
+        index = bisect.bisect_left(self._offsets, offset)
+        seconds = self.offset_to_seconds(offset)
+        del self._offsets[index:]
+        del self._seconds[index:]
+        del self._beats_per_minute[index:]
+        del self._slopes[index:]
+        del self._beat_durations[index:]
+        self._offsets.append(offset)
+        self._seconds.append(seconds)
+        self._beats_per_minute.append(float(beats_per_minute))
+        self._slopes.append(float(slope))
+        self._beat_durations.append(beat_duration)
+        self._arrays = None
+
+    ### PUBLIC METHODS ###
+
+    def beats_per_minute_at(self, offset: float) -> float:
+        """
+        Gets the tempo at ``offset``.
+        """
+        index = self._get_tempo_index(offset)
+        return self._beats_per_minute[index] + self._slopes[index] * (
+            offset - self._offsets[index]
+        )
+
+    def change(
+        self,
+        offset: float,
+        *,
+        beats_per_minute: Optional[float] = None,
+        time_signature: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        """
+        Changes tempo and/or time signature at ``offset``.
+
+        The time signature's denominator determines which note value
+        ``beats_per_minute`` counts.
+        """
+        if time_signature is not None:
+            self.change_time_signature(offset, time_signature)
+        if beats_per_minute is not None or time_signature is not None:
+            self.change_tempo(
+                offset,
+                beats_per_minute=beats_per_minute,
+                beat_duration=(
+                    None if time_signature is None else 1 / time_signature[1]
+                ),
+            )
+
+    def change_tempo(
+        self,
+        offset: float,
+        *,
+        beats_per_minute: Optional[float] = None,
+        beat_duration: Optional[float] = None,
+    ) -> None:
+        """
+        Changes tempo at ``offset``, replacing any later tempo segments.
+        """
+        offset = float(offset)
+        if beats_per_minute is None:
+            beats_per_minute = self.beats_per_minute_at(offset)
+        if beat_duration is None:
+            beat_duration = self._beat_durations[self._get_tempo_index(offset)]
+        self._set_tempo_segment(offset, beats_per_minute, 0.0, beat_duration)
+
+    def change_time_signature(
+        self,
+        offset: float,
+        time_signature: Tuple[int, int],
+        measure: Optional[int] = None,
+    ) -> None:
+        """
+        Starts measure ``measure`` in ``time_signature`` at ``offset``,
+        replacing any later time signature segments.
+
+        ``measure`` defaults to the measure starting at ``offset`` if
+        ``offset`` is on a downbeat, otherwise to the following measure.
+        """
+        offset = float(offset)
+        if measure is None:
+            measure = self.offset_to_measure(offset)
+            if self.offset_to_measure_offset(offset):
+                measure += 1
+        index = bisect.bisect_left(self._time_signature_offsets, offset)
+        del self._time_signature_offsets[index:]
+        del self._measures[index:]
+        del self._time_signatures[index:]
+        self._time_signature_offsets.append(offset)
+        self._measures.append(int(measure))
+        self._time_signatures.append(tuple(time_signature))
+
+    def measure_to_offset(self, measure: int) -> float:
+        index = max(bisect.bisect_right(self._measures, measure) - 1, 0)
+        return conversions.measure_to_offset(
+            measure,
+            self._time_signatures[index],
+            self._measures[index],
+            self._time_signature_offsets[index],
+        )
+
+    def offset_to_measure(self, offset: float) -> int:
+        index = self._get_time_signature_index(offset)
+        return conversions.offset_to_measure(
+            offset,
+            self._time_signatures[index],
+            self._measures[index],
+            self._time_signature_offsets[index],
+        )
+
+    def offset_to_measure_offset(self, offset: float) -> float:
+        index = self._get_time_signature_index(offset)
+        return conversions.offset_to_measure_offset(
+            offset, self._time_signatures[index], self._time_signature_offsets[index]
+        )
+
+    def offset_to_seconds(self, offset: float) -> float:
+        index = self._get_tempo_index(offset)
+        return conversions.ramp_offset_to_seconds(
+            beats_per_minute=self._beats_per_minute[index],
+            beats_per_minute_slope=self._slopes[index],
+            current_offset=offset,
+            previous_offset=self._offsets[index],
+            previous_seconds=self._seconds[index],
+            beat_duration=self._beat_durations[index],
+        )
+
+    def offsets_to_seconds(self, offsets: Sequence[float]):
+        """
+        Converts a sequence of offsets to seconds.
+
+        Returns a NumPy array if NumPy is installed, otherwise a list.
+        """
+        try:
+            import numpy
+        except ImportError:
+            return [self.offset_to_seconds(offset) for offset in offsets]
+        offsets = numpy.asarray(offsets, dtype=float)
+        segment_offsets, segment_seconds, rates, slopes = self._get_arrays()
+        indices = numpy.searchsorted(segment_offsets, offsets, side="right") - 1
+        numpy.clip(indices, 0, None, out=indices)
+        deltas = offsets - segment_offsets[indices]
+        rates, slopes = rates[indices], slopes[indices]
+        is_ramp = slopes != 0
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            ramped = numpy.log1p(slopes * deltas / rates) / slopes
+        return segment_seconds[indices] + numpy.where(is_ramp, ramped, deltas / rates)
+
+    def ramp(
+        self,
+        offset: float,
+        stop_offset: float,
+        *,
+        beats_per_minute: float,
+        beat_duration: Optional[float] = None,
+    ) -> None:
+        """
+        Ramps linearly from the tempo at ``offset`` to ``beats_per_minute`` at
+        ``stop_offset``, replacing any later tempo segments.
+        """
+        offset, stop_offset = float(offset), float(stop_offset)
+        if stop_offset <= offset:
+            raise ValueError(stop_offset)
+        start_beats_per_minute = self.beats_per_minute_at(offset)
+        if beat_duration is None:
+            beat_duration = self._beat_durations[self._get_tempo_index(offset)]
+        slope = (beats_per_minute - start_beats_per_minute) / (stop_offset - offset)
+        self._set_tempo_segment(offset, start_beats_per_minute, slope, beat_duration)
+        self._set_tempo_segment(stop_offset, beats_per_minute, 0.0, beat_duration)
+
+    def seconds_to_offset(self, seconds: float) -> float:
+        index = max(bisect.bisect_right(self._seconds, seconds) - 1, 0)
+        return conversions.ramp_seconds_to_offset(
+            beats_per_minute=self._beats_per_minute[index],
+            beats_per_minute_slope=self._slopes[index],
+            current_time=seconds,
+            previous_offset=self._offsets[index],
+            previous_seconds=self._seconds[index],
+            beat_duration=self._beat_durations[index],
+        )
+
+    def seconds_to_offsets(self, seconds: Sequence[float]):
+        """
+        Converts a sequence of seconds to offsets.
+
+        Returns a NumPy array if NumPy is installed, otherwise a list.
+        """
+        try:
+            import numpy
+        except ImportError:
+            return [self.seconds_to_offset(x) for x in seconds]
+        seconds = numpy.asarray(seconds, dtype=float)
+        segment_offsets, segment_seconds, rates, slopes = self._get_arrays()
+        indices = numpy.searchsorted(segment_seconds, seconds, side="right") - 1
+        numpy.clip(indices, 0, None, out=indices)
+        deltas = seconds - segment_seconds[indices]
+        rates, slopes = rates[indices], slopes[indices]
+        is_ramp = slopes != 0
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            ramped = numpy.expm1(slopes * deltas) * rates / slopes
+        return segment_offsets[indices] + numpy.where(is_ramp, ramped, deltas * rates)
+
+    def time_signature_at(self, offset: float) -> Tuple[int, int]:
+        return self._time_signatures[self._get_time_signature_index(offset)]
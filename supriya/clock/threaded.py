@@ -26,9 +26,10 @@ class TempoClock(BaseTempoClock):
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(self, *, event_driven: bool = False):
         BaseTempoClock.__init__(self)
         self._event = threading.Event()
+        self._event_driven = bool(event_driven)
         self._thread = threading.Thread(target=self._run, daemon=True)
 
     ### SCHEDULING METHODS ###
@@ -40,10 +41,6 @@ class TempoClock(BaseTempoClock):
             event, (CallbackCommand, ChangeCommand)
         ):
             self._event_queue.remove(event)
-            if event.offset is not None:
-                self._offset_relative_event_ids.remove(event.event_id)
-                if event.measure is not None:
-                    self._measure_relative_event_ids.remove(event.event_id)
         return event
 
     def _enqueue_command(self, command):
@@ -68,7 +65,7 @@ class TempoClock(BaseTempoClock):
                 previous_seconds=current_moment.seconds,
                 previous_offset=current_moment.offset,
             )
-            if not offline:
+            if not offline and not self._event_driven:
                 self._event.wait(timeout=self._slop)
         logger.debug(f"[{self.name}] Terminating")
 
@@ -80,28 +77,42 @@ class TempoClock(BaseTempoClock):
         )
         while current_time < next_time:
             if not offline:
-                self._event.wait(timeout=self._slop)
+                self._wait(next_time - current_time)
             if not self._is_running:
                 return None
+            # Clear before draining, so a command enqueued afterwards still
+            # wakes the next wait.
+            self._event.clear()
             self._process_command_deque()
             next_time = self._event_queue.peek().seconds
             current_time = self.get_current_time()
-            self._event.clear()
         return self._seconds_to_moment(current_time)
 
     def _wait_for_queue(self, offline=False) -> bool:
         logger.debug(f"[{self.name}] ... Waiting for events")
-        self._process_command_deque()
         self._event.clear()
+        self._process_command_deque()
         while not self._event_queue.qsize():
             if not offline:
-                self._event.wait(timeout=self._slop)
+                self._wait(None)
             if not self._is_running:
                 return False
-            self._process_command_deque()
             self._event.clear()
+            self._process_command_deque()
         return True
 
+    def _wait(self, timeout: Optional[float]):
+        """
+        Block until ``timeout`` seconds elapse or a command arrives.
+
+        In event-driven mode the clock sleeps until the next event's deadline
+        (or indefinitely with an empty queue). Otherwise it polls every
+        ``slop`` seconds.
+        """
+        if not self._event_driven:
+            timeout = self._slop
+        self._event.wait(timeout=timeout)
+
     ### PUBLIC METHODS ###
 
     def cancel(self, event_id) -> Optional[Tuple]:
@@ -120,6 +131,7 @@ class TempoClock(BaseTempoClock):
                 beats_per_minute=beats_per_minute or self._state.beats_per_minute,
                 time_signature=time_signature or self._state.time_signature,
             )
+            self._reset_tempo_map()
             return None
         event_id = next(self._counter)
         command = ChangeCommand(
@@ -293,6 +305,7 @@ class TempoClock(BaseTempoClock):
             previous_time_signature_change_offset=float(initial_offset),
             time_signature=time_signature or self._state.time_signature,
         )
+        self._reset_tempo_map()
         self._is_running = True
         self._thread = threading.Thread(target=self._run, args=(self,), daemon=True)
         self._thread.start()
@@ -303,3 +316,9 @@ class TempoClock(BaseTempoClock):
         self._is_running = False
         self._event.set()
         self._thread.join()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def event_driven(self) -> bool:
+        return self._event_driven
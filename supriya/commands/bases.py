@@ -227,10 +227,19 @@ class RequestBundle(Requestable):
         else:
             contents = ()
         self._contents = contents
+        self._osc_bundle = None
         self._response = None
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _from_encoded(cls, timestamp, requests, osc_messages, datagrams):
+        request_bundle = cls(timestamp=timestamp, contents=requests)
+        request_bundle._osc_bundle = OscBundle._from_encoded(
+            timestamp, osc_messages, datagrams
+        )
+        return request_bundle
+
     def _get_response_patterns_and_requestable(self, server):
         from supriya.commands import SyncRequest
 
@@ -254,6 +263,8 @@ class RequestBundle(Requestable):
     ### PUBLIC METHODS ###
 
     def to_osc(self, *, with_placeholders=False):
+        if self._osc_bundle is not None and not with_placeholders:
+            return self._osc_bundle
         contents = []
         for x in self.contents:
             if isinstance(x, type(self)):
@@ -265,22 +276,41 @@ class RequestBundle(Requestable):
 
     @classmethod
     def partition(cls, requests, timestamp=None):
+        """
+        Partition ``requests`` into bundles whose datagrams fit in a single
+        UDP packet.
+
+        Each request is serialized exactly once: the resulting bundles reuse
+        the OSC messages and datagrams encoded while measuring.
+        """
         bundles = []
-        contents = []
+        contents, osc_messages, datagrams = [], [], []
         requests = deque(requests)
-        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 4
+        # Bundle prefix plus 8-byte timestamp, then length-prefixed datagrams.
+        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 8
         while requests:
             request = requests.popleft()
-            datagram = request.to_datagram()
+            osc_message = request.to_osc()
+            datagram = osc_message.to_datagram()
             remaining -= len(datagram) + 4
-            if remaining > 0:
+            if remaining >= 0 or not contents:
                 contents.append(request)
+                osc_messages.append(osc_message)
+                datagrams.append(datagram)
             else:
-                bundles.append(cls(timestamp=timestamp, contents=contents))
-                contents = [request]
-                remaining = maximum
+                bundles.append(
+                    cls._from_encoded(timestamp, contents, osc_messages, datagrams)
+                )
+                contents, osc_messages, datagrams = (
+                    [request],
+                    [osc_message],
+                    [datagram],
+                )
+                remaining = maximum - len(datagram) - 4
         if contents:
-            bundles.append(cls(timestamp=timestamp, contents=contents))
+            bundles.append(
+                cls._from_encoded(timestamp, contents, osc_messages, datagrams)
+            )
         return bundles
 
     ### PUBLIC PROPERTIES ###
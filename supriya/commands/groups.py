@@ -4,7 +4,6 @@ from collections.abc import Sequence
 import supriya.osc
 from supriya.enums import RequestId
 from supriya.querytree import QueryTreeControl, QueryTreeGroup, QueryTreeSynth
-from supriya.realtime.nodes import Group, Node
 
 from .bases import Request, Response
 
@@ -314,6 +313,8 @@ class GroupNewRequest(Request):
     ### PRIVATE METHODS ###
 
     def _apply_local(self, server):
+        from supriya.realtime.nodes import Group, Node
+
         for item in self.items:
             if isinstance(item.node_id, Group):
                 node_id = None
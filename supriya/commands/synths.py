@@ -3,7 +3,6 @@ from collections.abc import Sequence
 import supriya.osc
 from supriya import AddAction
 from supriya.enums import RequestId
-from supriya.realtime.nodes import Node, Synth
 
 from .bases import Request, Response
 
@@ -89,6 +88,8 @@ class SynthNewRequest(Request):
     ### PRIVATE METHODS ###
 
     def _apply_local(self, server):
+        from supriya.realtime.nodes import Node, Synth
+
         if isinstance(self.node_id, Synth):
             node_id = None
             synth = self.node_id
@@ -1,3 +1,4 @@
+import math
 from typing import Tuple
 
 
@@ -79,3 +80,69 @@ def seconds_to_offset(
     return (
         (current_time - previous_seconds) * (beats_per_minute / 60) * beat_duration
     ) + previous_offset
+
+
+def ramp_offset_to_seconds(
+    beats_per_minute: float,
+    beats_per_minute_slope: float,
+    current_offset: float,
+    previous_offset: float,
+    previous_seconds: float,
+    beat_duration: float,
+) -> float:
+    """
+    Converts ``current_offset`` to seconds during a linear tempo ramp.
+
+    The tempo is ``beats_per_minute`` at ``previous_offset`` and changes by
+    ``beats_per_minute_slope`` per whole-note offset.
+    """
+    if not beats_per_minute_slope:
+        return offset_to_seconds(
+            beats_per_minute=beats_per_minute,
+            current_offset=current_offset,
+            previous_offset=previous_offset,
+            previous_seconds=previous_seconds,
+            beat_duration=beat_duration,
+        )
+    return (
+        math.log1p(
+            beats_per_minute_slope
+            * (current_offset - previous_offset)
+            / beats_per_minute
+        )
+        * 60
+        / (beats_per_minute_slope * beat_duration)
+    ) + previous_seconds
+
+
+def ramp_seconds_to_offset(
+    beats_per_minute: float,
+    beats_per_minute_slope: float,
+    current_time: float,
+    previous_offset: float,
+    previous_seconds: float,
+    beat_duration: float,
+) -> float:
+    """
+    Converts ``current_time`` to an offset during a linear tempo ramp.
+
+    The inverse of ``ramp_offset_to_seconds()``.
+    """
+    if not beats_per_minute_slope:
+        return seconds_to_offset(
+            beats_per_minute=beats_per_minute,
+            current_time=current_time,
+            previous_offset=previous_offset,
+            previous_seconds=previous_seconds,
+            beat_duration=beat_duration,
+        )
+    return (
+        math.expm1(
+            (current_time - previous_seconds)
+            * beats_per_minute_slope
+            * beat_duration
+            / 60
+        )
+        * beats_per_minute
+        / beats_per_minute_slope
+    ) + previous_offset
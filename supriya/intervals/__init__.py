@@ -6,6 +6,14 @@ from .IntervalTree import IntervalTree  # noqa
 from .IntervalTreeDriver import IntervalTreeDriver  # noqa
 from .Moment import Moment  # noqa
 
+try:
+    import pyximport
+
+    pyximport.install(language_level=3)
+    del pyximport
+except ImportError:
+    pass
+
 try:
     from .IntervalTreeDriverEx import IntervalTreeDriverEx  # noqa
 except ModuleNotFoundError:
@@ -43,7 +43,15 @@ def play(renderable, **kwargs):
     return Player(renderable, **kwargs)()
 
 
-def render(renderable, output_file_path=None, render_directory_path=None, **kwargs):
+def render(
+    renderable,
+    output_file_path=None,
+    render_directory_path=None,
+    render_cache=None,
+    **kwargs,
+):
+    if render_cache is not None:
+        kwargs["render_cache"] = render_cache
     return renderable.__render__(
         output_file_path=output_file_path,
         render_directory_path=render_directory_path,
@@ -4,6 +4,7 @@ Tools for working in non-realtime.
 from .bases import SessionObject
 from .buffers import Buffer, BufferGroup
 from .buses import AudioInputBusGroup, AudioOutputBusGroup, Bus, BusGroup
+from .cache import RenderCache, RenderCacheStatistics
 from .nodes import Group, Node, RootNode, Synth
 from .renderer import SessionRenderer
 from .sessions import Session
@@ -21,6 +22,8 @@ __all__ = [
     "Moment",
     "Node",
     "NodeTransition",
+    "RenderCache",
+    "RenderCacheStatistics",
     "RootNode",
     "Session",
     "SessionObject",
@@ -110,6 +110,7 @@ class Bus(SessionObject):
 
     def _set_at_offset(self, offset, value):
         assert self.calculation_rate == supriya.CalculationRate.CONTROL
+        self.session._mark_dirty(offset, buses=True)
         events = self._events
         event = (offset, value)
         if not events:
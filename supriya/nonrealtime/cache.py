@@ -0,0 +1,288 @@
+import contextlib
+import fcntl
+import hashlib
+import os
+import pathlib
+import shutil
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+import supriya
+from supriya.system import SupriyaObject
+
+
+class RenderCacheStatistics(NamedTuple):
+    """
+    A render cache's lifetime hit, miss and eviction counts, and its current
+    entry count and size in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entry_count: int
+    size: int
+
+
+class RenderCache(SupriyaObject):
+    """
+    A persistent cache of rendered audio files, shared across processes.
+
+    Entries are keyed by a score hash plus the options it was rendered with,
+    and indexed in an SQLite database alongside the files. Entries are
+    published atomically, by renaming a temporary file into place, and each
+    key can be locked across processes, so that concurrent renderers render
+    a score only once.
+
+    Once the cache holds more than ``max_size`` bytes or ``max_entries``
+    entries, the least recently used entries are evicted.
+
+    ::
+
+        >>> import supriya.nonrealtime
+        >>> render_cache = supriya.nonrealtime.RenderCache(max_size=2 ** 30)
+        >>> session = supriya.nonrealtime.Session()
+        >>> session.render(render_cache=render_cache)  # doctest: +SKIP
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Session Internals"
+
+    __slots__ = ("_directory_path", "_max_entries", "_max_size")
+
+    ### INITIALIZER ###
+
+    def __init__(self, directory_path=None, max_size=None, max_entries=None):
+        if directory_path is None:
+            directory_path = pathlib.Path(supriya.output_path) / "render-cache"
+        self._directory_path = pathlib.Path(directory_path).expanduser().absolute()
+        self._max_size = int(max_size) if max_size is not None else None
+        self._max_entries = int(max_entries) if max_entries is not None else None
+        (self._directory_path / "entries").mkdir(parents=True, exist_ok=True)
+        (self._directory_path / "locks").mkdir(exist_ok=True)
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, "
+                "file_name TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "accessed REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS statistics ("
+                "name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        return "<{}: {}>".format(type(self).__name__, self.directory_path)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _copy(source_path, target_path):
+        # Always copy, never hard link, so that modifying a fetched or
+        # published file can't corrupt the entry, and evicting an entry frees
+        # its space. Rename into place so readers never see a partial file.
+        target_path = pathlib.Path(target_path)
+        partial_path = target_path.with_name(
+            "{}.{}.{}.partial".format(
+                target_path.name, os.getpid(), threading.get_ident()
+            )
+        )
+        shutil.copyfile(str(source_path), str(partial_path))
+        os.replace(str(partial_path), str(target_path))
+
+    def _count(self, connection, name, amount=1):
+        connection.execute(
+            "INSERT INTO statistics (name, value) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def _evict(self, protected_key):
+        with self._transaction() as connection:
+            entry_count, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            rows = connection.execute(
+                "SELECT key, file_name, size FROM entries ORDER BY accessed"
+            ).fetchall()
+            for key, file_name, entry_size in rows:
+                if not self._is_over_capacity(entry_count, size):
+                    break
+                if key == protected_key:
+                    continue
+                # Entries locked by a renderer are in use, so skip them
+                with self.lock(key, blocking=False) as is_locked:
+                    if not is_locked:
+                        continue
+                    with contextlib.suppress(FileNotFoundError):
+                        (self._directory_path / "entries" / file_name).unlink()
+                    with contextlib.suppress(FileNotFoundError):
+                        self._get_lock_path(key).unlink()
+                    connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._count(connection, "evictions")
+                entry_count -= 1
+                size -= entry_size
+
+    def _get_lock_path(self, key):
+        return self._directory_path / "locks" / "{}.lock".format(key)
+
+    def _is_over_capacity(self, entry_count, size):
+        if self.max_entries is not None and self.max_entries < entry_count:
+            return True
+        if self.max_size is not None and self.max_size < size:
+            return True
+        return False
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        connection = sqlite3.connect(
+            str(self._directory_path / "index.sqlite3"), timeout=60
+        )
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    def build_key(score_hash, **options):
+        """
+        Builds a cache key from ``score_hash`` and render ``options``.
+        """
+        md5 = hashlib.md5()
+        md5.update(str(score_hash).encode())
+        for name, value in sorted(options.items()):
+            md5.update("{}={!r}".format(name, value).encode())
+        return md5.hexdigest()
+
+    def clear(self):
+        """
+        Removes every entry, keeping the statistics.
+        """
+        with self._transaction() as connection:
+            rows = connection.execute("SELECT key, file_name FROM entries").fetchall()
+        for key, file_name in rows:
+            with self.lock(key), self._transaction() as connection:
+                with contextlib.suppress(FileNotFoundError):
+                    (self._directory_path / "entries" / file_name).unlink()
+                with contextlib.suppress(FileNotFoundError):
+                    self._get_lock_path(key).unlink()
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def fetch(self, key, output_file_path):
+        """
+        Copies the file cached under ``key`` to ``output_file_path``.
+
+        Returns true on a hit and false on a miss.
+        """
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT file_name FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        is_hit = False
+        if row is not None:
+            try:
+                self._copy(self._directory_path / "entries" / row[0], output_file_path)
+                is_hit = True
+            except FileNotFoundError:
+                pass
+        with self._transaction() as connection:
+            if is_hit:
+                connection.execute(
+                    "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+                )
+            elif row is not None:
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._count(connection, "hits" if is_hit else "misses")
+        return is_hit
+
+    @contextlib.contextmanager
+    def lock(self, key, blocking=True):
+        """
+        Locks ``key`` across threads and processes.
+
+        Yields whether the lock was acquired, which is always true when
+        ``blocking``.
+        """
+        # Each lock opens its own file description, so flock() excludes
+        # other threads as well as other processes. Evicting an entry unlinks
+        # its lock file while locked, so retry until the locked file is still
+        # the one in place.
+        lock_path = self._get_lock_path(key)
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        while True:
+            with open(str(lock_path), "a+b") as file_pointer:
+                try:
+                    fcntl.flock(file_pointer.fileno(), flags)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    try:
+                        is_current = os.path.samestat(
+                            os.fstat(file_pointer.fileno()), os.stat(str(lock_path))
+                        )
+                    except FileNotFoundError:
+                        is_current = False
+                    if is_current:
+                        yield True
+                        return
+                finally:
+                    fcntl.flock(file_pointer.fileno(), fcntl.LOCK_UN)
+
+    def publish(self, key, file_path):
+        """
+        Caches a copy of ``file_path`` under ``key``, evicting the least
+        recently used entries if the cache is over capacity.
+        """
+        file_path = pathlib.Path(file_path)
+        file_name = key + file_path.suffix
+        self._copy(file_path, self._directory_path / "entries" / file_name)
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, file_name, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, file_name, file_path.stat().st_size, time.time()),
+            )
+        self._evict(key)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self):
+        return self._directory_path
+
+    @property
+    def max_entries(self):
+        return self._max_entries
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def statistics(self):
+        with self._transaction() as connection:
+            counts = dict(
+                connection.execute("SELECT name, value FROM statistics").fetchall()
+            )
+            entry_count, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return RenderCacheStatistics(
+            hits=counts.get("hits", 0),
+            misses=counts.get("misses", 0),
+            evictions=counts.get("evictions", 0),
+            entry_count=entry_count,
+            size=size,
+        )
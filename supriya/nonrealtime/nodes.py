@@ -86,6 +86,7 @@ class Node(SessionObject):
         self.move_node(node, add_action=add_action)
         self.session.nodes.add(node)
         self.session._nodes_by_session_id[node.session_id] = node
+        self.session._mark_dirty(node.start_offset, node.stop_offset, ids=True)
         self.session._apply_transitions([node.start_offset, node.stop_offset])
         return node
 
@@ -116,6 +117,8 @@ class Node(SessionObject):
         self.session.nodes.remove(self)
         self._duration = new_duration
         self.session.nodes.add(self)
+        # The start offset's request carries the node's duration
+        self.session._mark_dirty(self.start_offset)
         with self.session.at(self.stop_offset, propagate=False) as moment:
             moment.state.stop_nodes.add(self)
 
@@ -135,6 +138,8 @@ class Node(SessionObject):
             right_events.setdefault(name, []).insert(0, event)
         self._events = left_events
         new_node._events = right_events
+        for events in right_events.values():
+            self.session._mark_dirty(*(offset for offset, _ in events))
 
     def _fixup_node_actions(
         self, new_node: "Node", start_offset: "float", stop_offset: "float"
@@ -147,11 +152,13 @@ class Node(SessionObject):
             transitions = self.session.states[offset].transitions
             if self in transitions:
                 transitions[new_node] = transitions.pop(self)
+                self.session._mark_dirty(offset)
             for node, action in transitions.items():
                 if node is new_node:
                     continue
                 if action.target is self:
                     action._target = new_node
+                    self.session._mark_dirty(offset)
 
     def _get_at_offset(
         self, offset: float, item: str
@@ -186,6 +193,7 @@ class Node(SessionObject):
         """
         if offset < self.start_offset or self.stop_offset <= offset:
             return
+        self.session._mark_dirty(offset)
         events = self._events.setdefault(item, [])
         new_event = (offset, value)
         if not events:
@@ -369,10 +377,12 @@ class Node(SessionObject):
             state_two._transitions = state_two._rebuild_transitions(
                 state_one, state_two
             )
+            self.session._mark_dirty(state_two.offset)
             if state_two == self.stop_offset:
                 break
         self.session.nodes.remove(self)
         self.session._nodes_by_session_id.pop(self.session_id)
+        self.session._mark_dirty(self.start_offset, self.stop_offset, ids=True)
         self.session._apply_transitions([self.start_offset, self.stop_offset])
 
     @SessionObject.require_offset
@@ -1,8 +1,15 @@
+import bisect
+import concurrent.futures
+import contextlib
 import hashlib
+import os
 import pathlib
 import shutil
 import struct
 import subprocess
+import tempfile
+import threading
+from typing import NamedTuple
 
 import tqdm  # type: ignore
 import uqbar.containers
@@ -11,17 +18,54 @@ import yaml
 from uqbar.objects import new
 
 import supriya
+import supriya.osc
 import supriya.realtime
 import supriya.soundfiles
 import supriya.system
 from supriya import HeaderFormat, SampleFormat, scsynth
 from supriya.exceptions import NonrealtimeOutputMissing, NonrealtimeRenderError
+from supriya.nonrealtime.cache import RenderCache
 from supriya.system import SupriyaObject
 
 
+class SessionSegment(NamedTuple):
+    """
+    A segment of a non-realtime session, rendered on its own.
+
+    The segment's score starts at ``warm_up_offset``, recreating everything
+    the session started earlier, and stops at ``stop_offset``. Its audio is
+    used from ``start_offset`` on.
+    """
+
+    session: "supriya.nonrealtime.Session"
+    start_offset: float
+    stop_offset: float
+    warm_up_offset: float
+
+    @property
+    def duration(self):
+        return self.stop_offset - self.warm_up_offset
+
+
 class SessionRenderer(SupriyaObject):
     """
     Renders non-realtime sessions as audio files.
+
+    Sessions and other renderables in the dependency graph are rendered as
+    soon as everything they depend on has rendered, up to ``max_workers`` at
+    a time, each in its own scsynth process.
+
+    With ``segment_offsets``, the session is split at those offsets (or, when
+    given a count, into that many segments split at its own offsets nearest
+    to equal divisions). Each segment renders separately, starting
+    ``pre_roll`` seconds early to let its recreated nodes warm up, and the
+    segments are joined into the output, crossfading over ``crossfade``
+    seconds. Segments are cached like sessions, so an edit only re-renders
+    the segments whose scores it changes.
+
+    With a ``render_cache`` (a ``RenderCache`` or its directory), sessions
+    and segments are restored from the cache when it holds their score
+    rendered with the same options, and published to it once rendered.
     """
 
     ### CLASS VARIABLES ###
@@ -30,14 +74,21 @@ class SessionRenderer(SupriyaObject):
 
     __slots__ = (
         "_compiled_sessions",
+        "_crossfade",
         "_header_format",
+        "_max_workers",
+        "_pre_roll",
         "_prerender_tuples",
         "_print_transcript",
+        "_render_cache",
         "_render_directory_path",
+        "_render_locks",
         "_sample_format",
         "_sample_rate",
+        "_segment_offsets",
         "_session",
         "_session_input_paths",
+        "_session_segments",
         "_renderable_prefixes",
         "_transcript",
         "_transcript_prefix",
@@ -56,11 +107,18 @@ class SessionRenderer(SupriyaObject):
         sample_format=SampleFormat.INT24,
         sample_rate=44100,
         transcript_prefix=None,
+        max_workers=1,
+        segment_offsets=None,
+        pre_roll=0.0,
+        crossfade=0.0,
+        render_cache=None,
     ):
         self._session = session
 
         self._header_format = HeaderFormat.from_expr(header_format)
 
+        self._max_workers = max(int(max_workers or 1), 1)
+
         if print_transcript:
             print_transcript = bool(print_transcript)
         self._print_transcript = print_transcript
@@ -80,25 +138,36 @@ class SessionRenderer(SupriyaObject):
             transcript_prefix = str(transcript_prefix)
         self._transcript_prefix = transcript_prefix
 
+        if segment_offsets is not None and not isinstance(segment_offsets, int):
+            segment_offsets = tuple(float(offset) for offset in segment_offsets)
+        self._segment_offsets = segment_offsets or None
+        if self._segment_offsets and (
+            self._header_format not in (HeaderFormat.AIFF, HeaderFormat.WAV)
+            or self._sample_format
+            not in (SampleFormat.INT16, SampleFormat.INT24, SampleFormat.INT32)
+        ):
+            raise ValueError("Segments can only be joined as integer AIFF or WAV")
+
+        self._pre_roll = float(pre_roll or 0.0)
+        if self._pre_roll < 0:
+            raise ValueError(pre_roll)
+
+        self._crossfade = float(crossfade or 0.0)
+        if self._crossfade < 0:
+            raise ValueError(crossfade)
+
+        if render_cache is not None and not isinstance(render_cache, RenderCache):
+            render_cache = RenderCache(render_cache)
+        self._render_cache = render_cache
+
         self._reset()
 
     ### PRIVATE METHODS ###
 
-    def _build_datagram(self, osc_bundles):
-        datagrams = []
-        for osc_bundle in osc_bundles:
-            datagram = osc_bundle.to_datagram(realtime=False)
-            size = len(datagram)
-            size = struct.pack(">i", size)
-            datagrams.append(size)
-            datagrams.append(datagram)
-        datagram = b"".join(datagrams)
-        return datagram
-
-    def _build_file_path(self, datagram, input_file_path, session):
-        # print('BUILDING FILE PATH')
+    def _build_file_path(self, datagrams, input_file_path, session):
         md5 = hashlib.md5()
-        md5.update(datagram)
+        for datagram in datagrams:
+            md5.update(datagram)
         hash_values = []
         if input_file_path is not None:
             hash_values.append(input_file_path)
@@ -158,56 +227,82 @@ class SessionRenderer(SupriyaObject):
         render_yaml = yaml.dump(render_data, default_flow_style=False, indent=4)
         return render_yaml
 
-    def _build_xrefd_bundles(self, osc_bundles):
+    def _build_segments(self, session, duration=None, stream=False):
+        duration = duration or session.duration
+        split_offsets = self.segment_offsets
+        if isinstance(split_offsets, int):
+            split_offsets = self._find_split_offsets(session, duration, split_offsets)
+        split_offsets = sorted(set(x for x in split_offsets if 0 < x < duration))
+        if not split_offsets:
+            return
+        if session.input_:
+            # The input would not line up with any but the first segment
+            raise ValueError("Cannot segment a session with an input")
+        block_size = session.options.block_size
+        dependencies = self.dependency_graph.children(session)
+        segments = []
+        for start_offset, stop_offset in zip(
+            [0.0] + split_offsets, split_offsets + [duration]
+        ):
+            # Warm up from a block boundary, so that the segment's control
+            # blocks fall on the same samples as the session's.
+            warm_up_frame = int(max(start_offset - self.pre_roll, 0) * self.sample_rate)
+            warm_up_frame -= warm_up_frame % block_size
+            segment = SessionSegment(
+                session=session,
+                start_offset=start_offset,
+                stop_offset=min(stop_offset + self.crossfade, duration),
+                warm_up_offset=warm_up_frame / self.sample_rate,
+            )
+            request_bundles = session._iterate_non_xrefd_request_bundles(
+                duration,
+                start_offset=segment.warm_up_offset,
+                stop_offset=segment.stop_offset,
+                retain_datagrams=not stream,
+            )
+            renderable_prefix, score = self._compile_score(
+                self._iterate_xrefd_bundles(request_bundles, session, stream=stream),
+                None,
+                session,
+                stream=stream,
+            )
+            self.compiled_sessions[segment] = None, score
+            self.renderable_prefixes[segment] = renderable_prefix
+            for dependency in dependencies:
+                self.dependency_graph.add(dependency, parent=segment)
+            segments.append(segment)
+        for segment in segments:
+            self.dependency_graph.add(segment, parent=session)
+        self.session_segments[session] = segments
+
+    def _build_xrefd_bundle(self, osc_bundle):
+        # Sessions compile their bundles once and reuse them, so copy any
+        # bundle whose messages need rewriting rather than modifying it.
         extension = ".{}".format(self.header_format.name.lower())
-        for osc_bundle in osc_bundles:
-            for osc_message in osc_bundle.contents:
-                contents = list(osc_message.contents)
-                for i, x in enumerate(contents):
-                    x = self._sessionable_to_session(x)
-                    try:
-                        if x not in self.renderable_prefixes:
-                            continue
-                    except TypeError:
+        osc_messages, changed = [], False
+        for osc_message in osc_bundle.contents:
+            contents, xrefd = list(osc_message.contents), False
+            for i, x in enumerate(contents):
+                x = self._sessionable_to_session(x)
+                try:
+                    if x not in self.renderable_prefixes:
                         continue
-                    renderable_file_path = self.renderable_prefixes[x].with_suffix(
-                        extension
-                    )
-                    contents[i] = str(renderable_file_path)
-                osc_message.contents = tuple(contents)
-        return osc_bundles
-
-    def _build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-        self, expr, parent
-    ):
-        import supriya.nonrealtime
-
-        expr = self._sessionable_to_session(expr)
-        if isinstance(expr, supriya.nonrealtime.Session):
-            if expr not in self.dependency_graph:
-                self._build_dependency_graph_and_nonxrefd_osc_bundles(expr)
-            self.dependency_graph.add(expr, parent=parent)
-        elif hasattr(expr, "__render__"):
-            self.dependency_graph.add(expr, parent=parent)
-
-    def _build_dependency_graph_and_nonxrefd_osc_bundles(self, session, duration=None):
-        input_ = session.input_
-        if isinstance(input_, str):
-            input_ = pathlib.Path(input_)
-        input_ = self._sessionable_to_session(input_)
-        non_xrefd_bundles = session._to_non_xrefd_osc_bundles(duration)
-        self.compiled_sessions[session] = input_, non_xrefd_bundles
-        if session is self.session:
-            self.dependency_graph.add(session)
-        self._build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-            input_, session
-        )
-        for non_xrefd_bundle in non_xrefd_bundles:
-            for request in non_xrefd_bundle.contents:
-                for x in request.contents:
-                    self._build_dependency_graph_and_nonxrefd_osc_bundles_conditionally(
-                        x, session
-                    )
+                except TypeError:
+                    continue
+                renderable_file_path = self.renderable_prefixes[x].with_suffix(
+                    extension
+                )
+                contents[i] = str(renderable_file_path)
+                xrefd = True
+            if xrefd:
+                osc_message = supriya.osc.OscMessage(osc_message.address, *contents)
+                changed = True
+            osc_messages.append(osc_message)
+        if changed:
+            osc_bundle = supriya.osc.OscBundle(
+                timestamp=osc_bundle.timestamp, contents=osc_messages
+            )
+        return osc_bundle
 
     def _call_subprocess(self, command):
         return subprocess.call(command, shell=True)
@@ -245,34 +340,74 @@ class SessionRenderer(SupriyaObject):
                         return -6
         return process.poll()
 
-    def _collect_prerender_tuples(self, session, duration=None):
+    def _collect_prerender_tuples(self, session, duration=None, stream=False):
         import supriya.nonrealtime
 
-        self._build_dependency_graph_and_nonxrefd_osc_bundles(
-            session, duration=duration
-        )
+        self._reset_prerender_tuples()
+        self._compile_session(session, duration=duration, stream=stream)
         assert self.dependency_graph.is_acyclic()
-        extension = ".{}".format(self.header_format.name.lower())
         for renderable in self.dependency_graph:
-            if isinstance(renderable, supriya.nonrealtime.Session):
-                result = self._collect_session_prerender_tuple(renderable, extension)
-                prerender_tuple, renderable_prefix = result
-            else:
-                result = self._collect_renderable_prerender_tuple(renderable)
-                prerender_tuple, renderable_prefix = result
+            prerender_tuple = (renderable,)
+            if isinstance(renderable, (supriya.nonrealtime.Session, SessionSegment)):
+                prerender_tuple += self.compiled_sessions[renderable]
             self.prerender_tuples.append(prerender_tuple)
-            self.renderable_prefixes[renderable] = renderable_prefix
         return self.prerender_tuples
 
-    def _collect_renderable_prerender_tuple(self, renderable):
-        renderable_prefix = renderable._build_file_path().with_suffix("")
-        return (renderable,), renderable_prefix
+    def _compile_renderable_conditionally(self, expr, parent, stream=False):
+        import supriya.nonrealtime
 
-    def _collect_session_prerender_tuple(self, session, extension):
-        input_, non_xrefd_bundles = self.compiled_sessions[session]
-        osc_bundles = self._build_xrefd_bundles(non_xrefd_bundles)
+        expr = self._sessionable_to_session(expr)
+        if isinstance(expr, supriya.nonrealtime.Session):
+            if expr not in self.dependency_graph:
+                self._compile_session(expr, stream=stream)
+            self.dependency_graph.add(expr, parent=parent)
+        elif hasattr(expr, "__render__"):
+            self.dependency_graph.add(expr, parent=parent)
+            self.renderable_prefixes[expr] = expr._build_file_path().with_suffix("")
+
+    def _compile_score(self, osc_bundles, input_file_path, session, stream=False):
+        # Hashed as it is compiled. Streamed scores are spooled into a
+        # temporary file in the same pass, instead of being kept as bundles,
+        # and moved into place once their renderable is rendered.
+        if not stream:
+            osc_bundles = list(osc_bundles)
+            file_path = self._build_file_path(
+                self._iterate_datagrams(osc_bundles, session), input_file_path, session
+            )
+            return file_path.with_suffix(""), osc_bundles
+        file_pointer = tempfile.NamedTemporaryFile(
+            dir=str(self.render_directory_path),
+            prefix="session-",
+            suffix=".partial.osc",
+            delete=False,
+        )
+        try:
+            with file_pointer:
+                file_path = self._build_file_path(
+                    self._spool_datagrams(
+                        self._iterate_datagrams(osc_bundles, session), file_pointer
+                    ),
+                    input_file_path,
+                    session,
+                )
+        except BaseException:
+            os.remove(file_pointer.name)
+            raise
+        return file_path.with_suffix(""), pathlib.Path(file_pointer.name)
+
+    def _compile_session(self, session, duration=None, stream=False):
+        # Its input and any sessions its bundles refer to are compiled first,
+        # as the bundles are cross-referenced with their file paths.
+        input_ = session.input_
+        if isinstance(input_, str):
+            input_ = pathlib.Path(input_)
+        input_ = self._sessionable_to_session(input_)
+        if session is self.session:
+            self.dependency_graph.add(session)
+        self._compile_renderable_conditionally(input_, session, stream=stream)
         input_file_path = input_
         if input_ and input_ in self.renderable_prefixes:
+            extension = ".{}".format(self.header_format.name.lower())
             input_file_path = self.renderable_prefixes[input_]
             input_file_path = input_file_path.with_suffix(extension)
         if input_file_path:
@@ -280,11 +415,73 @@ class SessionRenderer(SupriyaObject):
                 input_file_path, self.render_directory_path
             )
             self.session_input_paths[session] = input_file_path
-        datagram = self._build_datagram(osc_bundles)
-        renderable_prefix = self._build_file_path(
-            datagram, input_file_path, session
-        ).with_suffix("")
-        return (session, datagram, input_, osc_bundles), renderable_prefix
+        request_bundles = session._iterate_non_xrefd_request_bundles(
+            duration, retain_datagrams=not stream
+        )
+        renderable_prefix, score = self._compile_score(
+            self._iterate_xrefd_bundles(request_bundles, session, stream=stream),
+            input_file_path,
+            session,
+            stream=stream,
+        )
+        self.compiled_sessions[session] = input_, score
+        self.renderable_prefixes[session] = renderable_prefix
+        if session is self.session and self.segment_offsets:
+            self._build_segments(session, duration=duration, stream=stream)
+        if session in self.session_segments:
+            # Joined from its segments' audio, rather than rendered from
+            # the datagram.
+            md5 = hashlib.md5()
+            for segment in self.session_segments[session]:
+                md5.update(self.renderable_prefixes[segment].name.encode())
+                md5.update(str(segment[1:]).encode())
+            md5.update(str(self.crossfade).encode())
+            renderable_prefix = pathlib.Path("session-{}".format(md5.hexdigest()))
+            self.renderable_prefixes[session] = renderable_prefix
+
+    def _find_split_offsets(self, session, duration, segment_count):
+        # The session's own offsets nearest to equal divisions of its duration
+        offsets = [offset for offset in session.offsets if 0 < offset < duration]
+        split_offsets = set()
+        for i in range(1, segment_count):
+            target_offset = duration * i / segment_count
+            index = bisect.bisect_left(offsets, target_offset)
+            candidates = offsets[max(index - 1, 0) : index + 1]
+            if candidates:
+                split_offsets.add(min(candidates, key=lambda x: abs(x - target_offset)))
+        return sorted(split_offsets)
+
+    def _get_relative_path(self, file_path):
+        cwd = pathlib.Path.cwd()
+        if file_path.is_absolute() and cwd in file_path.parents:
+            return file_path.relative_to(cwd)
+        return file_path
+
+    def _discard_spooled_scores(self):
+        # Those not moved into place, e.g. restored from the render cache
+        for _, score in self.compiled_sessions.values():
+            if isinstance(score, pathlib.Path):
+                with contextlib.suppress(FileNotFoundError):
+                    score.unlink()
+
+    def _iterate_datagrams(self, osc_bundles, session=None):
+        # Length-prefixed bundle datagrams, as laid out in an .osc score file
+        for osc_bundle in osc_bundles:
+            datagram = None
+            if session is not None:
+                datagram = session._get_compiled_datagram(osc_bundle)
+            if datagram is None:
+                datagram = osc_bundle.to_datagram(realtime=False)
+            yield struct.pack(">i", len(datagram))
+            yield datagram
+
+    def _iterate_xrefd_bundles(self, request_bundles, session, stream=False):
+        for request_bundle in request_bundles:
+            osc_bundle = request_bundle.to_osc()
+            for osc_message in osc_bundle.contents:
+                for x in osc_message.contents:
+                    self._compile_renderable_conditionally(x, session, stream=stream)
+            yield self._build_xrefd_bundle(osc_bundle)
 
     def _render_datagram(
         self,
@@ -293,6 +490,7 @@ class SessionRenderer(SupriyaObject):
         output_file_path,
         session_osc_file_path,
         scsynth_path=None,
+        duration=None,
         **kwargs,
     ):
         relative_session_osc_file_path = session_osc_file_path
@@ -321,14 +519,14 @@ class SessionRenderer(SupriyaObject):
             )
             self._report("    Command: {}".format(command))
             try:
-                exit_code = self._stream_subprocess(command, session.duration)
+                exit_code = self._stream_subprocess(
+                    command, duration or session.duration
+                )
             except KeyboardInterrupt:
                 if output_file_path.exists():
                     output_file_path.unlink()
                 raise
-            server_options = new(
-                server_options, memory_size=memory_size * (2 ** factor)
-            )
+            server_options = new(server_options, memory_size=memory_size * (2**factor))
             if exit_code == -6:
                 self._report(
                     "    Out of memory. Increasing to {}.".format(
@@ -344,6 +542,109 @@ class SessionRenderer(SupriyaObject):
                 break
         return exit_code
 
+    def _render_prerender_tuple(self, prerender_tuple, scsynth_path=None, **kwargs):
+        import supriya.nonrealtime
+
+        extension = ".{}".format(self.header_format.name.lower())
+        renderable = prerender_tuple[0]
+        renderable_prefix = self.renderable_prefixes[renderable]
+        output_file_path = renderable_prefix.with_suffix(extension)
+        if renderable in self.session_segments:
+            self._stitch_segments(renderable, output_file_path)
+            return 0
+        if not isinstance(renderable, (supriya.nonrealtime.Session, SessionSegment)):
+            renderable.__render__(
+                output_file_path=output_file_path,
+                print_transcript=self.print_transcript,
+            )
+            return 0
+        _, input_, spooled_file_path = prerender_tuple
+        session = renderable
+        if isinstance(renderable, SessionSegment):
+            session = renderable.session
+        osc_file_path = renderable_prefix.with_suffix(".osc")
+        input_file_path = self.session_input_paths.get(renderable)
+        # Identical renderables share their files, so render them one at a
+        # time, skipping all but the first. The render cache's lock extends
+        # that to other renderers, in this process or others.
+        with contextlib.ExitStack() as exit_stack:
+            exit_stack.enter_context(
+                self._render_locks.setdefault(renderable_prefix, threading.Lock())
+            )
+            cache_key = None
+            if self.render_cache is not None:
+                # Key on the effective options, as sessions with different
+                # options can still share a score hash.
+                cache_key = self.render_cache.build_key(
+                    renderable_prefix.name, options=new(session._options, **kwargs)
+                )
+                exit_stack.enter_context(self.render_cache.lock(cache_key))
+                if self.render_cache.fetch(cache_key, output_file_path):
+                    self._report(
+                        "Restored {} from render cache.".format(output_file_path)
+                    )
+                    return 0
+            self._write_datagram(osc_file_path, spooled_file_path)
+            exit_code = self._render_datagram(
+                session,
+                input_file_path,
+                output_file_path,
+                osc_file_path,
+                scsynth_path=scsynth_path,
+                duration=renderable.duration,
+                **kwargs,
+            )
+            if cache_key is not None and not exit_code:
+                self.render_cache.publish(cache_key, output_file_path)
+        if exit_code:
+            self._report("    SuperCollider errored!")
+            raise NonrealtimeRenderError(exit_code)
+        return exit_code
+
+    def _render_prerender_tuples_concurrently(self, scsynth_path=None, **kwargs):
+        # Renderables wait on their children in the dependency graph, i.e.
+        # their inputs, and are submitted in prerender order once those
+        # have all rendered.
+        waiting = {
+            prerender_tuple[0]: (
+                prerender_tuple,
+                set(self.dependency_graph.children(prerender_tuple[0])),
+            )
+            for prerender_tuple in self.prerender_tuples
+        }
+        exit_codes = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            futures = {}
+            while waiting or futures:
+                for renderable, (prerender_tuple, children) in tuple(waiting.items()):
+                    if children:
+                        continue
+                    del waiting[renderable]
+                    future = executor.submit(
+                        self._render_prerender_tuple,
+                        prerender_tuple,
+                        scsynth_path=scsynth_path,
+                        **kwargs,
+                    )
+                    futures[future] = renderable
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    renderable = futures.pop(future)
+                    try:
+                        exit_codes[renderable] = future.result()
+                    except BaseException:
+                        for pending_future in futures:
+                            pending_future.cancel()
+                        raise
+                    for parent in self.dependency_graph.parents(renderable):
+                        if parent in waiting:
+                            waiting[parent][1].discard(renderable)
+        return exit_codes[self.prerender_tuples[-1][0]]
+
     def _read(self, file_path, mode=""):
         try:
             with open(str(file_path), "r" + mode) as file_pointer:
@@ -359,13 +660,19 @@ class SessionRenderer(SupriyaObject):
         self.transcript.append(message)
 
     def _reset(self):
+        self._session._transcript = self._transcript = []
+        self._render_locks = {}
+        self._sessionables_to_sessions = {}
+        self._reset_prerender_tuples()
+
+    def _reset_prerender_tuples(self):
+        # Recollected from scratch, as streamed scores are spooled only once
         self._compiled_sessions = {}
         self._prerender_tuples = []
-        self._session._transcript = self._transcript = []
         self._renderable_prefixes = {}
         self._dependency_graph = uqbar.containers.DependencyGraph()
         self._session_input_paths = {}
-        self._sessionables_to_sessions = {}
+        self._session_segments = {}
 
     def _sessionable_to_session(self, expr):
         if hasattr(expr, "__session__"):
@@ -374,17 +681,72 @@ class SessionRenderer(SupriyaObject):
             return self._sessionables_to_sessions[expr]
         return expr
 
-    def _write_datagram(self, file_path, new_contents):
-        self._write(file_path, new_contents, mode="b")
+    def _spool_datagrams(self, datagrams, file_pointer):
+        for datagram in datagrams:
+            file_pointer.write(datagram)
+            yield datagram
+
+    def _stitch_segments(self, session, output_file_path):
+        self._report("Joining {}.".format(output_file_path))
+        if output_file_path.exists():
+            self._report(
+                "    Skipped {}. Output already exists.".format(output_file_path)
+            )
+            return
+        extension = ".{}".format(self.header_format.name.lower())
+        segments = self.session_segments[session]
+        regions = []
+        for i, segment in enumerate(segments):
+            start_frame = round(segment.start_offset * self.sample_rate)
+            frame_count = None
+            if i < len(segments) - 1:
+                next_start_offset = segments[i + 1].start_offset
+                frame_count = round(next_start_offset * self.sample_rate) - start_frame
+            regions.append(
+                (
+                    self.renderable_prefixes[segment].with_suffix(extension),
+                    start_frame - round(segment.warm_up_offset * self.sample_rate),
+                    frame_count,
+                )
+            )
+        # Join into a temporary file first, so that an interrupted join never
+        # leaves a truncated output to be mistaken for a finished one.
+        partial_file_path = output_file_path.with_suffix(".partial" + extension)
+        supriya.soundfiles.join_soundfiles(
+            partial_file_path,
+            regions,
+            crossfade_frame_count=round(self.crossfade * self.sample_rate),
+        )
+        os.replace(str(partial_file_path), str(output_file_path))
+        self._report(
+            "    Joined {} segments into {}.".format(len(segments), output_file_path)
+        )
+
+    def _write_datagram(self, file_path, spooled_file_path):
+        # Moves the score spooled while hashing into place. Scores are named
+        # after their hash and only ever renamed into place, so an existing
+        # file of the same size already holds the score.
+        relative_file_path = self._get_relative_path(file_path)
+        self._report("Writing {}.".format(relative_file_path))
+        try:
+            is_unchanged = os.path.getsize(str(file_path)) == os.path.getsize(
+                str(spooled_file_path)
+            )
+        except FileNotFoundError:
+            is_unchanged = False
+        if is_unchanged:
+            self._report(
+                "    Skipped {}. File already exists.".format(relative_file_path)
+            )
+            return
+        os.replace(str(spooled_file_path), str(file_path))
+        self._report("    Wrote {}.".format(relative_file_path))
 
     def _write_render_yml(self, file_path, render_yaml):
         self._write(file_path, render_yaml)
 
     def _write(self, file_path, new_contents, mode=""):
-        cwd = pathlib.Path.cwd()
-        relative_file_path = file_path
-        if file_path.is_absolute() and cwd in file_path.parents:
-            relative_file_path = file_path.relative_to(cwd)
+        relative_file_path = self._get_relative_path(file_path)
         self._report("Writing {}.".format(relative_file_path))
         old_contents = self._read(file_path, mode=mode)
         if old_contents == new_contents:
@@ -404,7 +766,7 @@ class SessionRenderer(SupriyaObject):
 
     def to_osc_bundles(self, duration=None):
         self._collect_prerender_tuples(self.session, duration=duration)
-        (session, datagram, input_file_path, osc_bundles) = self.prerender_tuples[-1]
+        session, input_file_path, osc_bundles = self.prerender_tuples[-1]
         return osc_bundles
 
     @classmethod
@@ -437,45 +799,32 @@ class SessionRenderer(SupriyaObject):
         scsynth_path=None,
         **kwargs,
     ):
-        import supriya.nonrealtime
-
         extension = ".{}".format(self.header_format.name.lower())
         if output_file_path is not None:
             output_file_path = pathlib.Path(output_file_path)
             output_file_path = output_file_path.expanduser().absolute()
         original_output_file_path = output_file_path
-        self._collect_prerender_tuples(self.session, duration=duration)
-        assert self.prerender_tuples, self.prerender_tuples
-        visited_renderable_prefixes = []
-        with uqbar.io.DirectoryChange(directory=str(self.render_directory_path)):
-            for prerender_tuple in self.prerender_tuples:
-                renderable = prerender_tuple[0]
-                renderable_prefix = self.renderable_prefixes[renderable]
-                visited_renderable_prefixes.append(
-                    renderable_prefix.with_suffix("").name
-                )
-                output_file_path = renderable_prefix.with_suffix(extension)
-                if isinstance(renderable, supriya.nonrealtime.Session):
-                    (session, datagram, input_, _) = prerender_tuple
-                    osc_file_path = renderable_prefix.with_suffix(".osc")
-                    input_file_path = self.session_input_paths.get(session)
-                    self._write_datagram(osc_file_path, datagram)
-                    exit_code = self._render_datagram(
-                        session,
-                        input_file_path,
-                        output_file_path,
-                        osc_file_path,
-                        scsynth_path=scsynth_path,
-                        **kwargs,
-                    )
-                    if exit_code:
-                        self._report("    SuperCollider errored!")
-                        raise NonrealtimeRenderError(exit_code)
+        try:
+            self._collect_prerender_tuples(self.session, duration=duration, stream=True)
+            assert self.prerender_tuples, self.prerender_tuples
+            visited_renderable_prefixes = [
+                self.renderable_prefixes[prerender_tuple[0]].with_suffix("").name
+                for prerender_tuple in self.prerender_tuples
+            ]
+            with uqbar.io.DirectoryChange(directory=str(self.render_directory_path)):
+                if self.max_workers == 1:
+                    for prerender_tuple in self.prerender_tuples:
+                        exit_code = self._render_prerender_tuple(
+                            prerender_tuple, scsynth_path=scsynth_path, **kwargs
+                        )
                 else:
-                    renderable.__render__(
-                        output_file_path=output_file_path,
-                        print_transcript=self.print_transcript,
+                    exit_code = self._render_prerender_tuples_concurrently(
+                        scsynth_path=scsynth_path, **kwargs
                     )
+        finally:
+            self._discard_spooled_scores()
+        renderable = self.prerender_tuples[-1][0]
+        output_file_path = self.renderable_prefixes[renderable].with_suffix(extension)
         output_file_path = self.render_directory_path / output_file_path
         if not output_file_path.exists():
             self._report("    Output file is missing!")
@@ -494,6 +843,10 @@ class SessionRenderer(SupriyaObject):
     def compiled_sessions(self):
         return self._compiled_sessions
 
+    @property
+    def crossfade(self):
+        return self._crossfade
+
     @property
     def dependency_graph(self):
         return self._dependency_graph
@@ -502,6 +855,14 @@ class SessionRenderer(SupriyaObject):
     def header_format(self):
         return self._header_format
 
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    @property
+    def pre_roll(self):
+        return self._pre_roll
+
     @property
     def prerender_tuples(self):
         return self._prerender_tuples
@@ -510,6 +871,10 @@ class SessionRenderer(SupriyaObject):
     def print_transcript(self):
         return self._print_transcript
 
+    @property
+    def render_cache(self):
+        return self._render_cache
+
     @property
     def render_directory_path(self):
         return self._render_directory_path
@@ -526,6 +891,10 @@ class SessionRenderer(SupriyaObject):
     def sample_rate(self):
         return self._sample_rate
 
+    @property
+    def segment_offsets(self):
+        return self._segment_offsets
+
     @property
     def session(self):
         return self._session
@@ -534,6 +903,10 @@ class SessionRenderer(SupriyaObject):
     def session_input_paths(self):
         return self._session_input_paths
 
+    @property
+    def session_segments(self):
+        return self._session_segments
+
     @property
     def transcript(self):
         return self._transcript
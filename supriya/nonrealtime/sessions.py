@@ -1,5 +1,6 @@
 import bisect
 import collections
+import itertools
 import os
 import pathlib
 from queue import PriorityQueue
@@ -138,6 +139,11 @@ class Session:
         self._buffers_by_seesion_id = {}
         self._buses = collections.OrderedDict()
         self._buses_by_session_id = {}
+        self._compiled_datagrams = {}
+        self._compiled_offsets = {}
+        self._compiled_settings = None
+        self._dirty_offsets = set()
+        self._dirty_settings = set()
         self._name = name
         self._nodes = supriya.intervals.IntervalTree(accelerated=True)
         self._nodes_by_session_id = {}
@@ -241,6 +247,7 @@ class Session:
         state = old_state._clone(offset)
         self.states[offset] = state
         self.offsets.insert(self.offsets.index(old_state.offset) + 1, offset)
+        self._mark_dirty(offset)
         return state
 
     def _apply_transitions(self, offsets, chain=True):
@@ -276,6 +283,7 @@ class Session:
             if nodes_to_children != state.nodes_to_children:
                 state._nodes_to_children = nodes_to_children
                 state._nodes_to_parents = nodes_to_parents
+                self._mark_node_tree_dirty(offset)
                 changed = True
             if changed and chain:
                 next_state = self._find_state_after(offset, with_node_tree=True)
@@ -529,6 +537,31 @@ class Session:
                 bus_settings.setdefault(offset, {})[bus_id] = value
         return bus_settings
 
+    def _collect_compilation_settings(self, duration):
+        # Rebuild only what the journal marked stale. Renumbered objects or a
+        # different duration invalidate every compiled offset.
+        old_duration, id_mapping, buffer_settings, bus_settings = (
+            self._compiled_settings or (None, None, None, None)
+        )
+        if id_mapping is None or "ids" in self._dirty_settings:
+            new_id_mapping = self._build_id_mapping()
+            if id_mapping is None or any(
+                new_id_mapping.get(key, value) != value
+                for key, value in id_mapping.items()
+            ):
+                self._discard_compiled_offset()
+                buffer_settings = bus_settings = None
+            id_mapping = new_id_mapping
+        if buffer_settings is None or "buffers" in self._dirty_settings:
+            buffer_settings = self._collect_buffer_settings(id_mapping)
+        if bus_settings is None or "buses" in self._dirty_settings:
+            bus_settings = self._collect_bus_settings(id_mapping)
+        if duration != old_duration:
+            self._discard_compiled_offset()
+        self._dirty_settings.clear()
+        self._compiled_settings = (duration, id_mapping, buffer_settings, bus_settings)
+        return id_mapping, buffer_settings, bus_settings
+
     def _collect_durated_objects(self, offset, is_last_offset):
         state = self._find_state_at(offset, clone_if_missing=True)
         start_buffers, start_nodes = state.start_buffers, state.start_nodes
@@ -551,7 +584,13 @@ class Session:
         )
 
     def _collect_node_action_requests(
-        self, duration, id_mapping, node_actions, node_settings, start_nodes
+        self,
+        duration,
+        id_mapping,
+        node_actions,
+        node_settings,
+        start_nodes,
+        offset=None,
     ):
         import supriya.nonrealtime
 
@@ -570,6 +609,9 @@ class Session:
                             duration < source.stop_offset
                         ):  # duration is session duration
                             node_duration = duration - source.start_offset
+                        if offset is not None and source.start_offset < offset:
+                            # warming up a segment, only the remainder is left
+                            node_duration -= offset - source.start_offset
                         synth_kwargs["duration"] = float(node_duration)
                     for key, value in synth_kwargs.items():
                         if (
@@ -752,6 +794,161 @@ class Session:
             requests.append(request)
         return requests
 
+    def _collect_warm_up_requests(
+        self,
+        buffer_open_states,
+        buffer_settings,
+        bus_settings,
+        duration,
+        id_mapping,
+        offset,
+        visited_synthdefs,
+    ):
+        # Recreate everything started before offset, as it stands just before
+        # offset: live buffers and their contents, the node tree and its
+        # latest settings, and the latest control bus values.
+        import supriya.nonrealtime
+
+        requests = []
+        start_buffers = set(
+            buffer_
+            for buffer_ in self.buffers
+            if buffer_.start_offset < offset <= buffer_.stop_offset
+        )
+        live_buffer_ids = set(id_mapping[buffer_] for buffer_ in start_buffers)
+        buffer_id_names = ("buffer_id", "source_buffer_id", "target_buffer_id")
+        warm_up_buffer_settings = {}
+        for buffer_offset, settings in buffer_settings.items():
+            if offset <= buffer_offset:
+                continue
+            for request_type, buffer_requests in settings.items():
+                buffer_requests = [
+                    request
+                    for request in buffer_requests
+                    if all(
+                        getattr(request, name) in live_buffer_ids
+                        for name in buffer_id_names
+                        if hasattr(request, name)
+                    )
+                ]
+                if buffer_requests:
+                    warm_up_buffer_settings.setdefault(buffer_offset, {})[
+                        request_type
+                    ] = buffer_requests
+        state = self._find_state_before(offset, with_node_tree=True)
+        node_actions = collections.OrderedDict()
+        for parent, child in state._iterate_node_pairs(
+            self.root_node, state.nodes_to_children
+        ):
+            node_actions[child] = supriya.nonrealtime.NodeTransition(
+                source=child, action=supriya.AddAction.ADD_TO_TAIL, target=parent
+            )
+        node_settings = collections.OrderedDict()
+        for node in state._iterate_nodes(self.root_node, state.nodes_to_children):
+            settings = node._collect_settings(
+                offset, id_mapping=id_mapping, persistent=True
+            )
+            if settings:
+                node_settings[node] = settings
+        start_nodes = set(node_actions)
+        bus_values = {}
+        for bus_offset in sorted(bus_settings):
+            if offset <= bus_offset:
+                break
+            bus_values.update(bus_settings[bus_offset])
+        requests += self._collect_synthdef_requests(start_nodes, visited_synthdefs)
+        requests += self._collect_buffer_allocate_requests(
+            buffer_open_states, id_mapping, start_buffers
+        )
+        for buffer_offset in sorted(warm_up_buffer_settings):
+            requests += self._collect_buffer_nonlifecycle_requests(
+                start_buffers,
+                buffer_open_states,
+                warm_up_buffer_settings,
+                id_mapping,
+                buffer_offset,
+                self._ordered_buffer_post_alloc_request_types,
+            )
+        requests += self._collect_node_action_requests(
+            duration, id_mapping, node_actions, node_settings, start_nodes, offset
+        )
+        requests += self._collect_bus_set_requests({offset: bus_values}, offset)
+        requests += self._collect_node_set_requests(id_mapping, node_settings)
+        return requests
+
+    def _compile_offset(
+        self,
+        buffer_open_states,
+        buffer_settings,
+        bus_settings,
+        duration,
+        id_mapping,
+        offset,
+        visited_synthdefs,
+        retain_datagrams=True,
+    ):
+        # Reuse the offset's compiled bundle unless the journal marked it
+        # dirty or it is entered with different buffer or synthdef state,
+        # replaying its effect on that state. Streamed renders encode and
+        # write each datagram once, so skip retaining theirs.
+        signature = (
+            frozenset(visited_synthdefs),
+            tuple(sorted(buffer_open_states.items())),
+        )
+        compiled_offset = self._compiled_offsets.get(offset)
+        if (
+            compiled_offset is not None
+            and offset not in self._dirty_offsets
+            and compiled_offset[0] == signature
+        ):
+            _, new_synthdefs, new_buffer_open_states, request_bundle = compiled_offset
+            visited_synthdefs.update(new_synthdefs)
+            buffer_open_states.clear()
+            buffer_open_states.update(new_buffer_open_states)
+            return request_bundle
+        requests = self._collect_requests_at_offset(
+            buffer_open_states,
+            buffer_settings,
+            bus_settings,
+            duration,
+            id_mapping,
+            False,
+            offset,
+            visited_synthdefs,
+        )
+        self._discard_compiled_offset(offset)
+        request_bundle = None
+        if requests:
+            request_bundle = RequestBundle(contents=requests, timestamp=float(offset))
+            osc_bundle = request_bundle._osc_bundle = request_bundle.to_osc()
+            if retain_datagrams:
+                try:
+                    datagram = osc_bundle.to_datagram(realtime=False)
+                except TypeError:  # renderables, encoded once cross-referenced
+                    pass
+                else:
+                    self._compiled_datagrams[id(osc_bundle)] = (osc_bundle, datagram)
+        self._compiled_offsets[offset] = (
+            signature,
+            tuple(visited_synthdefs.difference(signature[0])),
+            tuple(buffer_open_states.items()),
+            request_bundle,
+        )
+        return request_bundle
+
+    def _discard_compiled_offset(self, *offsets):
+        # Without offsets, discard everything compiled so far.
+        if not offsets:
+            self._compiled_datagrams.clear()
+            self._compiled_offsets.clear()
+            self._dirty_offsets.clear()
+            return
+        for offset in offsets:
+            compiled_offset = self._compiled_offsets.pop(offset, None)
+            if compiled_offset is not None and compiled_offset[-1] is not None:
+                self._compiled_datagrams.pop(id(compiled_offset[-1].to_osc()), None)
+            self._dirty_offsets.discard(offset)
+
     def _find_state_after(self, offset, with_node_tree=None):
         index = bisect.bisect(self.offsets, offset)
         if with_node_tree:
@@ -774,6 +971,7 @@ class Session:
             state = old_state._clone(offset)
             self.states[offset] = state
             self.offsets.insert(self.offsets.index(old_state.offset) + 1, offset)
+            self._mark_dirty(offset)
         return state
 
     def _find_state_before(self, offset, with_node_tree=None):
@@ -794,6 +992,12 @@ class Session:
             return None
         return self.states[self.offsets[index]]
 
+    def _get_compiled_datagram(self, osc_bundle):
+        compiled_datagram = self._compiled_datagrams.get(id(osc_bundle))
+        if compiled_datagram is None or compiled_datagram[0] is not osc_bundle:
+            return None
+        return compiled_datagram[1]
+
     def _get_next_session_id(self, kind="node"):
         default = 0
         if kind == "node":
@@ -802,6 +1006,81 @@ class Session:
         self._session_ids[kind] += 1
         return session_id
 
+    def _iterate_non_xrefd_request_bundles(
+        self, duration=None, start_offset=None, stop_offset=None, retain_datagrams=True
+    ):
+        # A segment between start_offset and stop_offset is timestamped from
+        # start_offset, recreating whatever started earlier at its start, and
+        # simply stops at stop_offset unless that is the session's end.
+        # Offsets compiled from the session's start are cached for reuse, and
+        # bundles are yielded as they are compiled, so that streamed renders
+        # can write each one out before the next is compiled.
+        if self.duration == float("inf"):
+            assert duration is not None and 0 < duration < float("inf")
+        duration = duration or self.duration
+        start_offset = float(start_offset or 0.0)
+        if stop_offset is None or duration < stop_offset:
+            stop_offset = duration
+        assert 0.0 <= start_offset <= stop_offset
+        index = bisect.bisect(self.offsets, start_offset)
+        stop_index = bisect.bisect_left(self.offsets, stop_offset, lo=index)
+        offsets = itertools.chain(
+            [start_offset],
+            self.offsets[index:stop_index],
+            [stop_offset] if start_offset < stop_offset else [],
+        )
+        id_mapping, buffer_settings, bus_settings = self._collect_compilation_settings(
+            duration
+        )
+        is_last_offset = False
+        buffer_open_states = {}
+        visited_synthdefs = set()
+        for offset in offsets:
+            requests = []
+            if offset == stop_offset:
+                is_last_offset = True
+            if offset == start_offset and start_offset:
+                requests += self._collect_warm_up_requests(
+                    buffer_open_states,
+                    buffer_settings,
+                    bus_settings,
+                    duration,
+                    id_mapping,
+                    offset,
+                    visited_synthdefs,
+                )
+            if not start_offset and not is_last_offset and offset in self.states:
+                request_bundle = self._compile_offset(
+                    buffer_open_states,
+                    buffer_settings,
+                    bus_settings,
+                    duration,
+                    id_mapping,
+                    offset,
+                    visited_synthdefs,
+                    retain_datagrams=retain_datagrams,
+                )
+                if request_bundle is not None:
+                    yield request_bundle
+                continue
+            if (offset in self.states and offset < stop_offset) or offset == duration:
+                requests += self._collect_requests_at_offset(
+                    buffer_open_states,
+                    buffer_settings,
+                    bus_settings,
+                    duration,
+                    id_mapping,
+                    is_last_offset,
+                    offset,
+                    visited_synthdefs,
+                )
+            if is_last_offset:
+                requests.append(NothingRequest())
+            if requests:
+                yield RequestBundle(
+                    contents=requests, timestamp=float(offset - start_offset)
+                )
+
     def _iterate_state_pairs(self, offset, with_node_tree=None):
         state_one = self._find_state_at(offset, clone_if_missing=True)
         state_two = self._find_state_after(
@@ -814,6 +1093,27 @@ class Session:
                 state_one.offset, with_node_tree=with_node_tree
             )
 
+    def _mark_dirty(self, *offsets, buffers=False, buses=False, ids=False):
+        # Journal an edit, so that compilation only revisits what it touched.
+        self._dirty_offsets.update(offsets)
+        if buffers:
+            self._dirty_settings.add("buffers")
+        if buses:
+            self._dirty_settings.add("buses")
+        if ids:
+            self._dirty_settings.add("ids")
+
+    def _mark_node_tree_dirty(self, offset):
+        # Sparse states after offset order their node settings by its tree.
+        self._mark_dirty(offset)
+        index = bisect.bisect(self.offsets, offset)
+        while index < len(self.offsets):
+            state = self.states[self.offsets[index]]
+            if state.nodes_to_children is not None:
+                break
+            self._mark_dirty(state.offset)
+            index += 1
+
     def _setup_buses(self):
         import supriya.nonrealtime
 
@@ -846,54 +1146,25 @@ class Session:
         assert state.is_sparse
         self.offsets.remove(offset)
         del self.states[offset]
+        self._discard_compiled_offset(offset)
         return state
 
-    def _to_non_xrefd_osc_bundles(self, duration=None):
-        osc_bundles = []
-        request_bundles = self._to_non_xrefd_request_bundles(duration=duration)
-        for request_bundle in request_bundles:
-            osc_bundles.append(request_bundle.to_osc())
-        return osc_bundles
+    def _to_non_xrefd_osc_bundles(
+        self, duration=None, start_offset=None, stop_offset=None
+    ):
+        request_bundles = self._iterate_non_xrefd_request_bundles(
+            duration=duration, start_offset=start_offset, stop_offset=stop_offset
+        )
+        return [request_bundle.to_osc() for request_bundle in request_bundles]
 
-    def _to_non_xrefd_request_bundles(self, duration=None):
-        id_mapping = self._build_id_mapping()
-        if self.duration == float("inf"):
-            assert duration is not None and 0 < duration < float("inf")
-        duration = duration or self.duration
-        offsets = self.offsets[1:]
-        if duration not in offsets:
-            offsets.append(duration)
-            offsets.sort()
-        buffer_settings = self._collect_buffer_settings(id_mapping)
-        bus_settings = self._collect_bus_settings(id_mapping)
-        is_last_offset = False
-        request_bundles = []
-        buffer_open_states = {}
-        visited_synthdefs = set()
-        for offset in offsets:
-            requests = []
-            if offset == duration:
-                is_last_offset = True
-            requests = self._collect_requests_at_offset(
-                buffer_open_states,
-                buffer_settings,
-                bus_settings,
-                duration,
-                id_mapping,
-                is_last_offset,
-                offset,
-                visited_synthdefs,
+    def _to_non_xrefd_request_bundles(
+        self, duration=None, start_offset=None, stop_offset=None
+    ):
+        return list(
+            self._iterate_non_xrefd_request_bundles(
+                duration=duration, start_offset=start_offset, stop_offset=stop_offset
             )
-            if is_last_offset:
-                requests.append(NothingRequest())
-            if requests:
-                request_bundle = RequestBundle(
-                    contents=requests, timestamp=float(offset)
-                )
-                request_bundles.append(request_bundle)
-            if is_last_offset:
-                break
-        return request_bundles
+        )
 
     ### PUBLIC METHODS ###
 
@@ -937,6 +1208,7 @@ class Session:
         with self.at(buffer_.stop_offset) as stop_moment:
             stop_moment.state.stop_buffers.add(buffer_)
         self._buffers.add(buffer_)
+        self._mark_dirty(buffers=True, ids=True)
         return buffer_
 
     @SessionObject.require_offset
@@ -965,6 +1237,7 @@ class Session:
         with self.at(buffer_group.stop_offset) as stop_moment:
             for buffer_ in buffer_group:
                 stop_moment.state.stop_buffers.add(buffer_)
+        self._mark_dirty(buffers=True, ids=True)
         return buffer_group
 
     def add_bus(self, calculation_rate=CalculationRate.CONTROL):
@@ -976,6 +1249,7 @@ class Session:
         )
         self._buses[bus] = None  # ordered dictionary
         self._buses_by_session_id[session_id] = bus
+        self._mark_dirty(buses=True, ids=True)
         return bus
 
     def add_bus_group(self, bus_count=1, calculation_rate=CalculationRate.CONTROL):
@@ -992,6 +1266,7 @@ class Session:
             self._buses[bus] = None  # ordered dictionary
             self._buses_by_session_id[bus.session_id] = bus
         self._buses_by_session_id[session_id] = bus_group
+        self._mark_dirty(buses=True, ids=True)
         return bus_group
 
     def add_group(self, add_action=None, duration=None, offset=None):
@@ -1066,6 +1341,7 @@ class Session:
         ):
             transitions = state_two._rebuild_transitions(state_one, state_two)
             state_two._transitions = transitions
+            self._mark_dirty(state_two.offset)
 
     def render(
         self,
@@ -1079,6 +1355,11 @@ class Session:
         sample_rate=44100,
         print_transcript=None,
         transcript_prefix=None,
+        max_workers=1,
+        segment_offsets=None,
+        pre_roll=0.0,
+        crossfade=0.0,
+        render_cache=None,
         **kwargs,
     ):
         import supriya.nonrealtime
@@ -1093,6 +1374,11 @@ class Session:
             sample_format=sample_format,
             sample_rate=sample_rate,
             transcript_prefix=transcript_prefix,
+            max_workers=max_workers,
+            segment_offsets=segment_offsets,
+            pre_roll=pre_roll,
+            crossfade=crossfade,
+            render_cache=render_cache,
         )
         exit_code, transcript, output_file_path = renderer.render(
             output_file_path, duration=duration, debug=debug, **kwargs
@@ -352,6 +352,7 @@ class Moment(SessionObject):
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.session.active_moments.pop()
+        self.session._mark_dirty(self.state.offset)
         if self.propagate:
             self.session._apply_transitions(self.state.offset)
 
@@ -3,12 +3,14 @@ Tools for sending, receiving and handling OSC messages.
 """
 
 from .captures import Capture, CaptureEntry
+from .dispatchers import OscDispatcher
 from .messages import OscBundle, OscMessage
 from .protocols import (
     AsyncOscProtocol,
     HealthCheck,
     OscCallback,
     OscProtocol,
+    OscSendQueue,
     ThreadedOscProtocol,
 )
 from .utils import find_free_port
@@ -20,8 +22,10 @@ __all__ = [
     "HealthCheck",
     "OscBundle",
     "OscCallback",
+    "OscDispatcher",
     "OscMessage",
     "OscProtocol",
+    "OscSendQueue",
     "ThreadedOscProtocol",
     "find_free_port",
 ]
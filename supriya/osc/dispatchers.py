@@ -0,0 +1,255 @@
+import itertools
+import re
+from typing import Dict, List, Optional, Pattern
+
+WILDCARD_CHARACTERS = frozenset("*?[{")
+
+
+def compile_address_pattern(pattern: str) -> Pattern:
+    """
+    Compile an OSC address pattern into a regular expression.
+
+    ::
+
+        >>> from supriya.osc.dispatchers import compile_address_pattern
+        >>> regex = compile_address_pattern("/n_[!m]*")
+        >>> bool(regex.match("/n_go")), bool(regex.match("/n_move"))
+        (True, False)
+
+    ::
+
+        >>> regex = compile_address_pattern("/{b,c}_set?")
+        >>> [bool(regex.match(x)) for x in ("/b_setn", "/c_setn", "/c_set")]
+        [True, True, False]
+
+    """
+    parts: List[str] = []
+    index = 0
+    while index < len(pattern):
+        character = pattern[index]
+        if character == "*":
+            parts.append("[^/]*")
+        elif character == "?":
+            parts.append("[^/]")
+        elif character == "[":
+            stop = pattern.index("]", index)
+            characters = pattern[index + 1 : stop]
+            negate = characters.startswith("!")
+            if negate:
+                characters = characters[1:]
+            characters = characters.replace("\\", "\\\\").replace("^", "\\^")
+            parts.append("[{}{}]".format("^" if negate else "", characters))
+            index = stop
+        elif character == "{":
+            stop = pattern.index("}", index)
+            alternatives = pattern[index + 1 : stop].split(",")
+            parts.append("(?:{})".format("|".join(re.escape(x) for x in alternatives)))
+            index = stop
+        else:
+            parts.append(re.escape(character))
+        index += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+class _Node:
+
+    __slots__ = ("children", "generations")
+
+    def __init__(self):
+        self.children: Dict = {}
+        self.generations: List[int] = []
+
+
+class OscDispatcher:
+    """
+    An index of OSC callbacks keyed by address.
+
+    Callbacks are indexed by their pattern's address, then by each following
+    argument, so matching a message only visits the callbacks registered for
+    its address. Addresses containing OSC wildcards (``*``, ``?``, ``[]`` and
+    ``{}``) are matched against incoming addresses by regular expression, and
+    the result is cached per address.
+
+    Each registration is stamped with a generation. Removing a callback only
+    discards its live generation, which is O(1); stale generations left in the
+    index are skipped during matching and swept out once they outnumber the
+    live ones.
+
+    ::
+
+        >>> from supriya.osc import OscCallback, OscMessage
+        >>> from supriya.osc.dispatchers import OscDispatcher
+        >>> dispatcher = OscDispatcher()
+        >>> callback_a = OscCallback(pattern=("/n_go",), procedure=print)
+        >>> callback_b = OscCallback(pattern=("/n_*", 1000), procedure=print, once=True)
+        >>> dispatcher.add(callback_a)
+        >>> dispatcher.add(callback_b)
+
+    ::
+
+        >>> len(dispatcher.match(OscMessage("/n_go", 1000, 1)))
+        2
+
+    ::
+
+        >>> len(dispatcher.match(OscMessage("/n_go", 1000, 1)))
+        1
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_callbacks",
+        "_counter",
+        "_generations",
+        "_index",
+        "_tombstones",
+        "_wildcard_cache",
+        "_wildcards",
+    )
+
+    _compaction_threshold = 1024
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self._callbacks: Dict = {}
+        self._counter = itertools.count()
+        self._generations: Dict = {}
+        self._index: Dict = {}
+        self._tombstones = 0
+        self._wildcard_cache: Dict = {}
+        self._wildcards: Dict = {}
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, callback) -> bool:
+        return id(callback) in self._generations
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    ### PRIVATE METHODS ###
+
+    def _compact(self):
+        callbacks = sorted(self._callbacks.items())
+        self._index.clear()
+        self._wildcards.clear()
+        self._wildcard_cache.clear()
+        self._tombstones = 0
+        for generation, callback in callbacks:
+            self._insert(generation, callback)
+
+    def _discard(self, generation):
+        callback = self._callbacks.pop(generation, None)
+        if callback is None:
+            return
+        generations = self._generations[id(callback)]
+        generations.remove(generation)
+        if not generations:
+            del self._generations[id(callback)]
+        self._tombstones += 1
+        if self._tombstones > max(self._compaction_threshold, len(self._callbacks)):
+            self._compact()
+
+    def _get_roots(self, address) -> List[_Node]:
+        roots = []
+        node = self._index.get(address)
+        if node is not None:
+            roots.append(node)
+        if self._wildcards and isinstance(address, str):
+            wildcard_roots = self._wildcard_cache.get(address)
+            if wildcard_roots is None:
+                if len(self._wildcard_cache) >= self._compaction_threshold:
+                    self._wildcard_cache.clear()
+                wildcard_roots = self._wildcard_cache[address] = [
+                    node
+                    for regex, node in self._wildcards.values()
+                    if regex.match(address)
+                ]
+            roots.extend(wildcard_roots)
+        return roots
+
+    def _insert(self, generation, callback):
+        patterns = [callback.pattern]
+        if callback.failure_pattern:
+            patterns.append(callback.failure_pattern)
+        for pattern in patterns:
+            address, arguments = pattern[0], pattern[1:]
+            if isinstance(address, str) and WILDCARD_CHARACTERS.intersection(
+                address
+            ):
+                if address not in self._wildcards:
+                    self._wildcards[address] = (
+                        compile_address_pattern(address),
+                        _Node(),
+                    )
+                    self._wildcard_cache.clear()
+                node = self._wildcards[address][1]
+            else:
+                node = self._index.setdefault(address, _Node())
+            for argument in arguments:
+                node = node.children.setdefault(argument, _Node())
+            node.generations.append(generation)
+
+    ### PUBLIC METHODS ###
+
+    def add(self, callback) -> None:
+        """
+        Add ``callback`` to the index.
+        """
+        generation = next(self._counter)
+        self._callbacks[generation] = callback
+        # Callbacks may hold unhashable values, so key them by identity.
+        self._generations.setdefault(id(callback), []).append(generation)
+        self._insert(generation, callback)
+
+    def match(self, message) -> List:
+        """
+        Collect the callbacks matching ``message``.
+
+        Callbacks registered with ``once`` are removed as they match.
+        """
+        callbacks = self._callbacks
+        matched_generations: List[int] = []
+        for node in self._get_roots(message.address):
+            matched_generations.extend(node.generations)
+            for item in message.contents:
+                try:
+                    node = node.children.get(item)
+                except TypeError:  # unhashable arguments, e.g. arrays
+                    break
+                if node is None:
+                    break
+                matched_generations.extend(node.generations)
+        matching_callbacks = []
+        seen = set()
+        for generation in matched_generations:
+            callback = callbacks.get(generation)
+            if callback is None or generation in seen:
+                continue
+            seen.add(generation)
+            matching_callbacks.append(callback)
+            if callback.once:
+                self._discard(generation)
+        return matching_callbacks
+
+    def remove(self, callback) -> None:
+        """
+        Remove ``callback`` from the index.
+
+        Removing a callback which is not in the index is a no-op.
+        """
+        generations: Optional[List[int]] = self._generations.get(id(callback))
+        if generations:
+            self._discard(generations[0])
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def tombstone_count(self) -> int:
+        """
+        The number of stale registrations awaiting compaction.
+        """
+        return self._tombstones
@@ -1,6 +1,8 @@
 import collections
 import datetime
 import enum
+import functools
+import itertools
 import struct
 import time
 from collections.abc import Sequence
@@ -16,6 +18,61 @@ SECONDS_TO_NTP_TIMESTAMP = 2.0 ** 32.0
 SYSTEM_EPOCH = datetime.date(*time.gmtime(0)[0:3])
 NTP_EPOCH = datetime.date(1900, 1, 1)
 NTP_DELTA = (SYSTEM_EPOCH - NTP_EPOCH).days * 24 * 3600
+INT32 = struct.Struct(">i")
+UINT32 = struct.Struct(">I")
+UINT64 = struct.Struct(">Q")
+FLOAT32 = struct.Struct(">f")
+PADDING = (b"", b"\x00\x00\x00", b"\x00\x00", b"\x00")
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_struct(format_):
+    return struct.Struct(format_)
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_type_tags(type_tags):
+    return OscMessage._encode_string(type_tags)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_type_tags(type_tags):
+    """
+    Compile an OSC type tag string into a tuple of decoding steps.
+
+    Runs of identical fixed-width type tags collapse into a single step with a
+    precompiled ``struct.Struct``, so e.g. 512 consecutive ``f`` tags decode
+    with one ``unpack_from`` call.
+    """
+    steps = []
+    for type_tag, group in itertools.groupby(type_tags[1:]):
+        count = len(tuple(group))
+        if type_tag in "dfi":
+            steps.append((type_tag, count, struct.Struct(f">{count}{type_tag}")))
+        else:
+            steps.extend((type_tag, 1, None) for _ in range(count))
+    return tuple(steps)
+
+
+def _coerce_datagram(datagram):
+    # Decoding walks the datagram by offset, and needs bounded ``index`` and
+    # ``startswith``, which ``memoryview`` lacks.
+    if isinstance(datagram, (bytes, bytearray)):
+        return datagram
+    return bytes(datagram)
+
+
+def _decode_blob_contents(data, start, stop):
+    if data.startswith(BUNDLE_PREFIX, start, stop):
+        classes = (OscBundle, OscMessage)
+    else:
+        classes = (OscMessage,)
+    for class_ in classes:
+        try:
+            return class_._decode(data, start, stop)
+        except Exception:
+            pass
+    return bytes(data[start:stop])
 
 
 class OscMessage(SupriyaValueObject):
@@ -115,19 +172,58 @@ class OscMessage(SupriyaValueObject):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _decode(cls, data, offset, end):
+        address, offset = cls._decode_string(data, offset, end)
+        type_tags, offset = cls._decode_string(data, offset, end)
+        contents = []
+        array_stack = [contents]
+        for type_tag, count, struct_ in _compile_type_tags(type_tags):
+            if struct_ is not None:
+                if offset + struct_.size > end:
+                    raise ValueError(f"Datagram truncated at offset {offset}")
+                array_stack[-1].extend(struct_.unpack_from(data, offset))
+                offset += struct_.size
+            elif type_tag == "s":
+                value, offset = cls._decode_string(data, offset, end)
+                array_stack[-1].append(value)
+            elif type_tag == "b":
+                (start, stop), offset = cls._decode_blob(data, offset, end)
+                value = _decode_blob_contents(data, start, stop)
+                array_stack[-1].append(value)
+            elif type_tag == "T":
+                array_stack[-1].append(True)
+            elif type_tag == "F":
+                array_stack[-1].append(False)
+            elif type_tag == "N":
+                array_stack[-1].append(None)
+            elif type_tag == "[":
+                array = []
+                array_stack[-1].append(array)
+                array_stack.append(array)
+            elif type_tag == "]":
+                array_stack.pop()
+            else:
+                raise RuntimeError(f"Unable to parse type {type_tag!r}")
+        return cls(address, *contents)
+
     @staticmethod
-    def _decode_blob(data):
-        actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
+    def _decode_blob(data, offset, end):
+        actual_length = UINT32.unpack_from(data, offset)[0]
+        offset += 4
         padded_length = actual_length
         if actual_length % 4 != 0:
             padded_length = (actual_length // 4 + 1) * 4
-        return remainder[:padded_length][:actual_length], remainder[padded_length:]
+        return (offset, min(offset + actual_length, end)), offset + padded_length
 
     @staticmethod
-    def _decode_string(data):
-        actual_length = data.index(b"\x00")
+    def _decode_string(data, offset, end):
+        actual_length = data.index(b"\x00", offset, end) - offset
         padded_length = (actual_length // 4 + 1) * 4
-        return str(data[:actual_length], "ascii"), data[padded_length:]
+        return (
+            str(data[offset : offset + actual_length], "ascii"),
+            offset + padded_length,
+        )
 
     @staticmethod
     def _encode_string(value):
@@ -146,102 +242,96 @@ class OscMessage(SupriyaValueObject):
         return result
 
     @classmethod
-    def _encode_value(cls, value):
-        if hasattr(value, "to_datagram"):
+    def _encode_value(cls, value, type_tags, buffer):
+        if isinstance(value, (OscBundle, OscMessage)):
+            type_tags.append("b")
+            index = len(buffer)
+            buffer += b"\x00\x00\x00\x00"
+            value._encode_into(buffer)
+            UINT32.pack_into(buffer, index, len(buffer) - index - 4)
+            buffer += PADDING[len(buffer) % 4]
+            return
+        elif hasattr(value, "to_datagram"):
             value = bytearray(value.to_datagram())
         elif isinstance(value, enum.Enum):
             value = value.value
-        type_tags, encoded_value = "", b""
         if isinstance(value, (bytearray, bytes)):
-            type_tags += "b"
-            encoded_value = cls._encode_blob(value)
+            type_tags.append("b")
+            buffer += cls._encode_blob(value)
         elif isinstance(value, str):
-            type_tags += "s"
-            encoded_value = cls._encode_string(value)
+            type_tags.append("s")
+            buffer += cls._encode_string(value)
         elif isinstance(value, bool):
-            type_tags += "T" if value else "F"
+            type_tags.append("T" if value else "F")
         elif isinstance(value, float):
-            type_tags += "f"
-            encoded_value += struct.pack(">f", value)
+            type_tags.append("f")
+            buffer += FLOAT32.pack(value)
         elif isinstance(value, int):
-            type_tags += "i"
-            encoded_value += struct.pack(">i", value)
+            type_tags.append("i")
+            buffer += INT32.pack(value)
         elif value is None:
-            type_tags += "N"
+            type_tags.append("N")
         elif isinstance(value, Sequence):
-            type_tags += "["
-            for sub_value in value:
-                sub_type_tags, sub_encoded_value = cls._encode_value(sub_value)
-                type_tags += sub_type_tags
-                encoded_value += sub_encoded_value
-            type_tags += "]"
+            type_tags.append("[")
+            cls._encode_values(tuple(value), type_tags, buffer)
+            type_tags.append("]")
         else:
             message = "Cannot encode {!r}".format(value)
             raise TypeError(message)
-        return type_tags, encoded_value
 
-    ### PUBLIC METHODS ###
+    @classmethod
+    def _encode_values(cls, values, type_tags, buffer):
+        index, length = 0, len(values)
+        while index < length:
+            value = values[index]
+            type_ = type(value)
+            if type_ is float or type_ is int:
+                # Pack runs of plain floats or plain ints with a single call.
+                stop = index + 1
+                while stop < length and type(values[stop]) is type_:
+                    stop += 1
+                type_tag = "f" if type_ is float else "i"
+                type_tags.append(type_tag * (stop - index))
+                buffer += _get_struct(f">{stop - index}{type_tag}").pack(
+                    *values[index:stop]
+                )
+                index = stop
+            else:
+                cls._encode_value(value, type_tags, buffer)
+                index += 1
 
-    def to_datagram(self):
+    def _encode_into(self, buffer):
         # address can be a string or (in SuperCollider) an int
         if isinstance(self.address, str):
-            encoded_address = self._encode_string(self.address)
+            buffer += self._encode_string(self.address)
         else:
-            encoded_address = struct.pack(">i", self.address)
-        encoded_type_tags = ","
-        encoded_contents = b""
-        for value in self.contents or ():
-            type_tags, encoded_value = self._encode_value(value)
-            encoded_type_tags += type_tags
-            encoded_contents += encoded_value
-        return (
-            encoded_address + self._encode_string(encoded_type_tags) + encoded_contents
-        )
+            buffer += INT32.pack(self.address)
+        type_tags = [","]
+        contents_buffer = bytearray()
+        self._encode_values(self.contents, type_tags, contents_buffer)
+        buffer += _encode_type_tags("".join(type_tags))
+        buffer += contents_buffer
+
+    ### PUBLIC METHODS ###
+
+    def to_datagram(self, *, buffer=None):
+        """
+        Encode the message as a datagram.
+
+        When ``buffer`` is a ``bytearray``, append the encoded datagram to it
+        and return it rather than allocating a new ``bytes`` object.
+        """
+        if buffer is not None:
+            self._encode_into(buffer)
+            return buffer
+        buffer = bytearray()
+        self._encode_into(buffer)
+        return bytes(buffer)
 
     @classmethod
     def from_datagram(cls, datagram):
-        remainder = datagram
-        address, remainder = cls._decode_string(remainder)
-        type_tags, remainder = cls._decode_string(remainder)
-        contents = []
-        array_stack = [contents]
-        for type_tag in type_tags[1:]:
-            if type_tag == "i":
-                value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "f":
-                value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "d":
-                value, remainder = struct.unpack(">d", remainder[:8])[0], remainder[8:]
-                array_stack[-1].append(value)
-            elif type_tag == "s":
-                value, remainder = cls._decode_string(remainder)
-                array_stack[-1].append(value)
-            elif type_tag == "b":
-                value, remainder = cls._decode_blob(remainder)
-                for class_ in (OscBundle, OscMessage):
-                    try:
-                        value = class_.from_datagram(value)
-                        break
-                    except Exception:
-                        pass
-                array_stack[-1].append(value)
-            elif type_tag == "T":
-                array_stack[-1].append(True)
-            elif type_tag == "F":
-                array_stack[-1].append(False)
-            elif type_tag == "N":
-                array_stack[-1].append(None)
-            elif type_tag == "[":
-                array = []
-                array_stack[-1].append(array)
-                array_stack.append(array)
-            elif type_tag == "]":
-                array_stack.pop()
-            else:
-                raise RuntimeError(f"Unable to parse type {type_tag!r}")
-        return cls(address, *contents)
+        data = _coerce_datagram(datagram)
+        return cls._decode(data, 0, len(data))
 
     def to_list(self):
         result = [self.address]
@@ -325,7 +415,7 @@ class OscBundle(SupriyaValueObject):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("contents", "timestamp")
+    __slots__ = ("_datagram", "contents", "timestamp")
 
     ### INITIALIZER ###
 
@@ -337,6 +427,7 @@ class OscBundle(SupriyaValueObject):
             if not isinstance(x, prototype):
                 raise ValueError(contents)
         self.contents = tuple(contents)
+        self._datagram = None
 
     ### SPECIAL METHODS ###
 
@@ -345,13 +436,32 @@ class OscBundle(SupriyaValueObject):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _decode(cls, data, offset, end):
+        if not data.startswith(BUNDLE_PREFIX, offset, end):
+            raise ValueError("datagram is not a bundle")
+        timestamp, offset = cls._decode_date(data, offset + 8)
+        contents = []
+        while offset < end:
+            length = INT32.unpack_from(data, offset)[0]
+            offset += 4
+            stop = min(offset + length, end)
+            if data.startswith(BUNDLE_PREFIX, offset, stop):
+                item = cls._decode(data, offset, stop)
+            else:
+                item = OscMessage._decode(data, offset, stop)
+            contents.append(item)
+            offset += length
+        return cls(timestamp=timestamp, contents=tuple(contents))
+
     @staticmethod
-    def _decode_date(data):
-        data, remainder = data[:8], data[8:]
-        if data == IMMEDIATELY:
-            return None, remainder
-        date = (struct.unpack(">Q", data)[0] / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA
-        return date, remainder
+    def _decode_date(data, offset):
+        if data[offset : offset + 8] == IMMEDIATELY:
+            return None, offset + 8
+        date = (
+            UINT64.unpack_from(data, offset)[0] / SECONDS_TO_NTP_TIMESTAMP
+        ) - NTP_DELTA
+        return date, offset + 8
 
     @staticmethod
     def _encode_date(seconds, realtime=True):
@@ -362,25 +472,41 @@ class OscBundle(SupriyaValueObject):
             return struct.pack(">Q", int(seconds * SECONDS_TO_NTP_TIMESTAMP))
         return struct.pack(">Q", int(seconds * SECONDS_TO_NTP_TIMESTAMP))
 
+    def _encode_into(self, buffer, realtime=True):
+        if realtime and self._datagram is not None:
+            buffer += self._datagram
+            return
+        buffer += BUNDLE_PREFIX
+        buffer += self._encode_date(self.timestamp, realtime=realtime)
+        for content in self.contents:
+            index = len(buffer)
+            buffer += b"\x00\x00\x00\x00"
+            content._encode_into(buffer)
+            INT32.pack_into(buffer, index, len(buffer) - index - 4)
+
+    @classmethod
+    def _from_encoded(cls, timestamp, contents, datagrams):
+        """
+        Build a bundle from contents whose datagrams were already encoded.
+
+        The bundle's realtime datagram is assembled from ``datagrams`` rather
+        than by re-encoding ``contents``.
+        """
+        osc_bundle = cls(timestamp=timestamp, contents=contents)
+        buffer = bytearray(BUNDLE_PREFIX)
+        buffer += cls._encode_date(timestamp)
+        for datagram in datagrams:
+            buffer += INT32.pack(len(datagram))
+            buffer += datagram
+        osc_bundle._datagram = bytes(buffer)
+        return osc_bundle
+
     ### PUBLIC METHODS ###
 
     @classmethod
     def from_datagram(cls, datagram):
-        if not datagram.startswith(BUNDLE_PREFIX):
-            raise ValueError("datagram is not a bundle")
-        remainder = datagram[8:]
-        timestamp, remainder = cls._decode_date(remainder)
-        contents = []
-        while len(remainder):
-            length, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-            if remainder.startswith(BUNDLE_PREFIX):
-                item = cls.from_datagram(remainder[:length])
-            else:
-                item = OscMessage.from_datagram(remainder[:length])
-            contents.append(item)
-            remainder = remainder[length:]
-        osc_bundle = cls(timestamp=timestamp, contents=tuple(contents))
-        return osc_bundle
+        data = _coerce_datagram(datagram)
+        return cls._decode(data, 0, len(data))
 
     @classmethod
     def partition(cls, messages, timestamp=None):
@@ -402,14 +528,21 @@ class OscBundle(SupriyaValueObject):
             bundles.append(cls(timestamp=timestamp, contents=contents))
         return bundles
 
-    def to_datagram(self, realtime=True):
-        datagram = BUNDLE_PREFIX
-        datagram += self._encode_date(self.timestamp, realtime=realtime)
-        for content in self.contents:
-            content_datagram = content.to_datagram()
-            datagram += struct.pack(">i", len(content_datagram))
-            datagram += content_datagram
-        return datagram
+    def to_datagram(self, realtime=True, *, buffer=None):
+        """
+        Encode the bundle as a datagram.
+
+        When ``buffer`` is a ``bytearray``, append the encoded datagram to it
+        and return it rather than allocating a new ``bytes`` object.
+        """
+        if buffer is not None:
+            self._encode_into(buffer, realtime=realtime)
+            return buffer
+        if realtime and self._datagram is not None:
+            return self._datagram
+        buffer = bytearray()
+        self._encode_into(buffer, realtime=realtime)
+        return bytes(buffer)
 
     def to_list(self):
         result = [self.timestamp]
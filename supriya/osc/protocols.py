@@ -2,14 +2,16 @@ import asyncio
 import dataclasses
 import logging
 import queue
+import socket
 import socketserver
 import threading
 import time
 from collections.abc import Sequence
-from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 from .captures import Capture, CaptureEntry
-from .messages import OscBundle, OscMessage
+from .dispatchers import OscDispatcher
+from .messages import BUNDLE_PREFIX, OscBundle, OscMessage
 
 osc_protocol_logger = logging.getLogger("supriya.osc.protocol")
 osc_in_logger = logging.getLogger("supriya.osc.in")
@@ -17,6 +19,10 @@ osc_out_logger = logging.getLogger("supriya.osc.out")
 udp_in_logger = logging.getLogger("supriya.udp.in")
 udp_out_logger = logging.getLogger("supriya.udp.out")
 
+# Not available on every platform; batched receives degrade to one datagram
+# per wakeup without it.
+MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
+
 
 class OscProtocolOffline(Exception):
     pass
@@ -43,12 +49,107 @@ class HealthCheck:
     max_attempts: int = 5
 
 
+class OscSendQueue:
+    """
+    Coalesces outgoing OSC messages into bundles.
+
+    Messages are grouped by timestamp: bare messages share an immediate bundle
+    and timestamped bundles are merged with other bundles bearing the same
+    timestamp. A group is emitted as soon as the next message would push it
+    past ``maximum_size`` bytes, and every group is emitted when a ``/sync``
+    message is queued, so that the sync's reply still follows everything sent
+    before it, or when a bundle is queued which is due within the window, so
+    that it is not sent late.
+
+    ::
+
+        >>> from supriya.osc import OscBundle, OscMessage, OscSendQueue
+        >>> send_queue = OscSendQueue(window=0.01)
+        >>> send_queue.add(OscMessage("/n_set", 1000, "amplitude", 0.5))
+        []
+        >>> send_queue.add(OscMessage("/n_set", 1001, "amplitude", 0.25))
+        []
+        >>> datagrams = send_queue.flush()
+        >>> [OscBundle.from_datagram(x) for x in datagrams]
+        [OscBundle(
+            contents=(
+                OscMessage('/n_set', 1000, 'amplitude', 0.5),
+                OscMessage('/n_set', 1001, 'amplitude', 0.25),
+            ),
+        )]
+
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, window: float, maximum_size: int = 8192):
+        self.window = window
+        self.maximum_size = maximum_size
+        self.groups: Dict[Optional[float], Tuple[list, list, list]] = {}
+
+    ### SPECIAL METHODS ###
+
+    def __len__(self):
+        return sum(len(contents) for contents, _, _ in self.groups.values())
+
+    ### PRIVATE METHODS ###
+
+    def _pop(self, timestamp):
+        contents, datagrams, _ = self.groups.pop(timestamp)
+        if timestamp is None and len(contents) == 1:
+            return datagrams[0]
+        return OscBundle._from_encoded(timestamp, contents, datagrams).to_datagram()
+
+    ### PUBLIC METHODS ###
+
+    def add(self, message) -> List[bytes]:
+        """
+        Queue ``message``, returning any datagrams which must be sent now.
+        """
+        if isinstance(message, OscBundle):
+            timestamp, contents = message.timestamp, message.contents
+        else:
+            timestamp, contents = None, (message,)
+        datagrams, sync = [], False
+        for content in contents:
+            if isinstance(content, OscMessage) and content.address == "/sync":
+                # Everything queued elsewhere goes out ahead of the sync.
+                datagrams.extend(
+                    self._pop(other_timestamp)
+                    for other_timestamp in list(self.groups)
+                    if other_timestamp != timestamp
+                )
+                sync = True
+            datagram = content.to_datagram()
+            size = len(datagram) + 4
+            group = self.groups.get(timestamp)
+            if group is not None and group[2][0] + size > self.maximum_size:
+                datagrams.append(self._pop(timestamp))
+                group = None
+            if group is None:
+                # Bundle prefix plus 8-byte timestamp.
+                group = self.groups[timestamp] = ([], [], [len(BUNDLE_PREFIX) + 8])
+            group[0].append(content)
+            group[1].append(datagram)
+            group[2][0] += size
+        # Bundles due before the window elapses can't wait for it.
+        if sync or (timestamp is not None and timestamp < time.time() + self.window):
+            datagrams.extend(self.flush())
+        return datagrams
+
+    def flush(self) -> List[bytes]:
+        """
+        Empty the queue, returning its contents as datagrams.
+        """
+        return [self._pop(timestamp) for timestamp in list(self.groups)]
+
+
 class OscProtocol:
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        self.callbacks: Dict[Any, Any] = {}
+    def __init__(self, *, coalesce_window: Optional[float] = None):
+        self.dispatcher = OscDispatcher()
         self.captures: Set[Capture] = set()
         self.healthcheck = None
         self.healthcheck_osc_callback = None
@@ -56,51 +157,20 @@ class OscProtocol:
         self.ip_address = None
         self.is_running: bool = False
         self.port = None
+        self.send_queue: Optional[OscSendQueue] = None
+        if coalesce_window is not None:
+            self.send_queue = OscSendQueue(window=coalesce_window)
 
     ### PRIVATE METHODS ###
 
     def _add_callback(self, callback: OscCallback):
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            callback_map = self.callbacks
-            for item in pattern:
-                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
-            callbacks.append(callback)
+        self.dispatcher.add(callback)
 
     def _match_callbacks(self, message):
-        items = (message.address,) + message.contents
-        matching_callbacks = []
-        callback_map = self.callbacks
-        for item in items:
-            if item not in callback_map:
-                break
-            callbacks, callback_map = callback_map[item]
-            matching_callbacks.extend(callbacks)
-        for callback in matching_callbacks:
-            if callback.once:
-                self.unregister(callback)
-        return matching_callbacks
+        return self.dispatcher.match(message)
 
     def _remove_callback(self, callback: OscCallback):
-        def delete(pattern, original_callback_map):
-            key = pattern.pop(0)
-            if key not in original_callback_map:
-                return
-            callbacks, callback_map = original_callback_map[key]
-            if pattern:
-                delete(pattern, callback_map)
-            if callback in callbacks:
-                callbacks.remove(callback)
-            if not callbacks and not callback_map:
-                original_callback_map.pop(key)
-
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            delete(list(pattern), self.callbacks)
+        self.dispatcher.remove(callback)
 
     def _pass_healthcheck(self, message):
         osc_protocol_logger.info("...healthcheck passed")
@@ -150,7 +220,7 @@ class OscProtocol:
                 CaptureEntry(timestamp=time.time(), label="R", message=message,)
             )
 
-    def _validate_send(self, message):
+    def _prepare_send(self, message):
         if not self.is_running:
             raise OscProtocolOffline
         if not isinstance(message, (str, Sequence, OscBundle, OscMessage)):
@@ -164,6 +234,10 @@ class OscProtocol:
             capture.messages.append(
                 CaptureEntry(timestamp=time.time(), label="S", message=message)
             )
+        return message
+
+    def _validate_send(self, message):
+        message = self._prepare_send(message)
         datagram = message.to_datagram()
         udp_out_logger.debug(datagram)
         return datagram
@@ -179,6 +253,9 @@ class OscProtocol:
     def disconnect(self):
         ...
 
+    def flush(self):
+        ...
+
     def register(
         self, pattern, procedure, *, failure_pattern=None, once=False
     ) -> OscCallback:
@@ -195,10 +272,12 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(self, *, coalesce_window: Optional[float] = None):
         asyncio.DatagramProtocol.__init__(self)
-        OscProtocol.__init__(self)
+        OscProtocol.__init__(self, coalesce_window=coalesce_window)
+        self.flush_handle = None
         self.loop = None
+        self.transport = None
 
     ### PRIVATE METHODS ###
 
@@ -249,6 +328,7 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
     async def disconnect(self):
         if not self.is_running:
             return
+        self.flush()
         self.exit_future.set_result(True)
         self._teardown()
         if self.loop.is_closed():
@@ -261,6 +341,19 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
     def error_received(self, exc):
         osc_out_logger.warning(exc)
 
+    def flush(self):
+        """
+        Send any coalesced messages immediately.
+        """
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if self.send_queue is None or self.transport is None:
+            return
+        for datagram in self.send_queue.flush():
+            udp_out_logger.debug(datagram)
+            self.transport.sendto(datagram)
+
     def register(
         self, pattern, procedure, *, failure_pattern=None, once=False,
     ) -> OscCallback:
@@ -271,8 +364,18 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         return callback
 
     def send(self, message):
-        datagram = self._validate_send(message)
-        return self.transport.sendto(datagram)
+        if self.send_queue is None:
+            datagram = self._validate_send(message)
+            return self.transport.sendto(datagram)
+        for datagram in self.send_queue.add(self._prepare_send(message)):
+            udp_out_logger.debug(datagram)
+            self.transport.sendto(datagram)
+        if not self.send_queue.groups:
+            if self.flush_handle is not None:
+                self.flush_handle.cancel()
+                self.flush_handle = None
+        elif self.flush_handle is None:
+            self.flush_handle = self.loop.call_later(self.send_queue.window, self.flush)
 
     def unregister(self, callback: OscCallback):
         self._remove_callback(callback)
@@ -289,6 +392,55 @@ class ThreadedOscServer(socketserver.UDPServer):
         self.osc_protocol._run_healthcheck()
 
 
+class BatchedThreadedOscServer(ThreadedOscServer):
+    """
+    A threaded OSC server which drains every pending datagram per wakeup.
+
+    Datagrams are read with non-blocking ``recvfrom_into`` calls into a pool of
+    reusable buffers, then decoded and dispatched as a batch, skipping the
+    per-datagram handler construction and request verification of
+    ``socketserver``.
+    """
+
+    buffer_size = 65536
+    receive_buffer_size = 4 * 1024 * 1024
+
+    def __init__(self, *args, batch_size=64, **kwargs):
+        ThreadedOscServer.__init__(self, *args, **kwargs)
+        self.buffers = [bytearray(self.buffer_size) for _ in range(batch_size)]
+        try:
+            # Give the kernel room to queue bursts between wakeups.
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size
+            )
+        except OSError:
+            pass
+
+    def _handle_request_noblock(self):
+        datagrams = []
+        for buffer_ in self.buffers:
+            try:
+                if datagrams:
+                    size, client_address = self.socket.recvfrom_into(
+                        buffer_, 0, MSG_DONTWAIT
+                    )
+                else:
+                    # The selector reported the socket readable.
+                    size, client_address = self.socket.recvfrom_into(buffer_)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                if not datagrams:
+                    return
+                break
+            datagrams.append(bytes(buffer_[:size]))
+            if not MSG_DONTWAIT:
+                break
+        self.osc_protocol._validate_receive_batch(
+            datagrams, on_error=lambda x: self.handle_error(x, client_address)
+        )
+
+
 class ThreadedOscHandler(socketserver.BaseRequestHandler):
     def handle(self):
         data = self.request[0]
@@ -299,9 +451,16 @@ class ThreadedOscProtocol(OscProtocol):
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        OscProtocol.__init__(self)
+    def __init__(
+        self,
+        *,
+        batch_size: Optional[int] = None,
+        coalesce_window: Optional[float] = None,
+    ):
+        OscProtocol.__init__(self, coalesce_window=coalesce_window)
+        self.batch_size = batch_size
         self.command_queue = queue.Queue()
+        self.flush_timer = None
         self.lock = threading.RLock()
         self.osc_server = None
         self.osc_server_thread = None
@@ -350,12 +509,48 @@ class ThreadedOscProtocol(OscProtocol):
         self.healthcheck.callback()
 
     def _server_factory(self, ip_address, port):
-        server = ThreadedOscServer(
-            (self.ip_address, self.port), ThreadedOscHandler, bind_and_activate=False
-        )
+        if self.batch_size:
+            server = BatchedThreadedOscServer(
+                (self.ip_address, self.port),
+                ThreadedOscHandler,
+                bind_and_activate=False,
+                batch_size=self.batch_size,
+            )
+        else:
+            server = ThreadedOscServer(
+                (self.ip_address, self.port),
+                ThreadedOscHandler,
+                bind_and_activate=False,
+            )
         server.osc_protocol = self
         return server
 
+    def _validate_receive_batch(self, datagrams, on_error):
+        messages = []
+        for datagram in datagrams:
+            udp_in_logger.debug(datagram)
+            try:
+                messages.append(OscMessage.from_datagram(datagram))
+            except Exception:
+                on_error(datagram)
+        for message in messages:
+            osc_in_logger.debug(repr(message))
+            # Callbacks registered while dispatching earlier messages in the
+            # batch must see later ones.
+            self._process_command_queue()
+            try:
+                for callback in self._match_callbacks(message):
+                    callback.procedure(message)
+            except Exception:
+                on_error(message)
+        if self.captures:
+            timestamp = time.time()
+            for capture in self.captures:
+                capture.messages.extend(
+                    CaptureEntry(timestamp=timestamp, label="R", message=message)
+                    for message in messages
+                )
+
     ### PUBLIC METHODS ###
 
     def connect(self, ip_address: str, port: int, *, healthcheck: HealthCheck = None):
@@ -378,6 +573,7 @@ class ThreadedOscProtocol(OscProtocol):
             if not self.is_running:
                 osc_protocol_logger.info("already disconnected!")
                 return
+            self.flush()
             self._teardown()
             if not self.osc_server._BaseServer__shutdown_request:
                 self.osc_server.shutdown()
@@ -411,6 +607,20 @@ class ThreadedOscProtocol(OscProtocol):
         self.unregister(callback)
         return result["result"]
 
+    def flush(self):
+        """
+        Send any coalesced messages immediately.
+        """
+        with self.lock:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+            if self.send_queue is None or self.osc_server is None:
+                return
+            for datagram in self.send_queue.flush():
+                udp_out_logger.debug(datagram)
+                self.osc_server.socket.sendto(datagram, (self.ip_address, self.port))
+
     def register(
         self, pattern, procedure, *, failure_pattern=None, once=False,
     ) -> OscCallback:
@@ -425,12 +635,27 @@ class ThreadedOscProtocol(OscProtocol):
         return callback
 
     def send(self, message):
-        datagram = self._validate_send(message)
-        try:
-            self.osc_server.socket.sendto(datagram, (self.ip_address, self.port))
-        except OSError:
-            # print(message)
-            raise
+        if self.send_queue is None:
+            datagram = self._validate_send(message)
+            try:
+                self.osc_server.socket.sendto(datagram, (self.ip_address, self.port))
+            except OSError:
+                # print(message)
+                raise
+            return
+        message = self._prepare_send(message)
+        with self.lock:
+            for datagram in self.send_queue.add(message):
+                udp_out_logger.debug(datagram)
+                self.osc_server.socket.sendto(datagram, (self.ip_address, self.port))
+            if not self.send_queue.groups:
+                if self.flush_timer is not None:
+                    self.flush_timer.cancel()
+                    self.flush_timer = None
+            elif self.flush_timer is None:
+                self.flush_timer = threading.Timer(self.send_queue.window, self.flush)
+                self.flush_timer.daemon = True
+                self.flush_timer.start()
 
     def unregister(self, callback: OscCallback):
         """
@@ -1,4 +1,5 @@
 import itertools
+import threading
 from queue import PriorityQueue
 
 from uqbar.objects import new
@@ -26,6 +27,7 @@ class EventPlayer:
         self._cumulative_time = 0
         self._event_template = event_template
         self._iterator = None
+        self._node_id_thread_ids = set()
         self._pattern = pattern
         self._server = server or supriya.realtime.Server.default()
         self._uuids = {}
@@ -34,6 +36,10 @@ class EventPlayer:
     ### SPECIAL METHODS ###
 
     def __call__(self, current_moment, desired_moment, *args, communicate=True):
+        # Take node IDs from a block reserved for the calling (clock) thread.
+        # Reserving again is a no-op, and stop() releases the block.
+        self._node_id_thread_ids.add(threading.get_ident())
+        self._server.node_id_allocator.reserve_node_ids()
         if self._iterator is None:
             self._iterator = self._iterate_outer(
                 pattern=self._pattern,
@@ -163,6 +169,10 @@ class EventPlayer:
     def stop(self):
         self._clock.cancel(self._event_id)
         self._iterator = None
+        # Recycle what is left of the node ID blocks reserved while playing
+        for thread_id in self._node_id_thread_ids:
+            self._server.node_id_allocator.release_node_ids(thread_id)
+        self._node_id_thread_ids.clear()
         bundle = self._collect_stop_requests()
         if bundle and self._server.is_running:
             self._server.send(bundle.to_osc())
@@ -613,17 +613,36 @@ class Provider(metaclass=abc.ABCMeta):
 
     @classmethod
     def realtime(
-        cls, scsynth_path=None, options=None, port=None, **kwargs,
+        cls,
+        scsynth_path=None,
+        options=None,
+        port=None,
+        mirror_nodes=True,
+        batch_size=None,
+        coalesce_window=None,
+        **kwargs,
     ) -> "RealtimeProvider":
-        server = Server()
+        """
+        Boots a server and provides for it.
+
+        Pass ``mirror_nodes=False`` to skip mirroring the server's node tree,
+        for high-rate playback which never inspects it. ``batch_size`` and
+        ``coalesce_window`` batch the server's OSC receives and coalesce its
+        sends.
+        """
+        server = Server(
+            mirror_nodes=mirror_nodes,
+            batch_size=batch_size,
+            coalesce_window=coalesce_window,
+        )
         server.boot(port=port, scsynth_path=scsynth_path, options=options, **kwargs)
         return cast("RealtimeProvider", cls.from_context(server))
 
     @classmethod
     async def realtime_async(
-        cls, scsynth_path=None, options=None, port=None, **kwargs,
+        cls, scsynth_path=None, options=None, port=None, coalesce_window=None, **kwargs,
     ) -> "RealtimeProvider":
-        server = AsyncServer()
+        server = AsyncServer(coalesce_window=coalesce_window)
         await server.boot(
             port=port, scsynth_path=scsynth_path, options=options, **kwargs
         )
@@ -1,8 +1,8 @@
+import bisect
+import collections
 import threading
+from typing import Dict, List, NamedTuple, Tuple
 
-from uqbar.objects import new
-
-from supriya.intervals import IntervalTree
 from supriya.intervals.Interval import Interval
 from supriya.system import SupriyaObject
 
@@ -33,6 +33,24 @@ class Block(Interval):
         return self._used
 
 
+class BlockAllocatorStatistics(NamedTuple):
+    """
+    A snapshot of a block allocator's heap.
+
+    ``fragmentation`` is the share of bounded free space lying outside the
+    largest bounded free block: 0.0 when free space is contiguous, tending to
+    1.0 as it splinters into small holes. An unbounded free tail, as in a heap
+    without a maximum, is not counted.
+    """
+
+    free_block_count: int
+    free_size: float
+    largest_free_block_size: float
+    used_block_count: int
+    used_size: int
+    fragmentation: float
+
+
 class BlockAllocator(SupriyaObject):
     """
     A block allocator.
@@ -68,121 +86,165 @@ class BlockAllocator(SupriyaObject):
         >>> allocator.allocate(8)
         8
 
+    ::
+
+        >>> allocator.free(4)
+        >>> allocator.allocate_many([2, 2, 2])
+        [4, 6, None]
+
+    ::
+
+        >>> allocator.statistics()
+        BlockAllocatorStatistics(free_block_count=0, free_size=0, largest_free_block_size=0, used_block_count=4, used_size=16, fragmentation=0.0)
+
+    Allocation is best-fit: the smallest free block which fits is split,
+    preferring lower indices among blocks of equal size. Free blocks are
+    indexed by size for bisection, and by start and stop index so that freed
+    blocks coalesce with their neighbors in constant time.
     """
 
     ### CLASS VARIABLES ###
 
     __documentation_section__ = "Server Internals"
 
-    __slots__ = ("_free_heap", "_heap_maximum", "_heap_minimum", "_lock", "_used_heap")
+    __slots__ = (
+        "_free_by_size",
+        "_free_by_start",
+        "_free_by_stop",
+        "_heap_maximum",
+        "_heap_minimum",
+        "_lock",
+        "_used_by_start",
+    )
 
     ### INITIALIZER ###
 
     def __init__(self, heap_maximum=None, heap_minimum=0):
-        import supriya.realtime
-
-        self._free_heap = IntervalTree(accelerated=True)
         self._heap_maximum = heap_maximum
         self._heap_minimum = heap_minimum
         self._lock = threading.Lock()
-        self._used_heap = IntervalTree(accelerated=True)
-        free_block = supriya.realtime.Block(
-            start_offset=heap_minimum, stop_offset=heap_maximum, used=False
+        # Sorted (size, start) pairs of free blocks
+        self._free_by_size: List[Tuple[float, int]] = []
+        # Free block start -> stop, and stop -> start
+        self._free_by_start: Dict[int, float] = {}
+        self._free_by_stop: Dict[float, int] = {}
+        # Used block start -> stop
+        self._used_by_start: Dict[int, int] = {}
+        stop_offset = float("inf") if heap_maximum is None else heap_maximum
+        if heap_minimum < stop_offset:
+            self._add_free_block(heap_minimum, stop_offset)
+
+    ### PRIVATE METHODS ###
+
+    def _add_free_block(self, start_offset, stop_offset):
+        bisect.insort(self._free_by_size, (stop_offset - start_offset, start_offset))
+        self._free_by_start[start_offset] = stop_offset
+        self._free_by_stop[stop_offset] = start_offset
+
+    def _allocate(self, desired_block_size):
+        desired_block_size = int(desired_block_size)
+        assert 0 < desired_block_size
+        index = bisect.bisect_left(self._free_by_size, (desired_block_size,))
+        if index == len(self._free_by_size):
+            return None
+        size, start_offset = self._free_by_size.pop(index)
+        stop_offset = self._free_by_start.pop(start_offset)
+        del self._free_by_stop[stop_offset]
+        split_offset = start_offset + desired_block_size
+        if split_offset < stop_offset:
+            self._add_free_block(split_offset, stop_offset)
+        self._used_by_start[start_offset] = split_offset
+        return int(start_offset)
+
+    def _remove_free_block(self, start_offset):
+        stop_offset = self._free_by_start.pop(start_offset)
+        del self._free_by_stop[stop_offset]
+        index = bisect.bisect_left(
+            self._free_by_size, (stop_offset - start_offset, start_offset)
         )
-        self._free_heap.add(free_block)
+        del self._free_by_size[index]
+        return stop_offset
 
     ### PUBLIC METHODS ###
 
     def allocate(self, desired_block_size=1):
-        desired_block_size = int(desired_block_size)
-        assert 0 < desired_block_size
-        block_id = None
         with self._lock:
-            free_block = None
-            for block in self._free_heap:
-                if desired_block_size <= block.duration:
-                    free_block = block
-                    break
-            if free_block is not None:
-                split_offset = free_block.start_offset + desired_block_size
-                self._free_heap.remove(free_block)
-                if desired_block_size < free_block.duration:
-                    new_free_block = new(
-                        free_block, start_offset=split_offset, used=False
-                    )
-                    self._free_heap.add(new_free_block)
-                    used_block = new(free_block, stop_offset=split_offset, used=True)
-                else:
-                    used_block = new(free_block, used=True)
-                self._used_heap.add(used_block)
-                block_id = used_block.start_offset
-        if block_id is None:
-            return block_id
-        return int(block_id)
+            return self._allocate(desired_block_size)
 
     def allocate_at(self, index=None, desired_block_size=1):
-        import supriya.realtime
-
         index = int(index)
         desired_block_size = int(desired_block_size)
-        block_id = None
+        stop_index = index + desired_block_size
         with self._lock:
-            start_offset = index
-            stop_offset = index + desired_block_size
-            start_cursor = self._free_heap.get_moment_at(start_offset)
-            starting_blocks = sorted(
-                start_cursor.start_intervals + start_cursor.overlap_intervals
-            )
-            stop_cursor = self._free_heap.get_moment_at(stop_offset)
-            stop_blocks = sorted(
-                stop_cursor.overlap_intervals + stop_cursor.stop_intervals
-            )
-            if starting_blocks == stop_blocks:
-                assert len(starting_blocks) == 1
-                free_block = starting_blocks[0]
-                used_block = supriya.realtime.Block(
-                    start_offset=start_offset, stop_offset=stop_offset, used=True
-                )
-                self._used_heap.add(used_block)
-                self._free_heap.remove(free_block)
-                free_blocks = free_block - used_block
-                for free_block in free_blocks:
-                    self._free_heap.add(free_block)
-                block_id = index
-        if block_id is None:
-            return block_id
-        return int(block_id)
+            for start_offset, stop_offset in self._free_by_start.items():
+                if start_offset <= index and stop_index <= stop_offset:
+                    break
+            else:
+                return None
+            self._remove_free_block(start_offset)
+            if start_offset < index:
+                self._add_free_block(start_offset, index)
+            if stop_index < stop_offset:
+                self._add_free_block(stop_index, stop_offset)
+            self._used_by_start[index] = stop_index
+        return index
+
+    def allocate_many(self, desired_block_sizes):
+        """
+        Allocates a block for each of ``desired_block_sizes`` at once.
 
-    def free(self, block_id):
-        import supriya.realtime
+        Returns a list of block IDs, with ``None`` for each block which could
+        not be allocated.
+        """
+        with self._lock:
+            return [self._allocate(size) for size in desired_block_sizes]
 
+    def free(self, block_id):
         block_id = int(block_id)
         with self._lock:
-            cursor = self._used_heap.get_moment_at(block_id)
-            blocks = sorted(
-                set(cursor.start_intervals) or set(cursor.overlap_intervals)
-            )
-            assert len(blocks) == 1
-            used_block = blocks[0]
-            self._used_heap.remove(used_block)
-            start_offset = used_block.start_offset
-            stopping_blocks = self._free_heap.find_intervals_stopping_at(start_offset)
-            if stopping_blocks:
-                assert len(stopping_blocks) == 1
-                stopping_block = stopping_blocks[0]
-                self._free_heap.remove(stopping_block)
-                start_offset = stopping_block.start_offset
-            stop_offset = used_block.stop_offset
-            starting_blocks = self._free_heap.find_intervals_starting_at(stop_offset)
-            if starting_blocks:
-                assert len(starting_blocks) == 1
-                starting_block = starting_blocks[0]
-                self._free_heap.remove(starting_block)
-                stop_offset = starting_block.stop_offset
-            free_block = supriya.realtime.Block(
-                start_offset=start_offset, stop_offset=stop_offset, used=False
+            start_offset = block_id
+            stop_offset = self._used_by_start.pop(start_offset, None)
+            if stop_offset is None:
+                # Freeing from inside a block
+                blocks = [
+                    (start, stop)
+                    for start, stop in self._used_by_start.items()
+                    if start <= block_id < stop
+                ]
+                assert len(blocks) == 1
+                start_offset, stop_offset = blocks[0]
+                del self._used_by_start[start_offset]
+            previous_start_offset = self._free_by_stop.get(start_offset)
+            if previous_start_offset is not None:
+                self._remove_free_block(previous_start_offset)
+                start_offset = previous_start_offset
+            if stop_offset in self._free_by_start:
+                stop_offset = self._remove_free_block(stop_offset)
+            self._add_free_block(start_offset, stop_offset)
+
+    def statistics(self) -> BlockAllocatorStatistics:
+        """
+        Gets block counts, sizes and fragmentation of the heap.
+        """
+        with self._lock:
+            sizes = [size for size, _ in self._free_by_size]
+            used_size = sum(
+                stop - start for start, stop in self._used_by_start.items()
             )
-            self._free_heap.add(free_block)
+            used_block_count = len(self._used_by_start)
+        bounded_sizes = [size for size in sizes if size != float("inf")]
+        bounded_free_size = sum(bounded_sizes)
+        fragmentation = 0.0
+        if bounded_free_size:
+            fragmentation = 1 - max(bounded_sizes) / bounded_free_size
+        return BlockAllocatorStatistics(
+            free_block_count=len(sizes),
+            free_size=sum(sizes),
+            largest_free_block_size=max(sizes, default=0),
+            used_block_count=used_block_count,
+            used_size=used_size,
+            fragmentation=fragmentation,
+        )
 
     ### PUBLIC PROPERTIES ###
 
@@ -234,6 +296,30 @@ class NodeIdAllocator(SupriyaObject):
         >>> allocator.allocate_permanent_node_id()
         2
 
+    A thread can reserve node IDs in blocks, after which it allocates single
+    node IDs from its own block without taking the allocator's lock:
+
+    ::
+
+        >>> allocator.reserve_node_ids(4)
+        >>> for _ in range(5):
+        ...     allocator.allocate_node_id()
+        ...
+        1003
+        1004
+        1005
+        1006
+        1007
+
+    ::
+
+        >>> allocator.release_node_ids()
+        >>> allocator.allocate_node_id()
+        1011
+
+    Node IDs confirmed freed by the server, e.g. via ``/n_end``, are recycled
+    first-in first-out once more than ``recycling_threshold`` of them have
+    accumulated, or once fresh node IDs run out.
     """
 
     ### CLASS VARIABLES ###
@@ -241,18 +327,21 @@ class NodeIdAllocator(SupriyaObject):
     __documentation_section__ = "Server Internals"
 
     __slots__ = (
+        "_blocks",
         "_freed_permanent_ids",
         "_initial_node_id",
         "_lock",
         "_mask",
         "_next_permanent_id",
+        "_recycled_ids",
+        "_recycling_threshold",
         "_temp",
         "_client_id",
     )
 
     ### INITIALIZER ###
 
-    def __init__(self, client_id=0, initial_node_id=1000):
+    def __init__(self, client_id=0, initial_node_id=1000, recycling_threshold=65536):
         assert client_id <= 31
         self._initial_node_id = int(initial_node_id)
         self._client_id = int(client_id)
@@ -260,20 +349,55 @@ class NodeIdAllocator(SupriyaObject):
         self._temp = self._initial_node_id
         self._next_permanent_id = 1
         self._freed_permanent_ids = set()
+        self._recycled_ids = collections.deque()
+        self._recycling_threshold = int(recycling_threshold)
+        # Reserved blocks, by thread ident, as [node ID iterator, block size]
+        self._blocks = {}
         self._lock = threading.Lock()
 
+    ### PRIVATE METHODS ###
+
+    def _allocate_fresh_node_ids(self, count):
+        x = self._temp
+        temp = x + count
+        if 0x03FFFFFF < temp:
+            temp = (temp % 0x03FFFFFF) + self._initial_node_id
+        self._temp = temp
+        return x | self._mask
+
+    def _allocate_node_ids(self, count):
+        # Allocates ``count`` node IDs, not necessarily consecutive.
+        recyclable_count = len(self._recycled_ids) - self._recycling_threshold
+        if recyclable_count <= 0 and self._temp + count > 0x03FFFFFF:
+            recyclable_count = len(self._recycled_ids)
+        if 0 < recyclable_count:
+            count = min(count, recyclable_count)
+            return [self._recycled_ids.popleft() for _ in range(count)]
+        if 0x03FFFFFF <= self._temp:
+            self._temp = self._initial_node_id
+        count = min(count, 0x03FFFFFF - self._temp)
+        x = self._allocate_fresh_node_ids(count)
+        return range(x, x + count)
+
     ### PUBLIC METHODS ###
 
     def allocate_node_id(self, count=1):
-        x = None
+        if count == 1:
+            thread_id = threading.get_ident()
+            block = self._blocks.get(thread_id)
+            if block is not None:
+                x = next(block[0], None)
+                if x is not None:
+                    return x
+                with self._lock:
+                    # The block may have been released by another thread
+                    if self._blocks.get(thread_id) is block:
+                        block[0] = iter(self._allocate_node_ids(block[1]))
+                        return next(block[0])
         with self._lock:
-            x = self._temp
-            temp = x + count
-            if 0x03FFFFFF < temp:
-                temp = (temp % 0x03FFFFFF) + self._initial_node_id
-            self._temp = temp
-            x = x | self._mask
-        return x
+            if count == 1:
+                return self._allocate_node_ids(1)[0]
+            return self._allocate_fresh_node_ids(count)
 
     def allocate_permanent_node_id(self):
         x = None
@@ -287,8 +411,51 @@ class NodeIdAllocator(SupriyaObject):
             x = x | self._mask
         return x
 
+    def free_node_id(self, node_id):
+        """
+        Recycles a node ID the server has confirmed freed.
+
+        Node IDs allocated by other clients, and permanent node IDs, are
+        ignored.
+        """
+        if node_id & ~0x03FFFFFF != self._mask:
+            return
+        if node_id & 0x03FFFFFF < self._initial_node_id:
+            return
+        with self._lock:
+            self._recycled_ids.append(node_id)
+
     def free_permanent_node_id(self, node_id):
         with self._lock:
             node_id = node_id & 0x03FFFFFF
             if node_id < self._initial_node_id:
                 self._freed_permanent_ids.add(node_id)
+
+    def release_node_ids(self, thread_id=None):
+        """
+        Releases a thread's block of reserved node IDs.
+
+        Releases the calling thread's block unless ``thread_id`` is given.
+        Unused node IDs in the block are recycled.
+        """
+        if thread_id is None:
+            thread_id = threading.get_ident()
+        with self._lock:
+            block = self._blocks.pop(thread_id, None)
+            if block is not None:
+                self._recycled_ids.extend(block[0])
+
+    def reserve_node_ids(self, count=4096):
+        """
+        Reserves node IDs for the calling thread, ``count`` at a time.
+
+        Single node IDs allocated by the thread are then taken from its block,
+        without locking, and a new block is reserved whenever the block runs
+        out.
+        """
+        block = self._blocks.get(threading.get_ident())
+        if block is not None:
+            block[1] = int(count)
+            return
+        with self._lock:
+            self._blocks[threading.get_ident()] = [iter(()), int(count)]
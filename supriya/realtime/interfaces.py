@@ -1,6 +1,5 @@
 import abc
 import collections
-import copy
 import re
 from collections.abc import Iterable
 
@@ -135,7 +134,7 @@ class GroupControl:
         calculation_rates = sorted(
             set(
                 synth.controls[self.name].calculation_rate
-                for synth in self.client._synth_controls["amplitude"]
+                for synth in self.client._iterate_synths(self.name)
             )
         )
         return '<{}: {!r} "{}" [{}]>'.format(
@@ -211,19 +210,20 @@ class GroupInterface(ControlInterface):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_group_controls",)
+    __slots__ = ("_control_counts", "_group_controls")
 
     ### INITIALIZER ###
 
     def __init__(self, client=None):
-        self._synth_controls = {}
+        # Control name -> number of descendant synths with that control
+        self._control_counts = {}
         self._group_controls = {}
         self._client = client
 
     ### SPECIAL METHODS ###
 
     def __contains__(self, item):
-        return item in self._synth_controls
+        return item in self._control_counts
 
     def __getitem__(self, item):
         return self._group_controls[item]
@@ -243,13 +243,13 @@ class GroupInterface(ControlInterface):
 
         if not isinstance(items, tuple):
             items = (items,)
-        assert all(_ in self._synth_controls for _ in items)
+        assert all(_ in self._control_counts for _ in items)
         if not isinstance(values, tuple):
             values = (values,)
         assert len(items) == len(values)
         settings = dict(zip(items, values))
         for key, value in settings.items():
-            for synth in self._synth_controls.get(key, ()):
+            for synth in self._iterate_synths(key):
                 control = synth.controls[key]
                 if isinstance(value, supriya.realtime.Bus):
                     control._map_to_bus(value)
@@ -262,42 +262,67 @@ class GroupInterface(ControlInterface):
             server=self.client.server, sync=True
         )
 
+    ### PRIVATE METHODS ###
+
+    def _iterate_synths(self, control_name):
+        import supriya.realtime
+
+        if control_name not in self._control_counts:
+            return
+        # Depth-first, skipping groups with no synths counting the control
+        iterators = [iter(self.client)]
+        while iterators:
+            for node in iterators[-1]:
+                if isinstance(node, supriya.realtime.Group):
+                    if control_name in node._control_interface._control_counts:
+                        iterators.append(iter(node))
+                        break
+                elif node._control_interface._counts_control(control_name):
+                    yield node
+            else:
+                iterators.pop()
+
     ### PUBLIC METHODS ###
 
-    def add_controls(self, control_interface_dict):
+    def add_controls(self, control_counts):
+        """
+        Counts ``control_counts``, a mapping of control names to numbers of
+        synths, as descendants of this interface's group.
+        """
         import supriya.realtime
 
-        for control_name in control_interface_dict:
-            if control_name not in self._synth_controls:
-                self._synth_controls[control_name] = copy.copy(
-                    control_interface_dict[control_name]
-                )
+        for control_name, count in control_counts.items():
+            if control_name not in self._control_counts:
+                self._control_counts[control_name] = count
                 proxy = supriya.realtime.GroupControl(client=self, name=control_name)
                 self._group_controls[control_name] = proxy
             else:
-                self._synth_controls[control_name].update(
-                    control_interface_dict[control_name]
-                )
+                self._control_counts[control_name] += count
+
+    def as_counts(self):
+        return self._control_counts
 
     def as_dict(self):
         result = {}
-        for control_name, node_set in self._synth_controls.items():
-            result[control_name] = copy.copy(node_set)
+        for control_name in self._control_counts:
+            result[control_name] = set(self._iterate_synths(control_name))
         return result
 
-    def remove_controls(self, control_interface_dict):
-        for control_name in control_interface_dict:
-            if control_name not in self._synth_controls:
+    def remove_controls(self, control_counts):
+        """
+        Uncounts ``control_counts``, a mapping of control names to numbers of
+        synths, as descendants of this interface's group.
+        """
+        for control_name, count in control_counts.items():
+            if control_name not in self._control_counts:
                 continue
-            current_nodes = self._synth_controls[control_name]
-            nodes_to_remove = control_interface_dict[control_name]
-            current_nodes.difference_update(nodes_to_remove)
-            if not current_nodes:
-                del self._synth_controls[control_name]
+            self._control_counts[control_name] -= count
+            if self._control_counts[control_name] <= 0:
+                del self._control_counts[control_name]
                 del self._group_controls[control_name]
 
     def reset(self):
-        self._synth_controls.clear()
+        self._control_counts.clear()
 
 
 class SynthControl:
@@ -603,6 +628,12 @@ class SynthInterface(ControlInterface):
 
     ### PRIVATE METHODS ###
 
+    def _counts_control(self, control_name):
+        # Whether as_counts() includes ``control_name``, without building it
+        if self.client.register_controls is None or self.client.register_controls:
+            return control_name in self._synth_control_map
+        return False
+
     def _make_synth_new_settings(self):
         import supriya.commands
         import supriya.realtime
@@ -637,6 +668,11 @@ class SynthInterface(ControlInterface):
 
     ### PUBLIC METHODS ###
 
+    def as_counts(self):
+        if self.client.register_controls is None or self.client.register_controls:
+            return dict.fromkeys(self._synth_control_map, 1)
+        return {}
+
     def as_dict(self):
         result = {}
         if self.client.register_controls is None or self.client.register_controls:
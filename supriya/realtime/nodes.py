@@ -14,6 +14,228 @@ from supriya.enums import AddAction, NodeAction
 from .bases import ServerObject
 
 
+class GroupChildren:
+    """
+    A group's children, in order.
+
+    Children are kept in a doubly linked list, indexed by a dictionary of
+    links, making membership tests, removal and insertion relative to another
+    child O(1). Positional access goes through a list of the children, built
+    on demand and patched in place by positional edits.
+
+    ::
+
+        >>> from supriya.realtime.nodes import GroupChildren
+        >>> children = GroupChildren(["a", "c"])
+        >>> children.insert_after("a", "b")
+        >>> children.remove("c")
+        >>> list(children), "b" in children, children.index("b")
+        (['a', 'b'], True, 1)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_head", "_links", "_list", "_positions", "_tail")
+
+    ### INITIALIZER ###
+
+    def __init__(self, children=None):
+        self._head = None
+        self._links = {}
+        self._list = None
+        self._positions = None
+        self._tail = None
+        for child in children or ():
+            self.append(child)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, child):
+        return child in self._links
+
+    def __delitem__(self, i):
+        if not isinstance(i, slice):
+            self.remove(self[i])
+            return
+        start, stop, stride = i.indices(len(self))
+        if stride != 1:
+            for child in self[i]:
+                self.remove(child)
+            return
+        if stop <= start:
+            return
+        child = self._get_child(start)
+        for _ in range(stop - start):
+            child = self._unlink(child)[1]
+        self._splice_list(start, stop, ())
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, stride = i.indices(len(self))
+            if stride == 1 and stop <= start:
+                return []
+            return self._get_list()[i]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._get_child(i)
+
+    def __iter__(self):
+        child = self._head
+        while child is not None:
+            next_child = self._links[child][1]
+            yield child
+            child = next_child
+
+    def __len__(self):
+        return len(self._links)
+
+    def __repr__(self):
+        return "{}({!r})".format(type(self).__name__, list(self))
+
+    def __reversed__(self):
+        child = self._tail
+        while child is not None:
+            previous_child = self._links[child][0]
+            yield child
+            child = previous_child
+
+    def __setitem__(self, i, expr):
+        if not isinstance(i, slice):
+            self.replace(self[i], expr)
+            return
+        start, stop, stride = i.indices(len(self))
+        expr = list(expr)
+        if stride != 1:
+            children = list(self)
+            children[i] = expr
+            self._reset(children)
+            return
+        previous_child = self._get_child(start - 1) if start else None
+        del self[start:stop]
+        for child in expr:
+            if previous_child is None:
+                self._link(child, None, self._head)
+            else:
+                self._link(child, previous_child, self._links[previous_child][1])
+            previous_child = child
+        self._splice_list(start, start, expr)
+
+    ### PRIVATE METHODS ###
+
+    def _get_child(self, i):
+        # Either end is O(1), anything else goes through the positional list.
+        if i == 0:
+            return self._head
+        elif i == len(self._links) - 1:
+            return self._tail
+        return self._get_list()[i]
+
+    def _get_list(self):
+        if self._list is None:
+            self._list = list(self)
+        return self._list
+
+    def _link(self, child, previous_child, next_child):
+        if child in self._links:
+            raise ValueError(child)
+        self._links[child] = [previous_child, next_child]
+        if previous_child is None:
+            self._head = child
+        else:
+            self._links[previous_child][1] = child
+        if next_child is None:
+            self._tail = child
+        else:
+            self._links[next_child][0] = child
+
+    def _reset(self, children):
+        self._head = self._tail = None
+        self._links.clear()
+        self._list = self._positions = None
+        for child in children:
+            self.append(child)
+
+    def _splice_list(self, start, stop, children):
+        # Patch the positional list after relinking; indices only survive
+        # edits at the tail.
+        if self._list is None:
+            return
+        if self._positions is not None and stop == len(self._list):
+            for child in self._list[start:stop]:
+                del self._positions[child]
+            for i, child in enumerate(children, start):
+                self._positions[child] = i
+        else:
+            self._positions = None
+        self._list[start:stop] = children
+
+    def _unlink(self, child):
+        previous_child, next_child = self._links.pop(child)
+        if previous_child is None:
+            self._head = next_child
+        else:
+            self._links[previous_child][1] = next_child
+        if next_child is None:
+            self._tail = previous_child
+        else:
+            self._links[next_child][0] = previous_child
+        return previous_child, next_child
+
+    ### PUBLIC METHODS ###
+
+    def append(self, child):
+        self._link(child, self._tail, None)
+        self._splice_list(len(self) - 1, len(self) - 1, (child,))
+
+    def index(self, child):
+        if child not in self._links:
+            raise ValueError(child)
+        if self._positions is None:
+            self._positions = {x: i for i, x in enumerate(self._get_list())}
+        return self._positions[child]
+
+    def insert(self, i, child):
+        self[i:i] = (child,)
+
+    def insert_after(self, previous_child, child):
+        self._link(child, previous_child, self._links[previous_child][1])
+        self._list = self._positions = None
+
+    def insert_before(self, next_child, child):
+        self._link(child, self._links[next_child][0], next_child)
+        self._list = self._positions = None
+
+    def insert_head(self, child):
+        self._link(child, None, self._head)
+        self._splice_list(0, 0, (child,))
+
+    def pop(self, i=-1):
+        child = self[i]
+        self.remove(child)
+        return child
+
+    def remove(self, child):
+        previous_child, next_child = self._unlink(child)
+        if next_child is None:
+            self._splice_list(len(self), len(self) + 1, ())
+        elif previous_child is None:
+            self._splice_list(0, 1, ())
+        else:
+            self._list = self._positions = None
+
+    def replace(self, old_child, child):
+        previous_child, next_child = self._unlink(old_child)
+        self._link(child, previous_child, next_child)
+        if self._list is not None and self._positions is not None:
+            i = self._positions[child] = self._positions.pop(old_child)
+            self._list[i] = child
+        else:
+            self._list = self._positions = None
+
+
 class Node(ServerObject, UniqueTreeNode):
 
     ### CLASS VARIABLES ###
@@ -143,8 +365,8 @@ class Node(ServerObject, UniqueTreeNode):
     def _as_node_target(self):
         return self
 
-    def _cache_control_interface(self):
-        return self._control_interface.as_dict()
+    def _get_control_counts(self):
+        return self._control_interface.as_counts()
 
     @staticmethod
     def _expr_as_target(expr):
@@ -184,31 +406,17 @@ class Node(ServerObject, UniqueTreeNode):
         elif response.action == NodeAction.NODE_MOVED:
             new_parent = self.server._nodes[response.parent_id]
             if new_parent is self.parent:
-                new_index = 0
-                if response.previous_node_id is not None:
-                    previous_node = self.server._nodes[response.previous_node_id]
-                    new_index = new_parent.index(previous_node) + 1
-                elif response.next_node_id is not None:
-                    next_node = self.server._nodes[response.next_node_id]
-                    new_index = new_parent.index(next_node)
-                old_index = self.parent.index(self)
-                if new_index != self.parent.index(self):
-                    if new_index < old_index:
-                        self.parent._children.remove(self)
-                        self.parent._children.insert(new_index, self)
-                    else:
-                        self.parent._children.insert(new_index, self)
-                        self.parent._children.pop(old_index)
+                new_parent._children.remove(self)
             else:
                 self._set_parent(new_parent)
-                index = 0
-                if response.previous_node_id is not None:
-                    previous_node = self.server._nodes[response.previous_node_id]
-                    index = new_parent.index(previous_node) + 1
-                elif response.next_node_id is not None:
-                    next_node = self.server._nodes[response.next_node_id]
-                    index = new_parent.index(next_node)
-                new_parent._children.insert(index, self)
+            if response.previous_node_id is not None:
+                previous_node = self.server._nodes[response.previous_node_id]
+                new_parent._children.insert_after(previous_node, self)
+            elif response.next_node_id is not None:
+                next_node = self.server._nodes[response.next_node_id]
+                new_parent._children.insert_before(next_node, self)
+            else:
+                new_parent._children.insert_head(self)
 
     def _move_node(self, *, add_action, node):
         target_node = self
@@ -218,18 +426,15 @@ class Node(ServerObject, UniqueTreeNode):
             parent_node = target_node._parent
         node._set_parent(parent_node)
         if add_action == AddAction.ADD_TO_HEAD:
-            parent_node._children.insert(0, node)
+            parent_node._children.insert_head(node)
         elif add_action == AddAction.ADD_TO_TAIL:
             parent_node._children.append(node)
         elif add_action == AddAction.ADD_BEFORE:
-            index = parent_node.index(target_node)
-            parent_node._children.insert(index, node)
+            parent_node._children.insert_before(target_node, node)
         elif add_action == AddAction.ADD_AFTER:
-            index = parent_node.index(target_node)
-            parent_node._children.insert(index + 1, node)
+            parent_node._children.insert_after(target_node, node)
         elif add_action == AddAction.REPLACE:
-            index = parent_node.index(target_node)
-            parent_node._children[index] = node
+            parent_node._children.replace(target_node, node)
             target_node._set_parent(None)
             target_node._unregister_with_local_server()
 
@@ -250,17 +455,17 @@ class Node(ServerObject, UniqueTreeNode):
         self._server._nodes[self._node_id] = self
         return node_id
 
-    def _remove_control_interface_from_parentage(self, old_parent, name_dictionary):
-        if old_parent is None or not name_dictionary:
+    def _remove_control_interface_from_parentage(self, old_parent, control_counts):
+        if old_parent is None or not control_counts:
             return
         for parent in old_parent.parentage:
-            parent._control_interface.remove_controls(name_dictionary)
+            parent._control_interface.remove_controls(control_counts)
 
-    def _restore_control_interface_to_parentage(self, new_parent, name_dictionary):
-        if new_parent is None or not name_dictionary:
+    def _restore_control_interface_to_parentage(self, new_parent, control_counts):
+        if new_parent is None or not control_counts:
             return
         for parent in new_parent.parentage:
-            parent._control_interface.add_controls(name_dictionary)
+            parent._control_interface.add_controls(control_counts)
 
     def _run(self, run_flag):
         self._is_paused = not bool(run_flag)
@@ -268,13 +473,13 @@ class Node(ServerObject, UniqueTreeNode):
     def _set_parent(self, new_parent):
         old_parent = self._parent
         named_children = self._cache_named_children()
-        control_interface = self._cache_control_interface()
+        control_counts = self._get_control_counts()
         self._remove_from_parent()
         self._remove_named_children_from_parentage(old_parent, named_children)
-        self._remove_control_interface_from_parentage(old_parent, control_interface)
+        self._remove_control_interface_from_parentage(old_parent, control_counts)
         self._parent = new_parent
         self._restore_named_children_to_parentage(new_parent, named_children)
-        self._restore_control_interface_to_parentage(new_parent, control_interface)
+        self._restore_control_interface_to_parentage(new_parent, control_counts)
 
     def _unregister_with_local_server(self):
         node_id = self.node_id
@@ -548,10 +753,18 @@ class Group(Node, UniqueTreeList):
 
         self._control_interface = supriya.realtime.GroupInterface(client=self)
         Node.__init__(self, name=name, node_id_is_permanent=node_id_is_permanent)
-        UniqueTreeList.__init__(self, children=children, name=name)
+        UniqueTreeList.__init__(self, name=name)
+        self._children = GroupChildren()
+        if children is not None:
+            self[:] = children
 
     ### SPECIAL METHODS ###
 
+    def __contains__(self, expr):
+        if isinstance(expr, str):
+            return expr in self._named_children
+        return expr in self._children
+
     def __graph__(self):
         graph = super().__graph__()
         parent_node = graph[self._get_graphviz_name()]
@@ -793,6 +1006,12 @@ class Group(Node, UniqueTreeList):
         Node.free(self)
         return self
 
+    def index(self, expr):
+        try:
+            return self._children.index(expr)
+        except ValueError:
+            raise ValueError(f"{expr!r} not in {self!r}.")
+
     ### PUBLIC PROPERTIES ###
 
     @property
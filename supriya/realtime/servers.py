@@ -42,7 +42,7 @@ class BaseServer:
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(self, *, coalesce_window=None):
         # address
         self._ip_address = None
         self._port = None
@@ -53,6 +53,7 @@ class BaseServer:
         self._latency = 0.1
         self._maximum_logins = None
         self._options = Options()
+        self._coalesce_window = coalesce_window
         self._osc_protocol = None
         self._process_protocol = None
         self._status = None
@@ -166,6 +167,10 @@ class BaseServer:
     def client_id(self):
         return self._client_id
 
+    @property
+    def coalesce_window(self):
+        return self._coalesce_window
+
     @property
     def control_bus_allocator(self):
         return self._control_bus_allocator
@@ -233,8 +238,8 @@ class AsyncServer(BaseServer):
 
     ### INTIALIZER ###
 
-    def __init__(self):
-        BaseServer.__init__(self)
+    def __init__(self, *, coalesce_window=None):
+        BaseServer.__init__(self, coalesce_window=coalesce_window)
         self._boot_future = None
         self._quit_future = None
 
@@ -250,7 +255,7 @@ class AsyncServer(BaseServer):
     ### PRIVATE METHODS ###
 
     async def _connect(self):
-        self._osc_protocol = AsyncOscProtocol()
+        self._osc_protocol = AsyncOscProtocol(coalesce_window=self._coalesce_window)
         await self._osc_protocol.connect(
             ip_address=self._ip_address,
             port=self._port,
@@ -413,6 +418,27 @@ class Server(BaseServer):
         >>> server.quit()
         <Server: offline>
 
+    With ``mirror_nodes=False`` the server does not mirror the remote node
+    tree as ``Group`` and ``Synth`` objects. It only tracks which node IDs are
+    live, from ``/n_go`` and ``/n_end`` notifications. Query the remote tree
+    on demand via ``query_remote_nodes()``.
+
+    ::
+
+        >>> server = supriya.realtime.Server(mirror_nodes=False).boot()
+        >>> server.is_node_live(1)
+        True
+
+    ::
+
+        >>> server.quit()
+        <Server: offline>
+
+    With ``batch_size``, replies are received in batches of up to that many
+    datagrams per wakeup. With ``coalesce_window``, outgoing messages are
+    coalesced into bundles for up to that many seconds, or until a ``/sync``
+    or a bundle due sooner. See ``ThreadedOscProtocol``.
+
     """
 
     ### CLASS VARIABLES ###
@@ -425,9 +451,12 @@ class Server(BaseServer):
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        BaseServer.__init__(self)
+    def __init__(self, *, mirror_nodes=True, batch_size=None, coalesce_window=None):
+        BaseServer.__init__(self, coalesce_window=coalesce_window)
+        self._batch_size = batch_size
         self._lock = threading.RLock()
+        self._mirror_nodes = bool(mirror_nodes)
+        self._live_node_ids: Set[int] = set()
         # proxies
         self._audio_input_bus_group = None
         self._audio_output_bus_group = None
@@ -609,7 +638,9 @@ class Server(BaseServer):
         return self.default_group
 
     def _connect(self):
-        self._osc_protocol = ThreadedOscProtocol()
+        self._osc_protocol = ThreadedOscProtocol(
+            batch_size=self._batch_size, coalesce_window=self._coalesce_window
+        )
         self._osc_protocol.connect(
             ip_address=self.ip_address,
             port=self.port,
@@ -719,10 +750,30 @@ class Server(BaseServer):
                 node._set_parent(parent)
                 if response.previous_node_id:
                     previous_child = self._nodes[response.previous_node_id]
-                    index = parent.index(previous_child)
-                    parent._children.insert(index + 1, node)
+                    parent._children.insert_after(previous_child, node)
                 else:
                     parent._children.append(node)
+            if (
+                response.action == NodeAction.NODE_REMOVED
+                and self._node_id_allocator is not None
+            ):
+                self._node_id_allocator.free_node_id(node_id)
+
+    def _handle_node_liveness_response(self, message):
+        node_id = message.contents[0]
+        if message.address == "/n_go":
+            self._live_node_ids.add(node_id)
+        else:
+            self._live_node_ids.discard(node_id)
+            # Nodes allocated through Synth/Group objects are still
+            # registered locally, and must not outlive their node IDs.
+            with self._lock:
+                node = self._nodes.get(node_id)
+                if node is not None:
+                    node._set_parent(None)
+                    node._unregister_with_local_server()
+            if self._node_id_allocator is not None:
+                self._node_id_allocator.free_node_id(node_id)
 
     def _handle_synthdef_removed_response(self, message):
         from supriya.commands import Response
@@ -779,6 +830,7 @@ class Server(BaseServer):
         self._audio_output_bus_group = supriya.realtime.AudioOutputBusGroup(self)
         self._root_node = supriya.realtime.RootNode(server=self)
         self._nodes[0] = self._root_node
+        self._live_node_ids.add(0)
 
     def _setup_osc_callbacks(self):
         super()._setup_osc_callbacks()
@@ -791,6 +843,12 @@ class Server(BaseServer):
         self._osc_protocol.register(
             pattern="/c_setn", procedure=self._handle_control_bus_setn_response,
         )
+        if not self._mirror_nodes:
+            for pattern in ("/n_end", "/n_go"):
+                self._osc_protocol.register(
+                    pattern=pattern, procedure=self._handle_node_liveness_response,
+                )
+            return
         for pattern in (
             "/n_end",
             "/n_go",
@@ -843,6 +901,7 @@ class Server(BaseServer):
         self._control_buses.clear()
         self._control_bus_proxies.clear()
         self._default_group = None
+        self._live_node_ids.clear()
         self._nodes.clear()
         self._root_node = None
         self._synthdefs.clear()
@@ -1014,7 +1073,12 @@ class Server(BaseServer):
         self._connect()
         if self.client_id > 0:
             self._setup_system_synthdefs(local_only=True)
-            self._rehydrate()
+            if self._mirror_nodes:
+                self._rehydrate()
+            else:
+                Group()._register_with_local_server(
+                    node_id=self.client_id + 1, server=self
+                )
         self._default_group = self._nodes[self.client_id + 1]
         return self
 
@@ -1052,6 +1116,18 @@ class Server(BaseServer):
             cls._default_server = Server()
         return cls._default_server
 
+    def is_node_live(self, node_id) -> bool:
+        """
+        Is ``node_id`` live on the server?
+
+        Without node mirroring this reflects ``/n_go`` and ``/n_end``
+        notifications received so far.
+        """
+        node_id = int(node_id)
+        if self._mirror_nodes:
+            return node_id in self._nodes
+        return node_id in self._live_node_ids
+
     def query(self, include_controls=True):
         return self.query_remote_nodes(include_controls=include_controls)
 
@@ -1197,6 +1273,10 @@ class Server(BaseServer):
     def audio_output_bus_group(self):
         return self._audio_output_bus_group
 
+    @property
+    def batch_size(self):
+        return self._batch_size
+
     @property
     def default_group(self):
         return self._default_group
@@ -1205,6 +1285,10 @@ class Server(BaseServer):
     def meters(self):
         return self._meters
 
+    @property
+    def mirror_nodes(self) -> bool:
+        return self._mirror_nodes
+
     @property
     def recorder(self):
         return self._recorder
@@ -252,3 +252,78 @@ class SoundFile(SupriyaObject):
     @property
     def sample_width(self):
         return self._sample_width
+
+
+def _crossfade(tail, head, channel_count, sample_width, endianness):
+    frame_size = channel_count * sample_width
+    frame_count = min(len(tail), len(head)) // frame_size
+    maximum = 2 ** (sample_width * 8 - 1)
+    result = bytearray()
+    for frame in range(frame_count):
+        fade = frame / frame_count
+        for channel in range(channel_count):
+            index = frame * frame_size + channel * sample_width
+            a = int.from_bytes(
+                tail[index : index + sample_width], endianness, signed=True
+            )
+            b = int.from_bytes(
+                head[index : index + sample_width], endianness, signed=True
+            )
+            value = min(max(round(a + (b - a) * fade), -maximum), maximum - 1)
+            result += value.to_bytes(sample_width, endianness, signed=True)
+    return bytes(result)
+
+
+def join_soundfiles(output_file_path, regions, crossfade_frame_count=0):
+    """
+    Joins regions of soundfiles end to end into ``output_file_path``.
+
+    ``regions`` is a sequence of ``(file_path, start_frame, frame_count)``
+    triples, naming AIFF or WAV files which share a channel count, sample
+    rate and sample width. A ``frame_count`` of ``None`` reads to the end of
+    the file.
+
+    With ``crossfade_frame_count``, each region but the last also reads that
+    many frames past its end, crossfading them linearly into the start of
+    the next region.
+    """
+    openers = {"aifc": aifc.open, "aiff": aifc.open, "wav": wave.open}
+    file_type = SoundFile(regions[0][0]).file_type
+    if file_type not in openers:
+        raise ValueError(file_type)
+    opener = openers[file_type]
+    endianness = "little" if file_type == "wav" else "big"
+    tail = b""
+    with opener(str(output_file_path), "wb") as writer:
+        for i, (file_path, start_frame, frame_count) in enumerate(regions):
+            with opener(str(file_path), "rb") as reader:
+                channel_count = reader.getnchannels()
+                sample_width = reader.getsampwidth()
+                frame_size = channel_count * sample_width
+                if not i:
+                    if file_type == "aiff":
+                        writer.aiff()
+                    writer.setparams(reader.getparams())
+                    if crossfade_frame_count and sample_width < 2:
+                        raise ValueError(
+                            f"Cannot crossfade sample width {sample_width * 8}"
+                        )
+                reader.setpos(min(start_frame, reader.getnframes()))
+                remaining = reader.getnframes() - reader.tell()
+                if frame_count is not None:
+                    remaining = min(frame_count, remaining)
+                if tail:
+                    head = reader.readframes(min(len(tail) // frame_size, remaining))
+                    writer.writeframes(
+                        _crossfade(tail, head, channel_count, sample_width, endianness)
+                    )
+                    remaining -= len(head) // frame_size
+                while remaining > 0:
+                    frames = reader.readframes(min(remaining, 65536))
+                    if not frames:
+                        break
+                    writer.writeframes(frames)
+                    remaining -= len(frames) // frame_size
+                tail = b""
+                if crossfade_frame_count and i < len(regions) - 1:
+                    tail = reader.readframes(crossfade_frame_count)
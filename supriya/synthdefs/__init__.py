@@ -14,6 +14,7 @@ from .bases import (
     WidthFirstUGen,
 )
 from .builders import SynthDefBuilder
+from .caches import SynthDefCache
 from .compilers import SynthDefCompiler, SynthDefDecompiler
 from .controls import (
     AudioControl,
@@ -26,7 +27,7 @@ from .controls import (
 from .envelopes import Envelope
 from .factories import SynthDefFactory
 from .grapher import SynthDefGrapher
-from .synthdefs import SuperColliderSynthDef, SynthDef, UGenSortBundle
+from .synthdefs import SuperColliderSynthDef, SynthDef
 
 __all__ = [
     "AudioControl",
@@ -44,6 +45,7 @@ __all__ = [
     "SuperColliderSynthDef",
     "SynthDef",
     "SynthDefBuilder",
+    "SynthDefCache",
     "SynthDefCompiler",
     "SynthDefDecompiler",
     "SynthDefFactory",
@@ -53,7 +55,6 @@ __all__ = [
     "UGenArray",
     "UGenMeta",
     "UGenMethodMixin",
-    "UGenSortBundle",
     "UnaryOpUGen",
     "WidthFirstUGen",
 ]
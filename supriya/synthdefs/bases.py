@@ -1,5 +1,6 @@
 import abc
 import collections
+import functools
 import inspect
 from collections.abc import Iterable, Sequence
 from typing import Optional, Tuple
@@ -13,6 +14,76 @@ from supriya.typing import UGenInputMap
 from .mixins import UGenMethodMixin
 
 
+class LazyUGenMethod:
+    """
+    A generated UGen method, compiled on first access.
+
+    Rendering and compiling the ``__init__`` and rate constructors of every
+    UGen class dominates ``import supriya.ugens``, so ``UGenMeta`` installs one
+    of these in their place. On first access the method is compiled and
+    replaces this descriptor on its owning class.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __isabstractmethod__ = False
+
+    __slots__ = ("_factory", "_is_ready", "_name", "_owner", "_source_name")
+
+    ### INITIALIZER ###
+
+    def __init__(self, factory, source_name):
+        self._factory = factory
+        self._is_ready = False
+        self._name = None
+        self._owner = None
+        self._source_name = source_name
+
+    ### SPECIAL METHODS ###
+
+    def __get__(self, instance, owner=None):
+        # ABCMeta inspects inherited abstract methods while the owning class is
+        # still being created; don't compile anything for it.
+        if not self._is_ready:
+            return self
+        return self._compile().__get__(instance, owner)
+
+    def __set_name__(self, owner, name):
+        self._owner = owner
+        self._name = name
+
+    ### PRIVATE METHODS ###
+
+    def _compile(self):
+        function, string = self._factory()
+        setattr(self._owner, self._name, function)
+        setattr(self._owner, self._source_name, string)
+        return function
+
+
+class LazyUGenMethodSource:
+    """
+    The generated source of a ``LazyUGenMethod``, compiled on first access.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_method",)
+
+    ### INITIALIZER ###
+
+    def __init__(self, method):
+        self._method = method
+
+    ### SPECIAL METHODS ###
+
+    def __get__(self, instance, owner=None):
+        if not self._method._is_ready:
+            return self
+        self._method._compile()
+        return getattr(self._method._owner, self._method._source_name)
+
+
 class UGenMeta(abc.ABCMeta):
 
     initializer_template = uqbar.strings.normalize(
@@ -76,6 +147,7 @@ class UGenMeta(abc.ABCMeta):
             default_channel_count,
             has_settable_channel_count,
         ) = UGenMeta.get_channel_count(namespace, bases)
+        lazy_methods = []
         if isinstance(ordered_input_names, collections.OrderedDict):
             for name in ordered_input_names:
                 if name in namespace:
@@ -86,7 +158,8 @@ class UGenMeta(abc.ABCMeta):
                     unexpanded=name in unexpanded_input_names,
                 )
             if "__init__" not in namespace:
-                function, string = UGenMeta.make_initializer(
+                factory = functools.partial(
+                    UGenMeta.make_initializer,
                     ugen_name=class_name,
                     bases=bases,
                     parameters=ordered_input_names.copy(),
@@ -94,8 +167,11 @@ class UGenMeta(abc.ABCMeta):
                     default_channel_count=default_channel_count,
                     has_settable_channel_count=has_settable_channel_count,
                 )
-                namespace["__init__"] = function
-                namespace["_init_source"] = string
+                lazy_methods.append(
+                    UGenMeta.add_lazy_method(
+                        namespace, "__init__", "_init_source", factory
+                    )
+                )
             constructor_rates = {}
             if valid_calculation_rates:
                 for rate in valid_calculation_rates:
@@ -105,7 +181,8 @@ class UGenMeta(abc.ABCMeta):
             elif "new" not in namespace:
                 constructor_rates["new"] = None
             for name, rate in constructor_rates.items():
-                function, string = UGenMeta.make_constructor(
+                factory = functools.partial(
+                    UGenMeta.make_constructor,
                     ugen_name=class_name,
                     bases=bases,
                     rate=rate,
@@ -113,9 +190,22 @@ class UGenMeta(abc.ABCMeta):
                     default_channel_count=default_channel_count,
                     has_settable_channel_count=has_settable_channel_count,
                 )
-                namespace[name] = function
-                namespace["_{}_source".format(name)] = string
-        return super().__new__(metaclass, class_name, bases, namespace)
+                lazy_methods.append(
+                    UGenMeta.add_lazy_method(
+                        namespace, name, "_{}_source".format(name), factory
+                    )
+                )
+        class_ = super().__new__(metaclass, class_name, bases, namespace)
+        for lazy_method in lazy_methods:
+            lazy_method._is_ready = True
+        return class_
+
+    @staticmethod
+    def add_lazy_method(namespace, name, source_name, factory):
+        lazy_method = LazyUGenMethod(factory, source_name)
+        namespace[name] = lazy_method
+        namespace[source_name] = LazyUGenMethodSource(lazy_method)
+        return lazy_method
 
     @staticmethod
     def get_channel_count(namespace, bases):
@@ -624,22 +714,6 @@ class UGen(UGenMethodMixin, metaclass=UGenMeta):
         ugen = cls(**kwargs)
         return ugen
 
-    def _optimize_graph(self, sort_bundles):
-        if self._is_pure:
-            self._perform_dead_code_elimination(sort_bundles)
-
-    def _perform_dead_code_elimination(self, sort_bundles):
-        sort_bundle = sort_bundles.get(self, None)
-        if not sort_bundle or sort_bundle.descendants:
-            return
-        del sort_bundles[self]
-        for antecedent in tuple(sort_bundle.antecedents):
-            antecedent_bundle = sort_bundles.get(antecedent, None)
-            if not antecedent_bundle:
-                continue
-            antecedent_bundle.descendants.remove(self)
-            antecedent._optimize_graph(sort_bundles)
-
     def _validate_inputs(self):
         pass
 
@@ -649,6 +723,10 @@ class UGen(UGenMethodMixin, metaclass=UGenMeta):
     def _has_done_action(self):
         return "done_action" in self._ordered_input_names
 
+    @property
+    def _is_deduplicable(self):
+        return self._is_pure
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -835,11 +913,6 @@ class PureUGen(UGen):
 
     _is_pure = True
 
-    ### PRIVATE METHODS ###
-
-    def _optimize_graph(self, sort_bundles):
-        self._perform_dead_code_elimination(sort_bundles)
-
 
 class PureMultiOutUGen(MultiOutUGen):
     """
@@ -853,10 +926,7 @@ class PureMultiOutUGen(MultiOutUGen):
 
     __documentation_section__ = None
 
-    ### PRIVATE METHODS ###
-
-    def _optimize_graph(self, sort_bundles):
-        self._perform_dead_code_elimination(sort_bundles)
+    _is_pure = True
 
 
 class WidthFirstUGen(UGen):
@@ -914,6 +984,19 @@ class UnaryOpUGen(PureUGen):
             special_index=special_index,
         )
 
+    ### PRIVATE PROPERTIES ###
+
+    @property
+    def _is_deduplicable(self):
+        return self.special_index not in (
+            UnaryOperator.BILINRAND,
+            UnaryOperator.COIN,
+            UnaryOperator.LINRAND,
+            UnaryOperator.RAND,
+            UnaryOperator.RAND2,
+            UnaryOperator.SUM3RAND,
+        )
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1016,6 +1099,15 @@ class BinaryOpUGen(PureUGen):
         )
         return ugen
 
+    ### PRIVATE PROPERTIES ###
+
+    @property
+    def _is_deduplicable(self):
+        return self.special_index not in (
+            BinaryOperator.EXPRANDRANGE,
+            BinaryOperator.RANDRANGE,
+        )
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -57,7 +57,8 @@ class SynthDefBuilder(SupriyaObject):
         self._name = name
         self._uuid = uuid.uuid4()
         self._parameters = collections.OrderedDict()
-        self._ugens = []
+        # An insertion-ordered dict, for constant-time membership tests.
+        self._ugens = {}
         for key, value in kwargs.items():
             self._add_parameter(key, value)
 
@@ -91,8 +92,7 @@ class SynthDefBuilder(SupriyaObject):
             if isinstance(ugen, supriya.synthdefs.OutputProxy):
                 ugen = ugen.source
             assert ugen._uuid == self._uuid
-            if ugen not in self._ugens:
-                self._ugens.append(ugen)
+            self._ugens.setdefault(ugen, None)
 
     def _add_parameter(self, *args):
         # TODO: Refactor without *args for clarity
@@ -133,7 +133,7 @@ class SynthDefBuilder(SupriyaObject):
 
     ### PUBLIC METHODS ###
 
-    def build(self, name=None, optimize=True):
+    def build(self, name=None, optimize=True, deduplicate=False):
         import supriya.synthdefs
         import supriya.ugens
 
@@ -142,11 +142,11 @@ class SynthDefBuilder(SupriyaObject):
         # Control subclasses from being aggregated into SynthDefBuilders in
         # the first place.
 
-        self._ugens[:] = [
-            ugen
+        self._ugens = {
+            ugen: None
             for ugen in self._ugens
             if not isinstance(ugen, supriya.synthdefs.Control)
-        ]
+        }
         name = self.name or name
         with self:
             ugens = list(self._parameters.values()) + list(self._ugens)
@@ -159,7 +159,9 @@ class SynthDefBuilder(SupriyaObject):
             ) = supriya.synthdefs.SynthDef._build_control_mapping(parameters)
             supriya.synthdefs.SynthDef._remap_controls(ugens, control_mapping)
             ugens = control_ugens + ugens
-            synthdef = supriya.synthdefs.SynthDef(ugens, name=name, optimize=optimize)
+            synthdef = supriya.synthdefs.SynthDef(
+                ugens, name=name, optimize=optimize, deduplicate=deduplicate
+            )
         return synthdef
 
     def poll_ugen(self, ugen, label=None, trigger=None, trigger_id=-1):
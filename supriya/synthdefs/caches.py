@@ -0,0 +1,297 @@
+import collections
+import hashlib
+import os
+import pathlib
+import struct
+import tempfile
+import threading
+
+import supriya
+from supriya.system import SupriyaObject
+
+from .bases import UGen
+from .compilers import SynthDefCompiler, SynthDefDecompiler
+from .controls import Control
+from .mixins import OutputProxy
+
+
+class SynthDefCache(SupriyaObject):
+    """
+    A size-bounded, content-addressed cache of compiled SynthDefs.
+
+    SynthDefs are keyed by a hash of the ugen graph they are built from, taken
+    before the graph is copied, optimized, sorted or compiled. Constructing a
+    SynthDef from a graph already in the cache reuses the cached SynthDef's
+    ugens, constants, parameters, compiled bytes and anonymous name instead of
+    rebuilding them.
+
+    The least-recently-used SynthDef is evicted once more than
+    ``maximum_size`` are held.
+
+    When ``directory_path`` is set, e.g. to ``supriya.output_path / "synthdefs"``,
+    compiled SynthDefs are also written there as ``.scsyndef`` files, named
+    both on disk and internally by graph hash. A SynthDef missing from memory
+    but present on disk is decompiled from its file instead of being built,
+    skipping copying, optimizing, sorting and compiling its graph. Files whose
+    internal name does not match their graph hash are ignored. Graph hashes
+    include the supriya version and the cache's format version, so files
+    written by another release are never read back.
+
+    SynthDef only consults a cache once one is installed via ``set_default()``.
+
+    ::
+
+        >>> import supriya.synthdefs
+        >>> import supriya.ugens
+        >>> cache = supriya.synthdefs.SynthDefCache(maximum_size=8)
+        >>> with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        ...     sin_osc = supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+        ...     out = supriya.ugens.Out.ar(bus=0, source=sin_osc)
+        ...
+        >>> synthdef = builder.build()
+        >>> key = cache.hash_ugen_graph(synthdef.ugens)
+        >>> cache.put(key, synthdef)
+        >>> cache.get(key) is synthdef
+        True
+
+    ::
+
+        >>> cache.hits, cache.misses
+        (1, 0)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "SynthDef Internals"
+
+    __slots__ = (
+        "_directory_path",
+        "_entries",
+        "_hits",
+        "_lock",
+        "_maximum_size",
+        "_misses",
+    )
+
+    _default_cache = None
+
+    # Bump when graph hashes or the on-disk format change.
+    _format_version = 2
+
+    ### INITIALIZER ###
+
+    def __init__(self, maximum_size=256, directory_path=None):
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._lock = threading.Lock()
+        self._maximum_size = int(maximum_size)
+        self._misses = 0
+        self.directory_path = directory_path
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    ### PRIVATE METHODS ###
+
+    def _get_file_path(self, key):
+        return self._directory_path / "{}.scsyndef".format(key)
+
+    @staticmethod
+    def _get_input_key(input_, indices):
+        if isinstance(input_, OutputProxy):
+            return (indices[input_.source], input_.output_index)
+        elif isinstance(input_, UGen):
+            return (indices[input_], 0)
+        return repr(input_)
+
+    @staticmethod
+    def _get_ugen_key(ugen, indices):
+        type_ = type(ugen)
+        key = [
+            "{}.{}".format(type_.__module__, type_.__qualname__),
+            int(ugen.calculation_rate),
+            ugen.special_index,
+            tuple(int(_) for _ in ugen._get_outputs()),
+            tuple(SynthDefCache._get_input_key(_, indices) for _ in ugen._inputs),
+        ]
+        if isinstance(ugen, Control):
+            for parameter in ugen.parameters:
+                range_ = parameter.range_
+                if range_ is not None:
+                    range_ = (range_.minimum, range_.maximum)
+                key.append(
+                    (
+                        parameter.name,
+                        int(parameter.parameter_rate),
+                        parameter.value,
+                        parameter.lag,
+                        range_,
+                        repr(parameter.unit),
+                    )
+                )
+        return tuple(key)
+
+    ### PUBLIC METHODS ###
+
+    def clear(self):
+        """
+        Clears the in-memory cache.
+
+        Files in ``directory_path`` are left in place.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @classmethod
+    def default(cls):
+        """
+        Gets the process-wide cache consulted by SynthDef, or None if none
+        has been installed.
+        """
+        return cls._default_cache
+
+    def get(self, key):
+        """
+        Gets the SynthDef cached under ``key``, or None.
+        """
+        with self._lock:
+            synthdef = self._entries.get(key)
+            if synthdef is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return synthdef
+
+    @staticmethod
+    def hash_ugen_graph(ugens, optimize=True, parameter_names=None, deduplicate=False):
+        """
+        Hashes the ugen graph ``ugens``, together with the SynthDef build
+        options which affect its compiled form.
+
+        Returns None if ``ugens`` references ugens outside itself.
+        """
+        indices = {ugen: i for i, ugen in enumerate(ugens)}
+        try:
+            keys = tuple(SynthDefCache._get_ugen_key(_, indices) for _ in ugens)
+        except KeyError:
+            return None
+        if parameter_names is not None:
+            parameter_names = tuple(parameter_names)
+        keys = (
+            keys,
+            bool(optimize),
+            bool(optimize and deduplicate),
+            parameter_names,
+            supriya.__version__,
+            SynthDefCache._format_version,
+        )
+        return hashlib.sha1(repr(keys).encode()).hexdigest()
+
+    def put(self, key, synthdef):
+        """
+        Caches ``synthdef`` under ``key``, evicting the least-recently-used
+        SynthDef if necessary.
+
+        Also writes ``synthdef`` to ``directory_path``, if set.
+        """
+        if self._maximum_size > 0:
+            with self._lock:
+                self._entries[key] = synthdef
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maximum_size:
+                    self._entries.popitem(last=False)
+        if self._directory_path is None:
+            return
+        file_path = self._get_file_path(key)
+        if file_path.exists():
+            return
+        # A single SynthDef named by its key, which read() checks.
+        data = (
+            b"SCgf"
+            + SynthDefCompiler.encode_unsigned_int_32bit(2)
+            + SynthDefCompiler.encode_unsigned_int_16bit(1)
+            + SynthDefCompiler.compile_synthdef(synthdef, key)
+        )
+        try:
+            self._directory_path.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent readers never see partial files.
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                dir=self._directory_path, suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "wb") as file_pointer:
+                file_pointer.write(data)
+            os.replace(temporary_path, file_path)
+        except OSError:
+            pass
+
+    def read(self, key):
+        """
+        Decompiles the SynthDef cached on disk under ``key``, or returns None.
+
+        Files which are unreadable, or whose internal name is not ``key``, are
+        treated as missing.
+        """
+        if self._directory_path is None:
+            return None
+        try:
+            data = self._get_file_path(key).read_bytes()
+        except OSError:
+            return None
+        # SCgf header: file type, version, SynthDef count, then the name.
+        encoded_key = key.encode()
+        if (
+            data[:4] != b"SCgf"
+            or data[8:10] != b"\x00\x01"
+            or data[10:11] != bytes([len(encoded_key)])
+            or data[11 : 11 + len(encoded_key)] != encoded_key
+        ):
+            return None
+        try:
+            return SynthDefDecompiler.decompile_synthdef(data)
+        except (AssertionError, AttributeError, IndexError, ValueError, struct.error):
+            return None
+
+    @classmethod
+    def set_default(cls, cache):
+        """
+        Installs ``cache`` as the process-wide cache consulted by SynthDef.
+
+        Pass None to stop consulting a cache.
+        """
+        cls._default_cache = cache
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self):
+        """
+        Gets and sets the directory holding on-disk ``.scsyndef`` files.
+
+        None disables the on-disk cache.
+        """
+        return self._directory_path
+
+    @directory_path.setter
+    def directory_path(self, directory_path):
+        if directory_path is not None:
+            directory_path = pathlib.Path(directory_path)
+        self._directory_path = directory_path
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def maximum_size(self):
+        return self._maximum_size
+
+    @property
+    def misses(self):
+        return self._misses
@@ -1,12 +1,21 @@
 import collections
+import mmap
+import os
 import struct
 from collections.abc import Sequence
+from typing import Dict
 
-from supriya import CalculationRate, ParameterRate, utils
+from supriya import CalculationRate, ParameterRate
 from supriya.system import SupriyaObject
 
 from .bases import MultiOutUGen, UGen
 
+FLOAT = struct.Struct(">f")
+INPUT_SPEC = struct.Struct(">II")
+UGEN_HEADER = struct.Struct(">BIIH")
+UINT16 = struct.Struct(">H")
+UINT32 = struct.Struct(">I")
+
 
 class SynthDefCompiler(SupriyaObject):
 
@@ -76,55 +85,42 @@ class SynthDefCompiler(SupriyaObject):
     @staticmethod
     def compile_ugen(ugen, synthdef):
         outputs = ugen._get_outputs()
-        result = []
-        result.append(SynthDefCompiler.encode_string(type(ugen).__name__))
-        result.append(SynthDefCompiler.encode_unsigned_int_8bit(ugen.calculation_rate))
-        result.append(SynthDefCompiler.encode_unsigned_int_32bit(len(ugen.inputs)))
-        result.append(SynthDefCompiler.encode_unsigned_int_32bit(len(outputs)))
-        result.append(
-            SynthDefCompiler.encode_unsigned_int_16bit(int(ugen.special_index))
+        result = bytearray(SynthDefCompiler.encode_string(type(ugen).__name__))
+        result += UGEN_HEADER.pack(
+            int(ugen.calculation_rate),
+            len(ugen.inputs),
+            len(outputs),
+            int(ugen.special_index),
         )
         for input_ in ugen.inputs:
-            result.append(SynthDefCompiler.compile_ugen_input_spec(input_, synthdef))
-        for output in outputs:
-            result.append(SynthDefCompiler.encode_unsigned_int_8bit(output))
-        result = bytes().join(result)
-        return result
+            result += SynthDefCompiler.compile_ugen_input_spec(input_, synthdef)
+        result += bytes(int(output) for output in outputs)
+        return bytes(result)
 
     @staticmethod
     def compile_ugen_graph(synthdef):
-        result = []
-        result.append(
-            SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.constants))
-        )
-        for constant in synthdef.constants:
-            result.append(SynthDefCompiler.encode_float(constant))
-        result.append(SynthDefCompiler.compile_parameters(synthdef))
-        result.append(SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.ugens)))
-        for ugen_index, ugen in enumerate(synthdef.ugens):
-            result.append(SynthDefCompiler.compile_ugen(ugen, synthdef))
-        result.append(SynthDefCompiler.encode_unsigned_int_16bit(0))
-        result = bytes().join(result)
-        return result
+        result = bytearray()
+        constants = synthdef.constants
+        result += SynthDefCompiler.encode_unsigned_int_32bit(len(constants))
+        result += struct.pack(">{}f".format(len(constants)), *constants)
+        result += SynthDefCompiler.compile_parameters(synthdef)
+        result += SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.ugens))
+        for ugen in synthdef.ugens:
+            result += SynthDefCompiler.compile_ugen(ugen, synthdef)
+        result += SynthDefCompiler.encode_unsigned_int_16bit(0)
+        return bytes(result)
 
     @staticmethod
     def compile_ugen_input_spec(input_, synthdef):
         import supriya.synthdefs
 
-        result = []
         if isinstance(input_, float):
-            result.append(SynthDefCompiler.encode_unsigned_int_32bit(0xFFFFFFFF))
-            constant_index = synthdef._constants.index(input_)
-            result.append(SynthDefCompiler.encode_unsigned_int_32bit(constant_index))
+            constant_index = synthdef._constant_indices[input_]
+            return INPUT_SPEC.pack(0xFFFFFFFF, constant_index)
         elif isinstance(input_, supriya.synthdefs.OutputProxy):
-            ugen = input_.source
-            output_index = input_.output_index
-            ugen_index = synthdef._ugens.index(ugen)
-            result.append(SynthDefCompiler.encode_unsigned_int_32bit(ugen_index))
-            result.append(SynthDefCompiler.encode_unsigned_int_32bit(output_index))
-        else:
-            raise Exception("Unhandled input spec: {}".format(input_))
-        return bytes().join(result)
+            ugen_index = synthdef._ugen_indices[input_.source]
+            return INPUT_SPEC.pack(ugen_index, input_.output_index)
+        raise Exception("Unhandled input spec: {}".format(input_))
 
     @staticmethod
     def encode_string(value):
@@ -231,28 +227,26 @@ class SynthDefDecompiler(SupriyaObject):
 
     __documentation_section__ = "SynthDef Internals"
 
+    _ugen_classes: Dict[str, type] = {}
+
     ### PRIVATE METHODS ###
 
     @staticmethod
     def _decode_constants(value, index):
-        sdd = SynthDefDecompiler
-        constants = []
-        constants_count, index = sdd._decode_int_32bit(value, index)
-        for _ in range(constants_count):
-            constant, index = sdd._decode_float(value, index)
-            constants.append(constant)
-        return constants, index
+        constants_count, index = SynthDefDecompiler._decode_int_32bit(value, index)
+        constants = struct.unpack_from(">{}f".format(constants_count), value, index)
+        return list(constants), index + 4 * constants_count
 
     @staticmethod
     def _decode_parameters(value, index):
         import supriya.synthdefs
 
         sdd = SynthDefDecompiler
-        parameter_values = []
         parameter_count, index = sdd._decode_int_32bit(value, index)
-        for _ in range(parameter_count):
-            parameter_value, index = sdd._decode_float(value, index)
-            parameter_values.append(parameter_value)
+        parameter_values = struct.unpack_from(
+            ">{}f".format(parameter_count), value, index
+        )
+        index += 4 * parameter_count
         parameter_count, index = sdd._decode_int_32bit(value, index)
         parameter_names = []
         parameter_indices = []
@@ -263,61 +257,54 @@ class SynthDefDecompiler(SupriyaObject):
             parameter_indices.append(parameter_index)
         indexed_parameters = []
         if parameter_count:
-            pairs = tuple(zip(parameter_indices, parameter_names))
-            pairs = sorted(pairs, key=lambda x: x[0])
-            iterator = utils.iterate_nwise(pairs)
-            for (index_one, name_one), (index_two, name_two) in iterator:
+            pairs = sorted(zip(parameter_indices, parameter_names))
+            stops = [index_two for index_two, _ in pairs[1:]]
+            stops.append(len(parameter_values))
+            for (index_one, name_one), index_two in zip(pairs, stops):
                 value = parameter_values[index_one:index_two]
                 if len(value) == 1:
                     value = value[0]
                 parameter = supriya.synthdefs.Parameter(name=name_one, value=value)
                 indexed_parameters.append((index_one, parameter))
-            index_one, name_one = pairs[-1]
-            value = parameter_values[index_one:]
-            if len(value) == 1:
-                value = value[0]
-            parameter = supriya.synthdefs.Parameter(name=name_one, value=value)
-            indexed_parameters.append((index_one, parameter))
-            indexed_parameters.sort(key=lambda x: parameter_names.index(x[1].name))
+            positions = {name: i for i, name in enumerate(parameter_names)}
+            indexed_parameters.sort(key=lambda x: positions[x[1].name])
         indexed_parameters = collections.OrderedDict(indexed_parameters)
         return indexed_parameters, index
 
     @staticmethod
     def _decompile_synthdef(value, index):
         import supriya.synthdefs
-        import supriya.ugens
 
         sdd = SynthDefDecompiler
         synthdef = None
         name, index = sdd._decode_string(value, index)
+        start_index = index
         constants, index = sdd._decode_constants(value, index)
         indexed_parameters, index = sdd._decode_parameters(value, index)
         ugens = []
         ugen_count, index = sdd._decode_int_32bit(value, index)
         for i in range(ugen_count):
             ugen_name, index = sdd._decode_string(value, index)
-            calculation_rate, index = sdd._decode_int_8bit(value, index)
-            calculation_rate = supriya.CalculationRate(calculation_rate)
-            input_count, index = sdd._decode_int_32bit(value, index)
-            output_count, index = sdd._decode_int_32bit(value, index)
-            special_index, index = sdd._decode_int_16bit(value, index)
+            (
+                calculation_rate,
+                input_count,
+                output_count,
+                special_index,
+            ) = UGEN_HEADER.unpack_from(value, index)
+            index += UGEN_HEADER.size
+            calculation_rate = CalculationRate(calculation_rate)
+            # Each input spec is a pair of 32-bit ints, so read them all at once.
+            input_specs = struct.unpack_from(
+                ">{}I".format(input_count * 2), value, index
+            )
+            index += input_count * INPUT_SPEC.size + output_count
             inputs = []
-            for _ in range(input_count):
-                ugen_index, index = sdd._decode_int_32bit(value, index)
+            for ugen_index, input_index in zip(input_specs[::2], input_specs[1::2]):
                 if ugen_index == 0xFFFFFFFF:
-                    constant_index, index = sdd._decode_int_32bit(value, index)
-                    constant_index = int(constant_index)
-                    inputs.append(constants[constant_index])
+                    inputs.append(constants[input_index])
                 else:
-                    ugen = ugens[ugen_index]
-                    ugen_output_index, index = sdd._decode_int_32bit(value, index)
-                    output_proxy = ugen[ugen_output_index]
-                    inputs.append(output_proxy)
-            for _ in range(output_count):
-                output_rate, index = sdd._decode_int_8bit(value, index)
-            ugen_class = getattr(supriya.ugens, ugen_name, None)
-            if ugen_class is None:
-                ugen_class = getattr(supriya.synthdefs, ugen_name)
+                    inputs.append(ugens[ugen_index][input_index])
+            ugen_class = sdd._get_ugen_class(ugen_name)
             ugen = supriya.synthdefs.UGen.__new__(ugen_class)
             if issubclass(ugen_class, supriya.synthdefs.Control):
                 starting_control_index = special_index
@@ -363,43 +350,67 @@ class SynthDefDecompiler(SupriyaObject):
                     )
             ugens.append(ugen)
         variants_count, index = sdd._decode_int_16bit(value, index)
-        synthdef = supriya.synthdefs.SynthDef(ugens=ugens, name=name, decompiled=True)
+        synthdef = supriya.synthdefs.SynthDef(
+            ugens=ugens,
+            name=name,
+            optimize=False,
+            parameter_names=[_.name for _ in indexed_parameters.values()],
+            decompiled=True,
+            constants=constants,
+            compiled_ugen_graph=value[start_index:index],
+        )
         if synthdef.name == synthdef.anonymous_name:
             synthdef._name = None
         return synthdef, index
 
     @staticmethod
     def _decode_string(value, index):
-        length = struct.unpack(">B", value[index : index + 1])[0]
+        length = value[index]
         index += 1
-        result = value[index : index + length]
-        result = result.decode("ascii")
+        result = str(value[index : index + length], "ascii")
         index += length
         return result, index
 
     @staticmethod
     def _decode_float(value, index):
-        result = struct.unpack(">f", value[index : index + 4])[0]
-        index += 4
-        return result, index
+        return FLOAT.unpack_from(value, index)[0], index + 4
 
     @staticmethod
     def _decode_int_8bit(value, index):
-        result = struct.unpack(">B", value[index : index + 1])[0]
-        index += 1
-        return result, index
+        return value[index], index + 1
 
     @staticmethod
     def _decode_int_16bit(value, index):
-        result = struct.unpack(">H", value[index : index + 2])[0]
-        index += 2
-        return result, index
+        return UINT16.unpack_from(value, index)[0], index + 2
 
     @staticmethod
     def _decode_int_32bit(value, index):
-        result = struct.unpack(">I", value[index : index + 4])[0]
-        index += 4
-        return result, index
+        return UINT32.unpack_from(value, index)[0], index + 4
+
+    @staticmethod
+    def _get_ugen_class(ugen_name):
+        ugen_class = SynthDefDecompiler._ugen_classes.get(ugen_name)
+        if ugen_class is None:
+            import supriya.synthdefs
+            import supriya.ugens
+
+            ugen_class = getattr(supriya.ugens, ugen_name, None)
+            if ugen_class is None:
+                ugen_class = getattr(supriya.synthdefs, ugen_name)
+            SynthDefDecompiler._ugen_classes[ugen_name] = ugen_class
+        return ugen_class
+
+    @staticmethod
+    def _iterate_synthdefs(value):
+        sdd = SynthDefDecompiler
+        with memoryview(value) as value:
+            index = 4
+            assert value[:index] == b"SCgf"
+            file_version, index = sdd._decode_int_32bit(value, index)
+            synthdef_count, index = sdd._decode_int_16bit(value, index)
+            for _ in range(synthdef_count):
+                synthdef, index = sdd._decompile_synthdef(value, index)
+                yield synthdef
 
     @staticmethod
     def _collect_parameters_for_control(
@@ -446,13 +457,36 @@ class SynthDefDecompiler(SupriyaObject):
 
     @staticmethod
     def decompile_synthdefs(value):
-        synthdefs = []
-        sdd = SynthDefDecompiler
-        index = 4
-        assert value[:index] == b"SCgf"
-        file_version, index = sdd._decode_int_32bit(value, index)
-        synthdef_count, index = sdd._decode_int_16bit(value, index)
-        for _ in range(synthdef_count):
-            synthdef, index = sdd._decompile_synthdef(value, index)
-            synthdefs.append(synthdef)
-        return synthdefs
+        return list(SynthDefDecompiler.iterate_synthdefs(value))
+
+    @staticmethod
+    def iterate_synthdefs(value):
+        """
+        Iterates over the SynthDefs in ``value``, decompiling each as it is
+        reached.
+
+        ``value`` may be compiled SynthDef bytes or the path to a
+        ``.scsyndef`` file. Files are memory-mapped rather than read, so only
+        the pages holding each SynthDef are loaded as it is reached; bytes are
+        decoded in place.
+
+        ::
+
+            >>> import supriya.assets.synthdefs
+            >>> compiled_synthdefs = supriya.synthdefs.SynthDefCompiler.compile_synthdefs(
+            ...     [supriya.assets.synthdefs.default, supriya.assets.synthdefs.test],
+            ... )
+            >>> for synthdef in SynthDefDecompiler.iterate_synthdefs(compiled_synthdefs):
+            ...     synthdef
+            ...
+            <SynthDef: default>
+            <SynthDef: test>
+
+        """
+        if not isinstance(value, (str, os.PathLike)):
+            yield from SynthDefDecompiler._iterate_synthdefs(value)
+            return
+        with open(str(value), "rb") as file_pointer, mmap.mmap(
+            file_pointer.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            yield from SynthDefDecompiler._iterate_synthdefs(mapped)
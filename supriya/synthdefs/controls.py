@@ -203,9 +203,6 @@ class Parameter(UGenMethodMixin, SupriyaValueObject):
     def _get_output_number(self):
         return 0
 
-    def _optimize_graph(self, sort_bundles):
-        pass
-
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -19,6 +19,7 @@ from supriya import (
 from supriya.system import SupriyaObject
 
 from .bases import BinaryOpUGen, UGen, UnaryOpUGen, WidthFirstUGen
+from .caches import SynthDefCache
 from .compilers import SynthDefCompiler
 from .controls import AudioControl, Control, LagControl, Parameter, TrigControl
 from .grapher import SynthDefGrapher
@@ -79,32 +80,95 @@ class SynthDef:
     __documentation_section__ = "Main Classes"
 
     __slots__ = (
+        "_anonymous_name",
         "_compiled_ugen_graph",
+        "_constant_indices",
         "_constants",
         "_control_ugens",
         "_indexed_parameters",
         "_name",
+        "_ugen_indices",
+        "_ugens",
+    )
+
+    _cached_slots = (
+        "_anonymous_name",
+        "_compiled_ugen_graph",
+        "_constant_indices",
+        "_constants",
+        "_control_ugens",
+        "_indexed_parameters",
+        "_ugen_indices",
         "_ugens",
     )
 
     ### INITIALIZER ###
 
-    def __init__(self, ugens, name=None, optimize=True, parameter_names=None, **kwargs):
+    def __init__(
+        self,
+        ugens,
+        name=None,
+        optimize=True,
+        parameter_names=None,
+        deduplicate=False,
+        **kwargs,
+    ):
         self._name = name
-        ugens = list(copy.deepcopy(ugens))
+        ugens = list(ugens)
         assert all(isinstance(_, UGen) for _ in ugens)
+        if kwargs.get("compiled_ugen_graph") is not None:
+            self._initialize_compiled(
+                ugens,
+                kwargs["constants"],
+                kwargs["compiled_ugen_graph"],
+                parameter_names=parameter_names,
+            )
+            return
+        cache = SynthDefCache.default()
+        key = None
+        if cache is not None and (
+            cache.maximum_size or cache.directory_path is not None
+        ):
+            key = cache.hash_ugen_graph(
+                ugens,
+                optimize=optimize,
+                parameter_names=parameter_names,
+                deduplicate=deduplicate,
+            )
+        if key is not None:
+            cached_synthdef = cache.get(key)
+            if cached_synthdef is None:
+                cached_synthdef = cache.read(key)
+                if cached_synthdef is not None:
+                    self._copy_parameter_metadata(ugens, cached_synthdef)
+                    cache.put(key, cached_synthdef)
+            if cached_synthdef is not None:
+                for slot in self._cached_slots:
+                    setattr(self, slot, getattr(cached_synthdef, slot))
+                return
+        if not kwargs.get("decompiled"):
+            # Decompiled ugens belong to no one else, so need no copying.
+            ugens = copy.deepcopy(ugens)
         ugens = self._cleanup_pv_chains(ugens)
         ugens = self._cleanup_local_bufs(ugens)
         if optimize:
-            ugens = self._optimize_ugen_graph(ugens)
+            ugens = self._optimize_ugen_graph(ugens, deduplicate=deduplicate)
         ugens = self._sort_ugens_topologically(ugens)
         self._ugens = tuple(ugens)
+        self._ugen_indices = {ugen: i for i, ugen in enumerate(self._ugens)}
         self._constants = self._collect_constants(self._ugens)
+        self._constant_indices = {
+            constant: i for i, constant in enumerate(self._constants)
+        }
         self._control_ugens = self._collect_control_ugens(self._ugens)
         self._indexed_parameters = self._collect_indexed_parameters(
             self._control_ugens, parameter_names=parameter_names
         )
-        self._compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
+        compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
+        self._compiled_ugen_graph = compiled_ugen_graph
+        self._anonymous_name = hashlib.md5(compiled_ugen_graph).hexdigest()
+        if key is not None:
+            cache.put(key, self)
 
     ### SPECIAL METHODS ###
 
@@ -491,13 +555,12 @@ class SynthDef:
 
     @staticmethod
     def _collect_constants(ugens):
-        constants = []
+        # Dicts preserve insertion order, giving first-seen order in O(n).
+        constants = {}
         for ugen in ugens:
             for input_ in ugen._inputs:
-                if not isinstance(input_, float):
-                    continue
-                if input_ not in constants:
-                    constants.append(input_)
+                if isinstance(input_, float):
+                    constants.setdefault(input_, None)
         return tuple(constants)
 
     @staticmethod
@@ -521,6 +584,22 @@ class SynthDef:
         indexed_parameters = tuple(indexed_parameters)
         return indexed_parameters
 
+    @staticmethod
+    def _copy_parameter_metadata(ugens, synthdef):
+        # Compiled SynthDefs carry no parameter ranges or units, so restore
+        # them from the graph ``synthdef`` was compiled from.
+        parameters = {
+            parameter.name: parameter
+            for ugen in ugens
+            if isinstance(ugen, Control)
+            for parameter in ugen.parameters
+        }
+        for _, parameter in synthdef._indexed_parameters:
+            source = parameters.get(parameter.name)
+            if source is not None:
+                parameter._range = source._range
+                parameter._unit = source._unit
+
     @staticmethod
     def _extract_parameters(ugens):
         parameters = set()
@@ -531,29 +610,139 @@ class SynthDef:
         parameters = tuple(sorted(parameters, key=lambda x: x.name))
         return ugens, parameters
 
+    def _initialize_compiled(
+        self, ugens, constants, compiled_ugen_graph, parameter_names=None
+    ):
+        # Decompiled graphs arrive in compiled order, alongside the constants
+        # and bytes they were decoded from, so need no sorting or compiling.
+        self._ugens = tuple(ugens)
+        self._ugen_indices = {ugen: i for i, ugen in enumerate(self._ugens)}
+        self._constants = tuple(constants)
+        self._constant_indices = {
+            constant: i for i, constant in enumerate(self._constants)
+        }
+        self._control_ugens = self._collect_control_ugens(self._ugens)
+        self._indexed_parameters = self._collect_indexed_parameters(
+            self._control_ugens, parameter_names=parameter_names
+        )
+        self._compiled_ugen_graph = bytes(compiled_ugen_graph)
+        self._anonymous_name = hashlib.md5(self._compiled_ugen_graph).hexdigest()
+
     @staticmethod
     def _initialize_topological_sort(ugens):
-        ugens = list(ugens)
-        sort_bundles = collections.OrderedDict()
-        width_first_antecedents = []
-        for ugen in ugens:
-            sort_bundles[ugen] = UGenSortBundle(ugen, width_first_antecedents)
+        """
+        Build integer adjacency lists for ``ugens``.
+
+        Ugens are identified by their position in ``ugens``. Antecedents are
+        listed in input order, and descendants in ascending order.
+
+        Every ugen must follow each width-first ugen preceding it. Width-first
+        ugens already follow one another, so an edge from the nearest one is
+        enough.
+        """
+        indices = {ugen: i for i, ugen in enumerate(ugens)}
+        antecedents = []
+        descendants = [[] for _ in ugens]
+        width_first_index = None
+        for i, ugen in enumerate(ugens):
+            ugen_antecedents = {}
+            for input_ in ugen._inputs:
+                if isinstance(input_, OutputProxy):
+                    input_ = input_.source
+                elif not isinstance(input_, UGen):
+                    continue
+                ugen_antecedents[indices[input_]] = None
+            if width_first_index is not None:
+                ugen_antecedents[width_first_index] = None
+            for j in ugen_antecedents:
+                descendants[j].append(i)
+            antecedents.append(list(ugen_antecedents))
             if isinstance(ugen, WidthFirstUGen):
-                width_first_antecedents.append(ugen)
-        for ugen in ugens:
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants, key=lambda x: ugens.index(ugen)
-            )
-        return sort_bundles
+                width_first_index = i
+        return antecedents, descendants
 
     @staticmethod
-    def _optimize_ugen_graph(ugens):
-        sort_bundles = SynthDef._initialize_topological_sort(ugens)
-        for ugen in ugens:
-            ugen._optimize_graph(sort_bundles)
-        return tuple(sort_bundles)
+    def _optimize_ugen_graph(ugens, deduplicate=False):
+        """
+        Remove dead pure ugens and, if ``deduplicate``, merge duplicate pure
+        ugens in the same pass.
+
+        A pure ugen is dead when no impure ugen depends on it. Deterministic
+        pure ugens with the same type, rate, special index, output count and
+        (merged) inputs are duplicates; the earliest one is kept and its
+        duplicates' consumers are rewired onto it.
+
+        Merging changes the compiled bytes, and so the anonymous name, of
+        graphs with duplicates, so it is opt-in.
+        """
+        ugens = list(ugens)
+        antecedents, descendants = SynthDef._initialize_topological_sort(ugens)
+        indices = {ugen: i for i, ugen in enumerate(ugens)}
+        counts = [len(_) for _ in antecedents]
+        order = [i for i, count in enumerate(counts) if not count]
+        for i in order:
+            for j in descendants[i]:
+                counts[j] -= 1
+                if not counts[j]:
+                    order.append(j)
+        aliases = list(range(len(ugens)))
+
+        def resolve(i):
+            while aliases[i] != i:
+                i = aliases[i]
+            return i
+
+        def get_input_key(input_):
+            if isinstance(input_, OutputProxy):
+                return (resolve(indices[input_.source]), input_.output_index)
+            elif isinstance(input_, UGen):
+                return (resolve(indices[input_]), 0)
+            return input_
+
+        keys = {}
+        for i in order if deduplicate else ():
+            ugen = ugens[i]
+            if not ugen._is_pure or not ugen._is_deduplicable:
+                continue
+            key = (
+                type(ugen),
+                ugen.calculation_rate,
+                ugen.special_index,
+                len(ugen),
+                tuple(get_input_key(_) for _ in ugen._inputs),
+            )
+            j = keys.setdefault(key, i)
+            if j < i:
+                aliases[i] = j
+            elif i < j:
+                aliases[j] = keys[key] = i
+        # Liveness is judged on the unmerged graph: a merged ugen survives if
+        # any of its duplicates did.
+        is_live = [False] * len(ugens)
+        for i in reversed(order):
+            is_live[i] = not ugens[i]._is_pure or any(
+                is_live[j] for j in descendants[i]
+            )
+        is_kept = [False] * len(ugens)
+        for i in order:
+            if is_live[i]:
+                is_kept[resolve(i)] = True
+        optimized_ugens = []
+        for i, ugen in enumerate(ugens):
+            if not is_kept[i]:
+                continue
+            optimized_ugens.append(ugen)
+            if all(resolve(j) == j for j in antecedents[i]):
+                continue
+            inputs = list(ugen._inputs)
+            for k, input_ in enumerate(inputs):
+                if isinstance(input_, OutputProxy):
+                    source = ugens[resolve(indices[input_.source])]
+                    inputs[k] = source[input_.output_index]
+                elif isinstance(input_, UGen):
+                    inputs[k] = ugens[resolve(indices[input_])]
+            ugen._inputs = tuple(inputs)
+        return optimized_ugens
 
     def _register_with_local_server(self, server=None):
         import supriya.realtime
@@ -574,17 +763,22 @@ class SynthDef:
 
     @staticmethod
     def _sort_ugens_topologically(ugens):
-        sort_bundles = SynthDef._initialize_topological_sort(ugens)
-        available_ugens = []
-        for ugen in reversed(ugens):
-            sort_bundles[ugen]._make_available(available_ugens)
-        out_stack = []
-        while available_ugens:
-            available_ugen = available_ugens.pop()
-            sort_bundles[available_ugen]._schedule(
-                available_ugens, out_stack, sort_bundles
-            )
-        return out_stack
+        """
+        Sort ``ugens`` depth-first, preferring earlier ugens when several are
+        available.
+        """
+        antecedents, descendants = SynthDef._initialize_topological_sort(ugens)
+        counts = [len(_) for _ in antecedents]
+        available = [i for i in reversed(range(len(ugens))) if not counts[i]]
+        sorted_ugens = []
+        while available:
+            i = available.pop()
+            for j in reversed(descendants[i]):
+                counts[j] -= 1
+                if not counts[j]:
+                    available.append(j)
+            sorted_ugens.append(ugens[i])
+        return sorted_ugens
 
     ### PUBLIC METHODS ###
 
@@ -722,10 +916,7 @@ class SynthDef:
 
     @property
     def anonymous_name(self):
-        md5 = hashlib.md5()
-        md5.update(self._compiled_ugen_graph)
-        anonymous_name = md5.hexdigest()
-        return anonymous_name
+        return self._anonymous_name
 
     @property
     def audio_channel_count(self):
@@ -939,60 +1130,6 @@ class SynthDef:
         return self._ugens
 
 
-class UGenSortBundle(SupriyaObject):
-
-    ### CLASS VARIABLES ###
-
-    __documentation_section__ = "SynthDef Internals"
-
-    ### INITIALIZER ###
-
-    def __init__(self, ugen, width_first_antecedents):
-        self.antecedents = []
-        self.descendants = []
-        self.ugen = ugen
-        self.width_first_antecedents = tuple(width_first_antecedents)
-
-    ### PRIVATE METHODS ###
-
-    def _initialize_topological_sort(self, sort_bundles):
-        for input_ in self.ugen.inputs:
-            if isinstance(input_, OutputProxy):
-                input_ = input_.source
-            elif not isinstance(input_, UGen):
-                continue
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
-        for input_ in self.width_first_antecedents:
-            input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
-                self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
-                input_sort_bundle.descendants.append(self.ugen)
-
-    def _make_available(self, available_ugens):
-        if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
-
-    def _schedule(self, available_ugens, out_stack, sort_bundles):
-        for ugen in reversed(self.descendants):
-            sort_bundle = sort_bundles[ugen]
-            sort_bundle.antecedents.remove(self.ugen)
-            sort_bundle._make_available(available_ugens)
-        out_stack.append(self.ugen)
-
-    ### PUBLIC METHODS ###
-
-    def clear(self):
-        self.antecedents[:] = []
-        self.descendants[:] = []
-        self.width_first_antecedents[:] = []
-
-
 class SuperColliderSynthDef(SupriyaObject):
 
     ### CLASS VARIABLES ###
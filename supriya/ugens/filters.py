@@ -268,17 +268,13 @@ class DetectSilence(Filter):
 
     ### CLASS VARIABLES ###
 
+    _is_pure = False
+
     _ordered_input_names = collections.OrderedDict(
         [("source", None), ("threshold", 0.0001), ("time", 0.1), ("done_action", 0)]
     )
     _valid_calculation_rates = (CalculationRate.AUDIO, CalculationRate.CONTROL)
 
-    ### PRIVATE METHODS ###
-
-    def _optimize_graph(self, sort_bundles):
-        # TODO: Replace with `_is_pure = False` class variable
-        pass
-
 
 class FOS(Filter):
     """
@@ -357,6 +357,9 @@ class Vibrato(PureUGen):
 
     """
 
+    # Each instance draws its own random rate and depth variation.
+    _is_deduplicable = False
+
     _ordered_input_names = collections.OrderedDict(
         [
             ("frequency", 440),
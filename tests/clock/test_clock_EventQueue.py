@@ -0,0 +1,72 @@
+import queue
+import random
+
+import pytest
+
+from supriya.clock.eventqueue import EventQueue
+
+
+def test_put_get():
+    event_queue = EventQueue()
+    for item in [3, 1, 2]:
+        event_queue.put(item)
+    assert event_queue.peek() == 1
+    assert event_queue.size == event_queue.qsize() == 3
+    assert [event_queue.get() for _ in range(3)] == [1, 2, 3]
+    with pytest.raises(queue.Empty):
+        event_queue.peek()
+
+
+def test_key():
+    event_queue = EventQueue(key=lambda item: -item)
+    for item in [3, 1, 2]:
+        event_queue.put(item)
+    assert [event_queue.get() for _ in range(3)] == [3, 2, 1]
+
+
+def test_remove():
+    event_queue = EventQueue()
+    for item in [3, 1, 2]:
+        event_queue.put(item)
+    event_queue.remove(1)
+    event_queue.remove(4)
+    assert (event_queue.size, event_queue.tombstone_count) == (2, 1)
+    # Peeking discards tombstones at the head of the heap
+    assert event_queue.peek() == 2
+    assert (event_queue.size, event_queue.tombstone_count) == (2, 0)
+    # Re-putting an item supersedes its previous entry
+    event_queue.put(3)
+    assert (event_queue.size, event_queue.tombstone_count) == (2, 1)
+    assert [event_queue.get() for _ in range(2)] == [2, 3]
+    assert (event_queue.size, event_queue.tombstone_count) == (0, 0)
+
+
+def test_compaction():
+    event_queue = EventQueue(compaction_threshold=10)
+    for item in range(100):
+        event_queue.put(item)
+    for item in range(99, 20, -1):
+        event_queue.remove(item)
+        assert event_queue.tombstone_count <= max(10, event_queue.size) + 1
+    assert event_queue.size == 21
+    assert [event_queue.get() for _ in range(21)] == list(range(21))
+
+
+def test_remove_many():
+    event_queue = EventQueue(key=lambda item: (item[1], item[0]))
+    random_ = random.Random(0)
+    items = [(i, random_.random()) for i in range(20000)]
+    for item in items:
+        event_queue.put(item)
+    random_.shuffle(items)
+    for i, item in enumerate(items[:-10]):
+        event_queue.remove(item)
+        if not i % 1000:
+            assert event_queue.tombstone_count <= max(
+                event_queue._compaction_threshold, event_queue.size
+            )
+    assert event_queue.size == 10
+    assert [event_queue.get() for _ in range(10)] == sorted(
+        items[-10:], key=lambda item: (item[1], item[0])
+    )
+    assert event_queue.tombstone_count == 0
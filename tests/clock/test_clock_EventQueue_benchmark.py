@@ -0,0 +1,34 @@
+import os
+import random
+import time
+
+import pytest
+
+from supriya.clock.eventqueue import EventQueue
+
+
+@pytest.mark.skipif(
+    not os.environ.get("SUPRIYA_BENCHMARKS"),
+    reason="Set SUPRIYA_BENCHMARKS to run benchmarks",
+)
+@pytest.mark.timeout(300)
+def test_schedule_and_cancel_one_million():
+    event_queue = EventQueue(key=lambda item: (item[1], item[0]))
+    random_ = random.Random(0)
+    items = [(i, random_.random()) for i in range(1000000)]
+    random_.shuffle(items)
+    start_time = time.perf_counter()
+    for item in items:
+        event_queue.put(item)
+    put_time = time.perf_counter() - start_time
+    random_.shuffle(items)
+    start_time = time.perf_counter()
+    for item in items[:-1000]:
+        event_queue.remove(item)
+    remove_time = time.perf_counter() - start_time
+    assert event_queue.size == 1000
+    assert event_queue.tombstone_count <= max(
+        event_queue._compaction_threshold, event_queue.size
+    )
+    # Cancelling is no slower than scheduling, once tombstones are compacted.
+    assert remove_time < put_time * 2
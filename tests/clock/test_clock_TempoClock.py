@@ -819,3 +819,84 @@ def test_clock_skew():
         all_stats.append(stats)
     threshold = tempo_clock.slop * 1.5
     assert all(stats["median"] < threshold for stats in all_stats)
+
+
+@pytest.mark.flaky(reruns=5)
+@pytest.mark.timeout(10)
+def test_event_driven():
+    tempo_clock = TempoClock(event_driven=True)
+    assert tempo_clock.event_driven
+    store = []
+    tempo_clock.start()
+    # Wakes from an indefinite wait when a command arrives.
+    time.sleep(0.1)
+    tempo_clock.schedule(
+        callback,
+        schedule_at=0.25,
+        args=[store],
+        kwargs={"limit": 20, "delta": 0.01, "time_unit": TimeUnit.SECONDS},
+    )
+    time.sleep(0.2)
+    assert not store
+    # Wakes early from a deadline wait when an earlier event is cued.
+    tempo_clock.cue(callback, args=[store], kwargs={"limit": 0})
+    time.sleep(0.01)
+    assert len(store) == 1
+    time.sleep(1.0)
+    tempo_clock.stop()
+    assert len(store) == 22
+    lateness = tempo_clock.lateness
+    assert lateness.count == 22
+    assert len(lateness.samples) == 22
+    assert lateness.minimum >= 0
+    assert lateness.mean < 0.001
+
+
+def test_lateness(tempo_clock):
+    store = []
+    tempo_clock.schedule(callback, schedule_at=0.0, args=[store])
+    tempo_clock.start()
+    set_time_and_check(0.0, tempo_clock, store)
+    set_time_and_check(0.75, tempo_clock, store)
+    lateness = tempo_clock.lateness
+    assert lateness.count == 2
+    assert list(lateness.samples) == [(0, 0.0), (0, 0.25)]
+    assert lateness.maximum == 0.25
+    lateness.clear()
+    assert lateness.count == 0
+    assert not lateness.samples
+
+
+@pytest.mark.flaky(reruns=5)
+@pytest.mark.timeout(10)
+def test_change_tempo_many_events(tempo_clock):
+    store = []
+    for i in range(1000):
+        tempo_clock.schedule(callback, schedule_at=1.5 + i, args=[store])
+    tempo_clock.schedule(
+        callback,
+        schedule_at=2,
+        time_unit=TimeUnit.MEASURES,
+        args=[store],
+        kwargs={"limit": 0},
+    )
+    tempo_clock.start()
+    while tempo_clock._command_deque:
+        time.sleep(tempo_clock.slop)
+    time.sleep(tempo_clock.slop * 4)
+    assert tempo_clock._event_queue.qsize() == 1001
+    for i in range(1, 101):
+        tempo_clock.get_current_time.return_value = i / 1000
+        tempo_clock.change(beats_per_minute=120 + i)
+        time.sleep(tempo_clock.slop * 4)
+    while tempo_clock._command_deque:
+        time.sleep(tempo_clock.slop)
+    time.sleep(tempo_clock.slop * 4)
+    assert tempo_clock.beats_per_minute == 220
+    # Tempo changes don't cancel and re-enqueue beat-relative events.
+    assert tempo_clock._event_queue.qsize() == 1001
+    assert not store
+    event = tempo_clock.peek()
+    assert (event.measure, event.offset) == (2, 1.0)
+    assert event.seconds == tempo_clock._offset_to_seconds(1.0)
+    assert 1.0 < event.seconds < 2.0
@@ -0,0 +1,85 @@
+import pytest
+
+from supriya.clock import TempoMap
+
+
+@pytest.fixture
+def tempo_map():
+    tempo_map = TempoMap(beats_per_minute=120)
+    tempo_map.change(1.0, beats_per_minute=60)
+    tempo_map.ramp(2.0, 4.0, beats_per_minute=240)
+    tempo_map.change(5.0, time_signature=(6, 8))
+    return tempo_map
+
+
+@pytest.mark.parametrize(
+    "offset,expected",
+    [
+        (-1.0, -2.0),
+        (0.0, 0.0),
+        (0.5, 1.0),
+        (1.0, 2.0),
+        (1.5, 4.0),
+        (2.0, 6.0),
+        (4.0, 9.696784962986374),
+        (5.0, 10.696784962986374),
+        (6.0, 12.696784962986374),
+    ],
+)
+def test_offset_to_seconds(tempo_map, offset, expected):
+    assert tempo_map.offset_to_seconds(offset) == pytest.approx(expected)
+    assert tempo_map.seconds_to_offset(expected) == pytest.approx(offset)
+
+
+def test_beats_per_minute_at(tempo_map):
+    assert [
+        tempo_map.beats_per_minute_at(offset)
+        for offset in [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    ] == [120.0, 60.0, 60.0, 150.0, 240.0, 240.0, 240.0]
+
+
+def test_measures(tempo_map):
+    assert [tempo_map.offset_to_measure(x) for x in [0, 4.5, 5.0, 5.5, 5.75]] == [
+        1,
+        5,
+        6,
+        6,
+        7,
+    ]
+    assert tempo_map.offset_to_measure_offset(5.5) == 0.5
+    assert tempo_map.measure_to_offset(5) == 4.0
+    assert tempo_map.measure_to_offset(7) == 5.75
+    assert tempo_map.time_signature_at(5.75) == (6, 8)
+    # Mid-measure time signature changes start with the following measure.
+    tempo_map.change_time_signature(6.0, (2, 4))
+    assert tempo_map.offset_to_measure(6.0) == 8
+    assert tempo_map.measure_to_offset(9) == 6.5
+
+
+def test_change_truncates(tempo_map):
+    tempo_map.change(3.0, beats_per_minute=100)
+    # The ramp runs until 3.0, then the tempo holds.
+    assert tempo_map.beats_per_minute_at(2.5) == 105.0
+    assert tempo_map.beats_per_minute_at(10.0) == 100.0
+    assert tempo_map.offset_to_seconds(4.0) == pytest.approx(
+        tempo_map.offset_to_seconds(3.0) + 2.4
+    )
+
+
+def test_ramp_invalid(tempo_map):
+    with pytest.raises(ValueError):
+        tempo_map.ramp(2.0, 2.0, beats_per_minute=100)
+
+
+def test_batch_conversion(tempo_map):
+    numpy = pytest.importorskip("numpy")
+    offsets = numpy.linspace(-1.0, 10.0, 10001)
+    seconds = tempo_map.offsets_to_seconds(offsets)
+    assert isinstance(seconds, numpy.ndarray)
+    assert numpy.allclose(
+        seconds, [tempo_map.offset_to_seconds(offset) for offset in offsets]
+    )
+    assert numpy.allclose(tempo_map.seconds_to_offsets(seconds), offsets)
+    assert numpy.allclose(
+        tempo_map.seconds_to_offsets(seconds.tolist()), offsets.tolist()
+    )
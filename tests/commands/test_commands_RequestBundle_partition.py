@@ -0,0 +1,52 @@
+import supriya
+
+
+def test_partition():
+    requests = [
+        supriya.commands.NodeSetRequest(
+            node_id=1000 + i, frequency=440.0 + i, amplitude=0.5
+        )
+        for i in range(1000)
+    ]
+    bundles = supriya.commands.RequestBundle.partition(requests, timestamp=10.5)
+    assert len(bundles) > 1
+    assert [x for bundle in bundles for x in bundle.contents] == requests
+    for bundle in bundles:
+        assert bundle.timestamp == 10.5
+        datagram = bundle.to_datagram()
+        assert len(datagram) <= 8192
+        assert datagram == bundle.to_osc().to_datagram()
+        # a freshly-built equivalent bundle encodes identically
+        fresh_bundle = supriya.commands.RequestBundle(
+            timestamp=10.5, contents=bundle.contents
+        )
+        assert fresh_bundle.to_osc() == bundle.to_osc()
+        assert fresh_bundle.to_datagram() == datagram
+
+
+def test_partition_benchmark(mocker):
+    """
+    Partitioning and then sending 10k requests serializes each request once.
+    """
+
+    def partition_and_encode():
+        bundles = supriya.commands.RequestBundle.partition(requests)
+        return [bundle.to_osc().to_datagram() for bundle in bundles]
+
+    requests = [
+        supriya.commands.NodeSetRequest(
+            node_id=1000 + i, frequency=440.0 + i, amplitude=0.5
+        )
+        for i in range(10000)
+    ]
+    to_osc = mocker.spy(supriya.commands.NodeSetRequest, "to_osc")
+    cached_datagrams = partition_and_encode()
+    assert to_osc.call_count == len(requests)
+    # Re-serializing the same bundles from scratch doubles the calls.
+    to_osc.reset_mock()
+    uncached_datagrams = [
+        supriya.commands.RequestBundle(contents=bundle.contents).to_datagram()
+        for bundle in supriya.commands.RequestBundle.partition(requests)
+    ]
+    assert to_osc.call_count == len(requests) * 2
+    assert cached_datagrams == uncached_datagrams
@@ -1,11 +1,13 @@
 import os
 import pathlib
 import shutil
+import threading
+import time
 import types
 
 import pytest
 
-from supriya.nonrealtime import Session
+from supriya.nonrealtime import Session, SessionRenderer
 
 
 @pytest.fixture
@@ -33,6 +35,50 @@ def nonrealtime_paths(tmpdir):
             shutil.rmtree(directory_path)
 
 
+@pytest.fixture
+def fake_render_datagram(monkeypatch):
+    """
+    Replaces scsynth with a fake renderer, configured via the returned
+    namespace.
+
+    Each render sleeps ``duration`` seconds, exits with ``exit_code(session)``
+    and, on success, writes its output via ``write(renderer, output_file_path)``.
+    Existing outputs are skipped when ``skip_existing``. Renders are logged as
+    ``("start", session)`` and ``("stop", session)`` pairs, and their output
+    paths and keyword arguments collected in ``rendered``.
+    """
+    lock = threading.Lock()
+    fake = types.SimpleNamespace(
+        duration=0.0,
+        exit_code=lambda session: 0,
+        log=[],
+        rendered=[],
+        skip_existing=False,
+        write=lambda renderer, output_file_path: output_file_path.write_bytes(
+            b"audio"
+        ),
+    )
+
+    def _render_datagram(
+        self, session, input_file_path, output_file_path, *args, **kwargs
+    ):
+        if fake.skip_existing and output_file_path.exists():
+            return 0
+        with lock:
+            fake.log.append(("start", session))
+        time.sleep(fake.duration)
+        exit_code = fake.exit_code(session)
+        if not exit_code:
+            fake.write(self, output_file_path)
+        with lock:
+            fake.log.append(("stop", session))
+            fake.rendered.append((output_file_path, kwargs))
+        return exit_code
+
+    monkeypatch.setattr(SessionRenderer, "_render_datagram", _render_datagram)
+    return fake
+
+
 @pytest.helpers.register
 def make_test_session(
     input_=None,
@@ -0,0 +1,226 @@
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+from uqbar.objects import new
+
+import supriya.io
+import supriya.nonrealtime
+from supriya.nonrealtime import RenderCache, RenderCacheStatistics
+
+
+def write(file_path, size):
+    file_path.write_bytes(b"x" * size)
+    return file_path
+
+
+def test_fetch_and_publish(tmp_path):
+    render_cache = RenderCache(tmp_path / "cache")
+    key = render_cache.build_key("session-abc", block_size=64)
+    assert key != render_cache.build_key("session-abc", block_size=128)
+    assert key == RenderCache.build_key("session-abc", block_size=64)
+    output_file_path = tmp_path / "output.aiff"
+    assert not render_cache.fetch(key, output_file_path)
+    assert not output_file_path.exists()
+    render_cache.publish(key, write(tmp_path / "rendered.aiff", 10))
+    assert render_cache.fetch(key, output_file_path)
+    assert output_file_path.read_bytes() == b"x" * 10
+    assert not list(tmp_path.glob("**/*.partial"))
+    assert render_cache.statistics == RenderCacheStatistics(
+        hits=1, misses=1, evictions=0, entry_count=1, size=10
+    )
+    # The index persists, and is shared by other instances
+    assert RenderCache(tmp_path / "cache").fetch(key, tmp_path / "other.aiff")
+    render_cache.clear()
+    assert not render_cache.fetch(key, output_file_path)
+    assert render_cache.statistics == RenderCacheStatistics(
+        hits=2, misses=2, evictions=0, entry_count=0, size=0
+    )
+
+
+def test_entries_are_copies(tmp_path):
+    render_cache = RenderCache(tmp_path / "cache")
+    rendered_file_path = write(tmp_path / "rendered.aiff", 10)
+    render_cache.publish("key", rendered_file_path)
+    output_file_path = tmp_path / "output.aiff"
+    assert render_cache.fetch("key", output_file_path)
+    entry_path = tmp_path / "cache" / "entries" / "key.aiff"
+    assert not entry_path.samefile(rendered_file_path)
+    assert not entry_path.samefile(output_file_path)
+    # Post-processing either file leaves the entry intact
+    with output_file_path.open("ab") as file_pointer:
+        file_pointer.write(b"y")
+    write(rendered_file_path, 5)
+    assert entry_path.read_bytes() == b"x" * 10
+
+
+def test_missing_file_is_a_miss(tmp_path):
+    render_cache = RenderCache(tmp_path / "cache")
+    render_cache.publish("key", write(tmp_path / "rendered.aiff", 10))
+    (tmp_path / "cache" / "entries" / "key.aiff").unlink()
+    assert not render_cache.fetch("key", tmp_path / "output.aiff")
+    assert render_cache.statistics.entry_count == 0
+
+
+@pytest.mark.parametrize(
+    "max_size, max_entries, expected_keys",
+    [(25, None, ["b", "d"]), (None, 3, ["b", "c", "d"]), (None, None, list("abcd"))],
+)
+def test_evicts_least_recently_used(tmp_path, max_size, max_entries, expected_keys):
+    render_cache = RenderCache(
+        tmp_path / "cache", max_size=max_size, max_entries=max_entries
+    )
+    for key in "abc":
+        render_cache.publish(key, write(tmp_path / "rendered.aiff", 10))
+    assert render_cache.fetch("b", tmp_path / "output.aiff")
+    render_cache.publish("d", write(tmp_path / "rendered.aiff", 10))
+    assert (
+        sorted(
+            key
+            for key in "abcd"
+            if (tmp_path / "cache" / "entries" / (key + ".aiff")).exists()
+        )
+        == expected_keys
+    )
+    statistics = render_cache.statistics
+    assert statistics.entry_count == len(expected_keys)
+    assert statistics.evictions == 4 - len(expected_keys)
+
+
+def test_eviction_skips_locked_entries(tmp_path):
+    render_cache = RenderCache(tmp_path / "cache", max_entries=1)
+    render_cache.publish("a", write(tmp_path / "rendered.aiff", 10))
+    with render_cache.lock("a"):
+        render_cache.publish("b", write(tmp_path / "rendered.aiff", 10))
+    assert render_cache.statistics.entry_count == 2
+    render_cache.publish("c", write(tmp_path / "rendered.aiff", 10))
+    assert render_cache.statistics.entry_count == 1
+
+
+def test_lock_files_are_removed(tmp_path):
+    render_cache = RenderCache(tmp_path / "cache", max_entries=2)
+    for key in "abcd":
+        with render_cache.lock(key):
+            render_cache.publish(key, write(tmp_path / "rendered.aiff", 10))
+    lock_directory_path = tmp_path / "cache" / "locks"
+    assert sorted(x.name for x in lock_directory_path.iterdir()) == [
+        "c.lock",
+        "d.lock",
+    ]
+    render_cache.clear()
+    assert not list(lock_directory_path.iterdir())
+
+
+def test_lock_after_lock_file_removed(tmp_path):
+    render_cache = RenderCache(tmp_path / "cache")
+    events = []
+
+    def wait():
+        with render_cache.lock("key"):
+            events.append("acquired")
+
+    with render_cache.lock("key"):
+        thread = threading.Thread(target=wait)
+        thread.start()
+        time.sleep(0.1)
+        render_cache._get_lock_path("key").unlink()
+    thread.join()
+    assert events == ["acquired"]
+    # The waiter locked the replacement file, not the removed one
+    assert render_cache._get_lock_path("key").exists()
+
+
+def test_lock_across_processes(tmp_path):
+    render_cache = RenderCache(tmp_path / "cache")
+    script = textwrap.dedent(
+        """
+        import sys, time
+        from supriya.nonrealtime.cache import RenderCache
+        with RenderCache(sys.argv[1]).lock("key"):
+            print("locked", flush=True)
+            time.sleep(1)
+        """
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-c", script, str(tmp_path / "cache")],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert process.stdout.readline().strip() == "locked"
+        with render_cache.lock("key", blocking=False) as is_locked:
+            assert not is_locked
+        started_at = time.monotonic()
+        with render_cache.lock("key") as is_locked:
+            assert is_locked
+            assert 0.5 < time.monotonic() - started_at
+    finally:
+        process.wait()
+
+
+def test_lock_across_threads(tmp_path):
+    render_cache = RenderCache(tmp_path / "cache")
+    events = []
+
+    def hold():
+        with render_cache.lock("key"):
+            events.append("acquired")
+            time.sleep(0.25)
+            events.append("released")
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    while not events:
+        time.sleep(0.01)
+    with render_cache.lock("key"):
+        events.append("acquired")
+    thread.join()
+    assert events == ["acquired", "released", "acquired"]
+
+
+def test_session_renderer(fake_render_datagram, nonrealtime_paths):
+    rendered = fake_render_datagram.rendered
+    render_directory_path = nonrealtime_paths.render_directory_path
+    render_cache = RenderCache(nonrealtime_paths.test_directory_path / "cache")
+    session = pytest.helpers.make_test_session()
+    exit_code, output_file_path = session.render(
+        render_directory_path=render_directory_path, render_cache=render_cache
+    )
+    assert exit_code == 0 and len(rendered) == 1
+    output_file_path.unlink()
+    # Restored rather than rendered
+    output_file_path = supriya.io.render(
+        session,
+        render_directory_path=render_directory_path,
+        render_cache=render_cache.directory_path,
+    )
+    assert len(rendered) == 1
+    assert output_file_path.read_bytes() == b"audio"
+    # Different render options are cached separately
+    session.render(
+        render_directory_path=render_directory_path,
+        render_cache=render_cache,
+        block_size=128,
+    )
+    assert len(rendered) == 2
+    assert rendered[-1][1]["block_size"] == 128
+    assert render_cache.statistics[:3] == (1, 2, 0)
+    # As are sessions with different options
+    output_file_path.unlink()
+    session = pytest.helpers.make_test_session()
+    session._options = new(session._options, block_size=128)
+    session.render(
+        render_directory_path=render_directory_path, render_cache=render_cache
+    )
+    assert len(rendered) == 2
+    assert render_cache.statistics[:3] == (2, 2, 0)
+    output_file_path.unlink()
+    session._options = new(session._options, block_size=256)
+    session.render(
+        render_directory_path=render_directory_path, render_cache=render_cache
+    )
+    assert len(rendered) == 3
+    assert render_cache.statistics[:3] == (2, 3, 0)
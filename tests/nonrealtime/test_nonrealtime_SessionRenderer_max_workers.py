@@ -0,0 +1,74 @@
+import pytest
+
+import supriya.nonrealtime
+
+
+def build_session(stem_count):
+    stems = [
+        pytest.helpers.make_test_session(multiplier=i + 1) for i in range(stem_count)
+    ]
+    mixdown = supriya.nonrealtime.Session(input_=stems[0], name="mixdown")
+    with mixdown.at(0):
+        for stem in stems[1:]:
+            mixdown.add_buffer(file_path=stem)
+    return stems, mixdown
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_max_workers(fake_render_datagram, nonrealtime_paths, max_workers):
+    stems, mixdown = build_session(4)
+    fake_render_datagram.duration = 0.1
+    log = fake_render_datagram.log
+    renderer = supriya.nonrealtime.SessionRenderer(
+        mixdown,
+        max_workers=max_workers,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    exit_code, _, output_file_path = renderer.render(duration=10)
+    assert exit_code == 0
+    assert output_file_path.exists()
+    assert output_file_path == nonrealtime_paths.render_directory_path / (
+        renderer.renderable_prefixes[mixdown].name + ".aiff"
+    )
+    # The mixdown renders only once all stems have
+    assert log[-2:] == [("start", mixdown), ("stop", mixdown)]
+    assert {session for _, session in log[:-2]} == set(stems)
+    starts = [i for i, (action, _) in enumerate(log[:-2]) if action == "start"]
+    if max_workers == 1:
+        assert starts == [0, 2, 4, 6]
+    else:
+        # All stems render concurrently
+        assert starts == [0, 1, 2, 3]
+
+
+def test_max_workers_error(fake_render_datagram, nonrealtime_paths):
+    stems, mixdown = build_session(3)
+    fake_render_datagram.exit_code = lambda session: 1 if session is stems[0] else 0
+    renderer = supriya.nonrealtime.SessionRenderer(
+        mixdown,
+        max_workers=2,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    with pytest.raises(supriya.exceptions.NonrealtimeRenderError):
+        renderer.render(duration=10)
+    assert mixdown not in {session for _, session in fake_render_datagram.log}
+
+
+def test_max_workers_identical_renderables(fake_render_datagram, nonrealtime_paths):
+    stems = [pytest.helpers.make_test_session() for _ in range(3)]
+    mixdown = supriya.nonrealtime.Session(input_=stems[0], name="mixdown")
+    with mixdown.at(0):
+        for stem in stems[1:]:
+            mixdown.add_buffer(file_path=stem)
+    fake_render_datagram.duration = 0.1
+    log = fake_render_datagram.log
+    renderer = supriya.nonrealtime.SessionRenderer(
+        mixdown,
+        max_workers=4,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    exit_code, _, _ = renderer.render(duration=10)
+    assert exit_code == 0
+    assert len({renderer.renderable_prefixes[stem] for stem in stems}) == 1
+    # Stems sharing a file never render it at the same time
+    assert [action for action, _ in log] == ["start", "stop"] * (len(log) // 2)
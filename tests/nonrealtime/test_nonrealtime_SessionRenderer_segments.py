@@ -0,0 +1,175 @@
+import aifc
+
+import pytest
+
+import supriya.nonrealtime
+
+
+def find_segment(renderer, output_file_path):
+    (segment,) = [
+        renderable
+        for renderable, prefix in renderer.renderable_prefixes.items()
+        if prefix.name == output_file_path.stem
+    ]
+    return segment
+
+
+def find_rendered_segments(renderer, fake_render_datagram):
+    return [
+        find_segment(renderer, output_file_path)
+        for output_file_path, _ in fake_render_datagram.rendered
+    ]
+
+
+def patch_render_datagram(fake_render_datagram):
+    # Writes a mono ramp counting frames from the session's start, so that
+    # correctly joined segments reproduce the ramp exactly.
+    def write(renderer, output_file_path):
+        segment = find_segment(renderer, output_file_path)
+        sample_rate = renderer.sample_rate
+        start_frame = round(segment.warm_up_offset * sample_rate)
+        frame_count = round(segment.duration * sample_rate)
+        with aifc.open(str(output_file_path), "wb") as writer:
+            writer.aiff()
+            writer.setparams((1, 2, sample_rate, frame_count, b"NONE", b""))
+            writer.writeframes(
+                b"".join(
+                    (frame % 32768).to_bytes(2, "big", signed=True)
+                    for frame in range(start_frame, start_frame + frame_count)
+                )
+            )
+
+    fake_render_datagram.skip_existing = True
+    fake_render_datagram.write = write
+
+
+def read_frames(file_path):
+    with aifc.open(str(file_path), "rb") as reader:
+        data = reader.readframes(reader.getnframes())
+    return [
+        int.from_bytes(data[i : i + 2], "big", signed=True)
+        for i in range(0, len(data), 2)
+    ]
+
+
+def render(session, nonrealtime_paths, **kwargs):
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        sample_rate=1000,
+        **kwargs,
+    )
+    return renderer, renderer.render()
+
+
+def test_segment_request_bundles():
+    session = pytest.helpers.make_test_session()
+    with session.at(3):
+        buffer_ = session.add_buffer(frame_count=16, duration=4)
+        bus = session.add_bus()
+        bus.set_(0.5)
+    with session.at(4):
+        buffer_.fill([(0, 4, 0.25)])
+    bundles = session._to_non_xrefd_osc_bundles(start_offset=5.5, stop_offset=7)
+    lists = [bundle.to_list() for bundle in bundles]
+    synthdef = session.nodes_by_session_id[1000].synthdef
+    assert lists == [
+        [
+            0.0,
+            [
+                ["/d_recv", bytearray(synthdef.compile(use_anonymous_name=True))],
+                ["/b_alloc", 0, 16, 1],
+                ["/b_fill", 0, 0, 4, 0.25],
+                ["/s_new", synthdef.anonymous_name, 1000, 1, 0, "source", 0.5],
+                ["/c_set", 0, 0.5],
+            ],
+        ],
+        [0.5, [["/n_set", 1000, "source", 0.75]]],
+        [1.5, [[0]]],
+    ]
+
+
+@pytest.mark.parametrize(
+    "segment_offsets, pre_roll, crossfade, max_workers",
+    [
+        ([4, 8], 0.0, 0.0, 1),
+        ([4, 8], 1.0, 0.0, 4),
+        ([3.3, 6.1], 0.5, 0.25, 4),
+        (3, 1.0, 0.1, 2),
+    ],
+)
+def test_joined_output(
+    fake_render_datagram,
+    nonrealtime_paths,
+    segment_offsets,
+    pre_roll,
+    crossfade,
+    max_workers,
+):
+    session = pytest.helpers.make_test_session()
+    patch_render_datagram(fake_render_datagram)
+    renderer, (exit_code, _, output_file_path) = render(
+        session,
+        nonrealtime_paths,
+        crossfade=crossfade,
+        max_workers=max_workers,
+        pre_roll=pre_roll,
+        segment_offsets=segment_offsets,
+    )
+    assert exit_code == 0
+    segments = renderer.session_segments[session]
+    assert len(segments) == 3
+    rendered = find_rendered_segments(renderer, fake_render_datagram)
+    assert sorted(rendered) == sorted(segments)
+    for segment in segments:
+        assert segment.warm_up_offset <= max(segment.start_offset - pre_roll, 0)
+        assert round(segment.warm_up_offset * 1000) % 64 == 0
+    assert read_frames(output_file_path) == list(range(10000))
+
+
+def test_split_offsets_from_session_offsets(nonrealtime_paths):
+    session = pytest.helpers.make_test_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        segment_offsets=4,
+    )
+    renderer.to_osc_bundles()
+    segments = renderer.session_segments[session]
+    assert [segment.start_offset for segment in segments] == [0.0, 2.0, 4.0, 8.0]
+
+
+def test_segment_caching(fake_render_datagram, nonrealtime_paths):
+    session = pytest.helpers.make_test_session()
+    patch_render_datagram(fake_render_datagram)
+    render(session, nonrealtime_paths, segment_offsets=[4, 8])
+    assert len(fake_render_datagram.rendered) == 3
+    # Only the last segment's score changes
+    synth = session.nodes_by_session_id[1000]
+    with session.at(9):
+        synth["source"] = 0.5
+    fake_render_datagram.rendered.clear()
+    renderer, _ = render(session, nonrealtime_paths, segment_offsets=[4, 8])
+    assert find_rendered_segments(renderer, fake_render_datagram) == [
+        renderer.session_segments[session][-1]
+    ]
+
+
+def test_segmenting_session_with_input(nonrealtime_paths):
+    session = supriya.nonrealtime.Session(input_=pytest.helpers.make_test_session())
+    with session.at(0):
+        session.add_synth(duration=10)
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+        segment_offsets=[5],
+    )
+    with pytest.raises(ValueError):
+        renderer.to_osc_bundles()
+
+
+def test_unjoinable_sample_format():
+    with pytest.raises(ValueError):
+        supriya.nonrealtime.SessionRenderer(
+            supriya.nonrealtime.Session(), sample_format="float", segment_offsets=[1]
+        )
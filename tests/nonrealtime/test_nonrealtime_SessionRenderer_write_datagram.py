@@ -0,0 +1,109 @@
+import struct
+import types
+
+import pytest
+
+import supriya.nonrealtime
+
+
+def build_score(osc_bundles):
+    contents = b""
+    for osc_bundle in osc_bundles:
+        datagram = osc_bundle.to_datagram(realtime=False)
+        contents += struct.pack(">i", len(datagram)) + datagram
+    return contents
+
+
+def test_write_datagram(nonrealtime_paths):
+    session = pytest.helpers.make_test_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=nonrealtime_paths.render_directory_path
+    )
+    score = build_score(renderer.to_osc_bundles())
+    file_path = nonrealtime_paths.render_directory_path / "score.osc"
+    spooled_file_path = nonrealtime_paths.render_directory_path / "score.partial.osc"
+    spooled_file_path.write_bytes(score)
+    renderer._write_datagram(file_path, spooled_file_path)
+    assert file_path.read_bytes() == score
+    assert not spooled_file_path.exists()
+    assert renderer.transcript[-1].strip().startswith("Wrote")
+    spooled_file_path.write_bytes(score)
+    renderer._write_datagram(file_path, spooled_file_path)
+    assert renderer.transcript[-1].endswith("File already exists.")
+    # A truncated score is replaced
+    file_path.write_bytes(score[:-4])
+    renderer._write_datagram(file_path, spooled_file_path)
+    assert renderer.transcript[-1].strip().startswith("Wrote")
+    assert file_path.read_bytes() == score
+
+
+def test_streamed_score(nonrealtime_paths):
+    session = pytest.helpers.make_test_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=nonrealtime_paths.render_directory_path
+    )
+    score = build_score(renderer.to_osc_bundles())
+    renderable_prefix = renderer.renderable_prefixes[session]
+    session._discard_compiled_offset()
+    ((_, _, spooled_file_path),) = renderer._collect_prerender_tuples(
+        session, stream=True
+    )
+    # Hashed and spooled in one pass, retaining neither bundles nor datagrams
+    assert renderer.renderable_prefixes[session] == renderable_prefix
+    assert spooled_file_path.read_bytes() == score
+    assert not session._compiled_datagrams
+    renderer._discard_spooled_scores()
+    assert not list(nonrealtime_paths.render_directory_path.iterdir())
+
+
+def test_render_streams_score(fake_render_datagram, nonrealtime_paths):
+    session = pytest.helpers.make_test_session()
+    score = build_score(session.to_osc_bundles())
+    session._discard_compiled_offset()
+    render_cache = nonrealtime_paths.test_directory_path / "cache"
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        render_cache=render_cache,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    _, _, output_file_path = renderer.render()
+    osc_file_path = output_file_path.with_suffix(".osc")
+    assert osc_file_path.read_bytes() == score
+    assert not list(nonrealtime_paths.render_directory_path.glob("*.partial*"))
+    assert not session._compiled_datagrams
+    # Spooled scores are discarded when restored from the render cache
+    osc_file_path.unlink()
+    output_file_path.unlink()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session,
+        render_cache=render_cache,
+        render_directory_path=nonrealtime_paths.render_directory_path,
+    )
+    renderer.render()
+    assert output_file_path.exists()
+    assert not osc_file_path.exists()
+    assert not list(nonrealtime_paths.render_directory_path.glob("*.partial*"))
+
+
+def test_hash_matches_score(nonrealtime_paths):
+    session = pytest.helpers.make_test_session()
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=nonrealtime_paths.render_directory_path
+    )
+    osc_bundles = renderer.to_osc_bundles()
+    file_path = renderer._build_file_path([build_score(osc_bundles)], None, session)
+    assert renderer.renderable_prefixes[session] == file_path.with_suffix("")
+
+
+def test_lazy_request_bundles():
+    session = pytest.helpers.make_test_session()
+    request_bundles = session._iterate_non_xrefd_request_bundles()
+    assert isinstance(request_bundles, types.GeneratorType)
+    assert next(request_bundles).timestamp == 0.0
+    assert [request_bundle.timestamp for request_bundle in request_bundles] == [
+        2.0,
+        4.0,
+        6.0,
+        8.0,
+        10.0,
+    ]
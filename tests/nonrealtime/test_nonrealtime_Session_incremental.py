@@ -0,0 +1,82 @@
+import pytest
+
+import supriya.assets.synthdefs
+import supriya.nonrealtime
+
+
+def compile_fresh(session):
+    session._discard_compiled_offset()
+    session._compiled_settings = None
+    return [bundle.to_list() for bundle in session._to_non_xrefd_osc_bundles()]
+
+
+def edit_setting(session):
+    synth = session.nodes_by_session_id[1000]
+    with session.at(6):
+        synth["source"] = 0.5
+
+
+def edit_new_synthdef(session):
+    with session.at(1):
+        session.add_synth(synthdef=supriya.assets.synthdefs.default, duration=2)
+
+
+def edit_new_bus(session):
+    synth = session.nodes_by_session_id[1000]
+    bus = session.add_bus()
+    with session.at(3):
+        bus.set_(0.25)
+        synth["source"] = bus
+
+
+def edit_duration(session):
+    session.nodes_by_session_id[1000].set_duration(5)
+
+
+def edit_split(session):
+    with session.at(5):
+        session.nodes_by_session_id[1000].split()
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [edit_setting, edit_new_synthdef, edit_new_bus, edit_duration, edit_split],
+)
+def test_recompiles_edits(edit):
+    session = pytest.helpers.make_test_session()
+    session._to_non_xrefd_osc_bundles()
+    edit(session)
+    lists = [bundle.to_list() for bundle in session._to_non_xrefd_osc_bundles()]
+    assert lists == compile_fresh(session)
+
+
+def test_reuses_unchanged_offsets():
+    session = pytest.helpers.make_test_session()
+    old_bundles = session._to_non_xrefd_request_bundles()
+    edit_setting(session)
+    new_bundles = session._to_non_xrefd_request_bundles()
+    reused = [
+        new_bundle.timestamp
+        for old_bundle, new_bundle in zip(old_bundles, new_bundles)
+        if old_bundle is new_bundle
+    ]
+    # 6.0 was edited, and 10.0 ends the session
+    assert reused == [0.0, 2.0, 4.0, 8.0]
+    assert new_bundles[3].to_list() == [6.0, [["/n_set", 1000, "source", 0.5]]]
+
+
+def test_reuses_datagrams(nonrealtime_paths):
+    session = pytest.helpers.make_test_session()
+    osc_bundles = session._to_non_xrefd_osc_bundles()
+    for osc_bundle in osc_bundles[:-1]:
+        assert session._get_compiled_datagram(osc_bundle) == osc_bundle.to_datagram(
+            realtime=False
+        )
+    assert session._get_compiled_datagram(osc_bundles[-1]) is None
+    renderer = supriya.nonrealtime.SessionRenderer(
+        session, render_directory_path=nonrealtime_paths.render_directory_path
+    )
+    (_, _, osc_bundles), *_ = renderer._collect_prerender_tuples(session)
+    assert list(renderer._iterate_datagrams(osc_bundles, session)) == list(
+        renderer._iterate_datagrams(osc_bundles)
+    )
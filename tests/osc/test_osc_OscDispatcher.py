@@ -0,0 +1,98 @@
+import pytest
+
+from supriya.osc import OscCallback, OscDispatcher, OscMessage
+from supriya.osc.dispatchers import compile_address_pattern
+
+
+@pytest.mark.parametrize(
+    "pattern, address, expected",
+    [
+        ("/n_go", "/n_go", True),
+        ("/n_*", "/n_go", True),
+        ("/n_*", "/n_end", True),
+        ("/n_*", "/b_info", False),
+        ("/*", "/foo/bar", False),
+        ("/n_??", "/n_go", True),
+        ("/n_??", "/n_end", False),
+        ("/[bc]_set", "/c_set", True),
+        ("/[!bc]_set", "/c_set", False),
+        ("/[a-c]_info", "/b_info", True),
+        ("/{b,c}_setn", "/b_setn", True),
+        ("/{b,c}_setn", "/n_setn", False),
+    ],
+)
+def test_compile_address_pattern(pattern, address, expected):
+    assert bool(compile_address_pattern(pattern).match(address)) is expected
+
+
+def test_match():
+    dispatcher = OscDispatcher()
+    callbacks = [
+        OscCallback(pattern=("/n_go", 1000), procedure=lambda x: None),
+        OscCallback(pattern=("/n_go",), procedure=lambda x: None),
+        OscCallback(pattern=("/n_*",), procedure=lambda x: None),
+        OscCallback(pattern=("/n_end",), procedure=lambda x: None),
+        OscCallback(
+            pattern=("/done", "/b_alloc", 1),
+            failure_pattern=("/fail", "/b_alloc"),
+            procedure=lambda x: None,
+        ),
+    ]
+    for callback in callbacks:
+        dispatcher.add(callback)
+    assert dispatcher.match(OscMessage("/n_go", 1000, 0)) == [
+        callbacks[1],
+        callbacks[0],
+        callbacks[2],
+    ]
+    assert dispatcher.match(OscMessage("/n_go", 1001, 0)) == [
+        callbacks[1],
+        callbacks[2],
+    ]
+    assert dispatcher.match(OscMessage("/n_end", 1000)) == [
+        callbacks[3],
+        callbacks[2],
+    ]
+    assert dispatcher.match(OscMessage("/done", "/b_alloc", 1)) == [callbacks[4]]
+    assert dispatcher.match(OscMessage("/done", "/b_alloc", 2)) == []
+    assert dispatcher.match(OscMessage("/fail", "/b_alloc", "oops")) == [callbacks[4]]
+    assert dispatcher.match(OscMessage("/b_info", [1, 2])) == []
+    dispatcher.remove(callbacks[2])
+    assert callbacks[2] not in dispatcher
+    assert dispatcher.match(OscMessage("/n_go", 1000, 0)) == [
+        callbacks[1],
+        callbacks[0],
+    ]
+    # removing an absent callback is a no-op
+    dispatcher.remove(callbacks[2])
+    assert len(dispatcher) == 4
+
+
+def test_once():
+    dispatcher = OscDispatcher()
+    callback = OscCallback(
+        pattern=("/synced", 1),
+        failure_pattern=["/fail"],
+        procedure=lambda x: None,
+        once=True,
+    )
+    dispatcher.add(callback)
+    assert callback in dispatcher
+    assert dispatcher.match(OscMessage("/fail")) == [callback]
+    assert callback not in dispatcher
+    assert dispatcher.match(OscMessage("/synced", 1)) == []
+    assert dispatcher.tombstone_count == 1
+
+
+def test_compaction():
+    dispatcher = OscDispatcher()
+    persistent_callback = OscCallback(pattern=("/tr",), procedure=lambda x: None)
+    dispatcher.add(persistent_callback)
+    for i in range(5000):
+        dispatcher.add(
+            OscCallback(pattern=("/n_end", i), procedure=lambda x: None, once=True)
+        )
+        assert len(dispatcher.match(OscMessage("/n_end", i))) == 1
+    assert len(dispatcher) == 1
+    assert dispatcher.tombstone_count <= 1024
+    assert dispatcher.match(OscMessage("/tr", 1000, 0, 1.0)) == [persistent_callback]
@@ -51,3 +51,49 @@ def test():
     ), ['a', 'b', ['c', 'd']])
     """
     )
+
+
+def test_from_datagram_homogeneous_runs():
+    osc_message = supriya.osc.OscMessage(
+        "/b_setn", 1, 0, 512, *[float(i) / 2 for i in range(512)], "foo", 2, 3
+    )
+    datagram = osc_message.to_datagram()
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+    assert supriya.osc.OscMessage.from_datagram(memoryview(datagram)) == osc_message
+    assert supriya.osc.OscMessage.from_datagram(bytearray(datagram)) == osc_message
+
+
+def test_from_datagram_nested_bundle():
+    osc_bundle = supriya.osc.OscBundle(
+        timestamp=1401557034.5,
+        contents=(
+            supriya.osc.OscMessage("/one", b"\x00\x01\x02", [1, [2.5, "x"]]),
+            supriya.osc.OscBundle(
+                contents=(supriya.osc.OscMessage("/two", 2.0, 3.0, 4.0),)
+            ),
+        ),
+    )
+    datagram = osc_bundle.to_datagram()
+    assert supriya.osc.OscBundle.from_datagram(datagram) == osc_bundle
+
+
+def test_to_datagram_buffer():
+    osc_message = supriya.osc.OscMessage("/n_setn", 1000, 0, 3, 0.5, 1.5, 2.5, 7)
+    osc_bundle = supriya.osc.OscBundle(contents=(osc_message, osc_message))
+    buffer_ = bytearray(b"xyz")
+    assert osc_message.to_datagram(buffer=buffer_) is buffer_
+    assert buffer_ == b"xyz" + osc_message.to_datagram()
+    buffer_.clear()
+    osc_bundle.to_datagram(realtime=False, buffer=buffer_)
+    assert buffer_ == osc_bundle.to_datagram(realtime=False)
+    assert supriya.osc.OscBundle.from_datagram(buffer_) == osc_bundle
+
+
+def test_type_tag_cache_is_bounded():
+    for index in range(2000):
+        contents = [1.5] * (index % 7) + [index] * (index % 5) + ["foo"]
+        osc_message = supriya.osc.OscMessage("/foo/{}".format(index), *contents)
+        datagram = osc_message.to_datagram()
+        assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+    cache_info = supriya.osc.messages._encode_type_tags.cache_info()
+    assert cache_info.currsize <= cache_info.maxsize == 1024
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import socket
 import time
 
 import pytest
@@ -7,6 +8,9 @@ import pytest
 from supriya.osc import (
     AsyncOscProtocol,
     HealthCheck,
+    OscBundle,
+    OscMessage,
+    OscSendQueue,
     ThreadedOscProtocol,
     find_free_port,
 )
@@ -79,3 +83,136 @@ def test_ThreadedOscProtocol():
             break
     assert healthcheck_failed
     assert not osc_protocol.is_running
+
+
+@pytest.mark.parametrize("batch_size", [None, 16])
+@pytest.mark.timeout(30)
+def test_ThreadedOscProtocol_burst(batch_size):
+    received = []
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(5)
+    osc_protocol = ThreadedOscProtocol(batch_size=batch_size)
+    try:
+        osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+        osc_protocol.register(pattern="/tr", procedure=received.append)
+        osc_protocol.send(OscMessage("/notify", 1))
+        datagram, address = peer.recvfrom(8192)
+        assert OscMessage.from_datagram(datagram) == OscMessage("/notify", 1)
+        for i in range(200):
+            peer.sendto(OscMessage("/tr", 1000, i, 0.5).to_datagram(), address)
+        for _ in range(50):
+            if len(received) == 200:
+                break
+            time.sleep(0.1)
+        assert [message.contents[1] for message in received] == list(range(200))
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+
+
+def _receive_messages(peer, count):
+    messages = []
+    while len(messages) < count:
+        datagram = peer.recv(65536)
+        if datagram.startswith(b"#bundle"):
+            bundle = OscBundle.from_datagram(datagram)
+            assert len(datagram) <= 8192
+            messages.extend(bundle.contents)
+        else:
+            messages.append(OscMessage.from_datagram(datagram))
+    return messages
+
+
+@pytest.mark.timeout(30)
+def test_ThreadedOscProtocol_coalesce():
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(5)
+    osc_protocol = ThreadedOscProtocol(coalesce_window=0.05)
+    try:
+        osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+        messages = [
+            OscMessage("/n_set", 1000 + i, "amplitude", 0.5) for i in range(500)
+        ]
+        for message in messages:
+            osc_protocol.send(message)
+        # Bundles are emitted as they fill, the remainder after the window.
+        assert _receive_messages(peer, 500) == messages
+        assert not osc_protocol.send_queue.groups
+        # A /sync flushes immediately, without waiting for the window.
+        osc_protocol.send_queue.window = 60
+        osc_protocol.send(OscMessage("/n_free", 1000))
+        osc_protocol.send(OscMessage("/sync", 1))
+        assert _receive_messages(peer, 2) == [
+            OscMessage("/n_free", 1000),
+            OscMessage("/sync", 1),
+        ]
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+
+
+def test_OscSendQueue_sync_is_last():
+    send_queue = OscSendQueue(window=60)
+    timestamp = int(time.time()) + 3600
+    send_queue.add(OscMessage("/n_free", 1000))
+    send_queue.add(
+        OscBundle(timestamp=timestamp, contents=[OscMessage("/n_free", 1001)])
+    )
+    datagrams = send_queue.add(OscMessage("/sync", 1))
+    assert [OscBundle.from_datagram(x) for x in datagrams] == [
+        OscBundle(timestamp=timestamp, contents=[OscMessage("/n_free", 1001)]),
+        OscBundle(contents=[OscMessage("/n_free", 1000), OscMessage("/sync", 1)]),
+    ]
+    assert not send_queue.groups
+
+
+def test_OscSendQueue_due_bundles_are_not_held():
+    send_queue = OscSendQueue(window=60)
+    message = OscMessage("/n_free", 1000)
+    assert send_queue.add(message) == []
+    later_bundle = OscBundle(
+        timestamp=int(time.time()) + 3600, contents=[OscMessage("/n_free", 1001)]
+    )
+    assert send_queue.add(later_bundle) == []
+    # Due within the window, so everything queued goes out now, in order.
+    due_bundle = OscBundle(
+        timestamp=int(time.time()) + 1, contents=[OscMessage("/n_free", 1002)]
+    )
+    datagrams = send_queue.add(due_bundle)
+    assert datagrams[0] == message.to_datagram()
+    assert [OscBundle.from_datagram(x) for x in datagrams[1:]] == [
+        later_bundle,
+        due_bundle,
+    ]
+    assert not send_queue.groups
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_AsyncOscProtocol_coalesce():
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    peer.settimeout(5)
+    osc_protocol = AsyncOscProtocol(coalesce_window=0.05)
+    try:
+        await osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+        messages = [OscMessage("/n_set", 1000 + i, "amplitude", 0.5) for i in range(10)]
+        for message in messages:
+            osc_protocol.send(message)
+        timestamp = int(time.time()) + 3600
+        osc_protocol.send(OscBundle(timestamp=timestamp, contents=messages[:2]))
+        osc_protocol.send(OscBundle(timestamp=timestamp, contents=messages[2:4]))
+        await asyncio.sleep(0.2)
+        bundles = sorted(
+            [OscBundle.from_datagram(peer.recv(65536)) for _ in range(2)],
+            key=lambda x: x.timestamp or 0,
+        )
+        assert bundles == [
+            OscBundle(contents=messages),
+            OscBundle(timestamp=timestamp, contents=messages[:4]),
+        ]
+    finally:
+        await osc_protocol.disconnect()
+        peer.close()
@@ -1,3 +1,8 @@
+import threading
+import types
+
+import pytest
+
 import supriya.patterns
 import supriya.realtime
 
@@ -132,3 +137,26 @@ def test_iterate_inner_5(pseudo_server):
         (4.0, (4, 0), True),
         (5.0, (5, 0), True),
     ]
+
+
+def test_stop_releases_node_ids(pseudo_server):
+    pseudo_server.is_running = False
+    pseudo_server.node_id_allocator = supriya.realtime.NodeIdAllocator(
+        recycling_threshold=0
+    )
+    clock = types.SimpleNamespace(cancel=lambda event_id: None)
+    pattern = supriya.patterns.Pbind(
+        duration=1.0, frequency=supriya.patterns.Pseq([111, 222])
+    )
+    player = supriya.patterns.EventPlayer(pattern, server=pseudo_server, clock=clock)
+    moment = pytest.helpers.make_moment(10)
+    thread = threading.Thread(
+        target=player, args=(moment, moment, None), kwargs=dict(communicate=False)
+    )
+    thread.start()
+    thread.join()
+    assert pseudo_server.node_id_allocator._blocks
+    player.stop()
+    assert not pseudo_server.node_id_allocator._blocks
+    # The rest of the clock thread's block is recycled, not fresh IDs past it
+    assert pseudo_server.node_id_allocator.allocate_node_id() < 1000 + 4096
@@ -0,0 +1,72 @@
+import random
+
+import supriya.realtime
+
+
+def test_coalescing():
+    allocator = supriya.realtime.BlockAllocator(heap_minimum=0, heap_maximum=16)
+    assert allocator.allocate_many([4, 4, 4, 4, 4]) == [0, 4, 8, 12, None]
+    allocator.free(4)
+    allocator.free(12)
+    statistics = allocator.statistics()
+    assert statistics.free_block_count == 2
+    assert statistics.free_size == 8
+    assert statistics.largest_free_block_size == 4
+    assert statistics.used_block_count == 2
+    assert statistics.used_size == 8
+    assert statistics.fragmentation == 0.5
+    assert allocator.allocate(8) is None
+    allocator.free(9)  # inner index of the block at 8
+    statistics = allocator.statistics()
+    assert statistics.free_block_count == 1
+    assert statistics.largest_free_block_size == 12
+    assert statistics.fragmentation == 0.0
+    assert allocator.allocate(12) == 4
+
+
+def test_best_fit():
+    allocator = supriya.realtime.BlockAllocator(heap_minimum=0, heap_maximum=32)
+    assert allocator.allocate_many([8, 2, 4, 2, 16]) == [0, 8, 10, 14, 16]
+    allocator.free(0)
+    allocator.free(10)
+    assert allocator.allocate(3) == 10
+    assert allocator.allocate(8) == 0
+    assert allocator.allocate(1) == 13
+
+
+def test_unbounded():
+    allocator = supriya.realtime.BlockAllocator()
+    assert allocator.allocate_many([1, 2, 3]) == [0, 1, 3]
+    allocator.free(1)
+    statistics = allocator.statistics()
+    assert statistics.free_block_count == 2
+    assert statistics.largest_free_block_size == float("inf")
+    assert statistics.fragmentation == 0.0
+    allocator.free(0)
+    allocator.free(3)
+    assert allocator.statistics().free_block_count == 1
+    assert allocator.allocate(1000) == 0
+
+
+def test_random():
+    random.seed(0)
+    allocator = supriya.realtime.BlockAllocator(heap_minimum=0, heap_maximum=1024)
+    used = {}
+    for _ in range(5000):
+        if used and random.random() < 0.5:
+            block_id = random.choice(list(used))
+            allocator.free(block_id)
+            del used[block_id]
+            continue
+        size = random.randint(1, 32)
+        block_id = allocator.allocate(size)
+        if block_id is None:
+            continue
+        assert 0 <= block_id and block_id + size <= 1024
+        for other_id, other_size in used.items():
+            assert block_id + size <= other_id or other_id + other_size <= block_id
+        used[block_id] = size
+    statistics = allocator.statistics()
+    assert statistics.used_block_count == len(used)
+    assert statistics.used_size == sum(used.values())
+    assert statistics.free_size + statistics.used_size == 1024
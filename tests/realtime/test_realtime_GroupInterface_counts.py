@@ -0,0 +1,61 @@
+import supriya.assets.synthdefs
+import supriya.realtime
+
+
+def test_nested_moves():
+    outer = supriya.realtime.Group()
+    inner = supriya.realtime.Group()
+    default = supriya.realtime.Synth(synthdef=supriya.assets.synthdefs.default)
+    test = supriya.realtime.Synth(synthdef=supriya.assets.synthdefs.test)
+    inner.extend([default, test])
+    assert sorted(inner.controls) == ["amplitude", "frequency", "gate", "out", "pan"]
+    outer.append(inner)
+    assert outer.controls.as_counts() == {
+        "amplitude": 2,
+        "frequency": 2,
+        "gate": 1,
+        "out": 1,
+        "pan": 1,
+    }
+    assert outer.controls.as_dict()["amplitude"] == {default, test}
+    assert outer.controls.as_dict()["gate"] == {default}
+    outer.append(test)
+    assert outer.controls.as_counts()["amplitude"] == 2
+    assert inner.controls.as_counts() == dict.fromkeys(
+        ["amplitude", "frequency", "gate", "out", "pan"], 1
+    )
+    inner.remove(default)
+    assert sorted(inner.controls) == []
+    assert "gate" not in inner.controls
+    assert sorted(outer.controls) == ["amplitude", "frequency"]
+    assert set(outer.controls._iterate_synths("amplitude")) == {test}
+
+
+def test_register_controls():
+    group = supriya.realtime.Group()
+    synth = supriya.realtime.Synth(register_controls=False)
+    group.append(synth)
+    assert len(group.controls) == 0
+    assert "amplitude" not in group.controls
+
+
+def test_iterate_synths_skips_subtrees(mocker):
+    outer = supriya.realtime.Group()
+    defaults = [
+        supriya.realtime.Synth(synthdef=supriya.assets.synthdefs.default)
+        for _ in range(3)
+    ]
+    tests = [
+        supriya.realtime.Synth(synthdef=supriya.assets.synthdefs.test) for _ in range(3)
+    ]
+    outer.extend(
+        [
+            supriya.realtime.Group([defaults[0], supriya.realtime.Group(defaults[1:])]),
+            supriya.realtime.Group(tests),
+        ]
+    )
+    spy = mocker.spy(supriya.realtime.SynthInterface, "_counts_control")
+    assert list(outer.controls._iterate_synths("gate")) == defaults
+    # The group of test synths, which have no gate, is never entered
+    assert spy.call_count == 3
+    assert list(outer.controls._iterate_synths("amplitude")) == defaults + tests
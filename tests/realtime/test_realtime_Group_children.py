@@ -0,0 +1,70 @@
+import pytest
+
+import supriya.realtime
+from supriya.realtime.nodes import GroupChildren
+
+
+def test_GroupChildren():
+    children = GroupChildren("bd")
+    children.insert_head("a")
+    children.insert_before("d", "c")
+    children.insert_after("d", "e")
+    assert list(children) == ["a", "b", "c", "d", "e"]
+    assert list(reversed(children)) == ["e", "d", "c", "b", "a"]
+    assert children[1] == "b"
+    assert children[-1] == "e"
+    assert children[1:3] == ["b", "c"]
+    assert children.index("d") == 3
+    children.replace("c", "x")
+    children.remove("a")
+    assert children.pop() == "e"
+    assert list(children) == ["b", "x", "d"]
+    children[1:2] = ["y", "z"]
+    del children[0]
+    children.insert(-1, "w")
+    assert list(children) == ["y", "z", "w", "d"]
+    assert "w" in children and "x" not in children
+    with pytest.raises(ValueError):
+        children.append("w")
+    with pytest.raises(ValueError):
+        children.index("x")
+    with pytest.raises(IndexError):
+        children[4]
+
+
+def test_Group_children():
+    group = supriya.realtime.Group()
+    synths = [supriya.realtime.Synth() for _ in range(1000)]
+    group.extend(synths)
+    assert len(group) == 1000
+    assert all(synth in group for synth in synths)
+    assert group.index(synths[500]) == 500
+    group.remove(synths[500])
+    assert synths[500] not in group
+    assert synths[500].parent is None
+    group.insert(0, synths[500])
+    assert group[0] is synths[500]
+    assert group.children[:2] == (synths[500], synths[0])
+    with pytest.raises(ValueError):
+        group.index(supriya.realtime.Synth())
+
+
+def test_Group_children_positional():
+    group = supriya.realtime.Group()
+    for _ in range(3000):
+        group.append(supriya.realtime.Group())
+    children = group._children
+    assert [group.index(group[i]) for i in range(len(group))] == list(range(3000))
+    positional = children._list
+    # Edits at either end, or at a known position, patch the positional list
+    group.append(supriya.realtime.Group())
+    group.insert(0, supriya.realtime.Group())
+    group.insert(1500, supriya.realtime.Group())
+    del group[-1]
+    group.pop(0)
+    assert children._list is positional
+    assert positional == list(children)
+    # Moves relative to another child drop it, to be rebuilt on demand
+    children.insert_after(group[10], supriya.realtime.Group())
+    assert children._list is None
+    assert group[11] is list(children)[11]
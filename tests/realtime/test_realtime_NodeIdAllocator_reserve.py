@@ -0,0 +1,91 @@
+import threading
+
+import supriya.realtime
+
+
+def test_reserve_node_ids():
+    allocator = supriya.realtime.NodeIdAllocator()
+    allocator.reserve_node_ids(8)
+    assert [allocator.allocate_node_id() for _ in range(3)] == [1000, 1001, 1002]
+    # Other threads allocate past the reserved block
+    node_ids = []
+    thread = threading.Thread(
+        target=lambda: node_ids.append(allocator.allocate_node_id())
+    )
+    thread.start()
+    thread.join()
+    assert node_ids == [1008]
+    assert allocator.allocate_node_id(4) == 1009
+    assert [allocator.allocate_node_id() for _ in range(6)] == [
+        1003,
+        1004,
+        1005,
+        1006,
+        1007,
+        1013,
+    ]
+
+
+def test_reserve_node_ids_threads():
+    allocator = supriya.realtime.NodeIdAllocator()
+    node_ids = []
+
+    def allocate():
+        allocator.reserve_node_ids(64)
+        node_ids.extend(allocator.allocate_node_id() for _ in range(1000))
+
+    threads = [threading.Thread(target=allocate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(node_ids)) == 8000
+
+
+def test_free_node_id():
+    allocator = supriya.realtime.NodeIdAllocator(client_id=1, recycling_threshold=2)
+    mask = 1 << 26
+    node_ids = [allocator.allocate_node_id() for _ in range(4)]
+    assert node_ids == [mask | 1000, mask | 1001, mask | 1002, mask | 1003]
+    allocator.free_node_id(1001)  # another client's
+    allocator.free_node_id(mask | 1)  # permanent
+    for node_id in node_ids[:3]:
+        allocator.free_node_id(node_id)
+    assert allocator.allocate_node_id() == mask | 1000
+    assert allocator.allocate_node_id() == mask | 1004
+
+
+def test_release_node_ids():
+    allocator = supriya.realtime.NodeIdAllocator(recycling_threshold=0)
+    allocator.reserve_node_ids(4)
+    assert allocator.allocate_node_id() == 1000
+    allocator.release_node_ids()
+    assert [allocator.allocate_node_id() for _ in range(4)] == [1001, 1002, 1003, 1004]
+
+
+def test_exhausted():
+    allocator = supriya.realtime.NodeIdAllocator(initial_node_id=0x03FFFFFD)
+    assert allocator.allocate_node_id() == 0x03FFFFFD
+    assert allocator.allocate_node_id() == 0x03FFFFFE
+    allocator.free_node_id(0x03FFFFFD)
+    # Fresh node IDs are exhausted, so freed node IDs are recycled
+    assert allocator.allocate_node_id() == 0x03FFFFFD
+    # Then fresh node IDs wrap around
+    assert allocator.allocate_node_id() == 0x03FFFFFD
+
+
+def test_release_node_ids_other_thread():
+    allocator = supriya.realtime.NodeIdAllocator(recycling_threshold=0)
+    thread_ids = []
+
+    def allocate():
+        allocator.reserve_node_ids(4)
+        allocator.allocate_node_id()
+        thread_ids.append(threading.get_ident())
+
+    thread = threading.Thread(target=allocate)
+    thread.start()
+    thread.join()
+    allocator.release_node_ids(thread_ids[0])
+    allocator.release_node_ids(thread_ids[0])
+    assert [allocator.allocate_node_id() for _ in range(4)] == [1001, 1002, 1003, 1004]
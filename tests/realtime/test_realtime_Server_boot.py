@@ -55,6 +55,23 @@ def test_boot_options():
             server.quit()
 
 
+def test_boot_osc_protocol_options():
+    server = supriya.realtime.Server(batch_size=16, coalesce_window=0.005)
+    assert (server.batch_size, server.coalesce_window) == (16, 0.005)
+    try:
+        server.boot()
+        assert server.osc_protocol.batch_size == 16
+        assert server.osc_protocol.send_queue.window == 0.005
+        synth = supriya.realtime.Synth().allocate(server)
+        synth["frequency"] = 443
+        server.sync()
+        server_state = str(server.query_remote_nodes(include_controls=True))
+        assert "frequency: 443.0" in server_state
+    finally:
+        if server.is_running:
+            server.quit()
+
+
 @pytest.mark.skip("Reimplementing")
 def test_server_boot_errors():
     def check_scsynth():
@@ -0,0 +1,44 @@
+import supriya.realtime
+from supriya.osc import OscMessage
+
+
+def test_node_liveness():
+    server = supriya.realtime.Server(mirror_nodes=False)
+    assert not server.mirror_nodes
+    server._node_id_allocator = supriya.realtime.NodeIdAllocator(
+        recycling_threshold=0
+    )
+    assert server.node_id_allocator.allocate_node_id() == 1000
+    server._handle_node_liveness_response(OscMessage("/n_go", 1000, 1, -1, -1, 0))
+    assert server.is_node_live(1000)
+    assert not server.is_node_live(1001)
+    server._handle_node_liveness_response(OscMessage("/n_end", 1000, -1, -1, -1, 0))
+    assert not server.is_node_live(1000)
+    assert not server._nodes
+    # Confirmed freed node IDs are recycled
+    assert server.node_id_allocator.allocate_node_id() == 1000
+
+
+def test_node_liveness_local_nodes():
+    server = supriya.realtime.Server(mirror_nodes=False)
+    server._is_running = True
+    server._node_id_allocator = supriya.realtime.NodeIdAllocator(
+        recycling_threshold=0
+    )
+    synth = supriya.realtime.Synth()
+    group = supriya.realtime.Group([synth])
+    group._register_with_local_server(node_id=1, server=server)
+    synth._register_with_local_server(server=server)
+    assert server._nodes == {1: group, 1000: synth}
+    server._handle_node_liveness_response(OscMessage("/n_end", 1000, 1, -1, -1, 0))
+    # The ended synth is unregistered before its node ID is reused
+    assert server._nodes == {1: group}
+    assert len(group) == 0
+    assert synth.node_id is None and not synth.is_allocated
+    assert server.node_id_allocator.allocate_node_id() == 1000
+
+
+def test_mirror_nodes_default():
+    server = supriya.realtime.Server()
+    assert server.mirror_nodes
+    assert not server.is_node_live(1000)
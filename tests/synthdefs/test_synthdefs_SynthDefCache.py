@@ -0,0 +1,127 @@
+import pytest
+
+import supriya
+import supriya.synthdefs
+import supriya.ugens
+from supriya.synthdefs import SynthDefCache, SynthDefCompiler
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = SynthDefCache(maximum_size=2)
+    monkeypatch.setattr(SynthDefCache, "_default_cache", cache)
+    return cache
+
+
+def build_synthdef(frequency=440, name=None, range_=None):
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        builder._add_parameter(
+            supriya.synthdefs.Parameter(name="amplitude", range_=range_, value=0.1)
+        )
+        sin_osc = supriya.ugens.SinOsc.ar(frequency=frequency)
+        supriya.ugens.Out.ar(bus=0, source=sin_osc * builder["amplitude"])
+    return builder.build(name=name)
+
+
+def test_memory_hit(cache, mocker):
+    synthdef_a = build_synthdef(name="a")
+    spy = mocker.spy(SynthDefCompiler, "compile_ugen_graph")
+    synthdef_b = build_synthdef(name="b")
+    assert spy.call_count == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert synthdef_a.ugens is synthdef_b.ugens
+    assert synthdef_a.anonymous_name == synthdef_b.anonymous_name
+    assert synthdef_b.actual_name == "b"
+    assert synthdef_b.compile() == build_synthdef(name="b").compile()
+
+
+def test_parameter_metadata(cache):
+    synthdef_a = build_synthdef()
+    synthdef_b = build_synthdef(range_=supriya.synthdefs.Range(0, 2))
+    assert synthdef_a.anonymous_name == synthdef_b.anonymous_name
+    assert synthdef_a.ugens is not synthdef_b.ugens
+    assert synthdef_a.parameters["amplitude"].range_ is None
+    assert synthdef_b.parameters["amplitude"].range_.maximum == 2
+    assert len(cache) == 2
+
+
+def test_eviction(cache):
+    build_synthdef(frequency=440)
+    build_synthdef(frequency=441)
+    build_synthdef(frequency=440)
+    build_synthdef(frequency=442)
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 3)
+    build_synthdef(frequency=441)
+    assert (cache.hits, cache.misses) == (1, 4)
+    build_synthdef(frequency=442)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_disk_hit(cache, mocker, tmp_path):
+    cache.directory_path = tmp_path
+    range_ = supriya.synthdefs.Range(0, 2)
+    synthdef_a = build_synthdef(range_=range_)
+    assert len(list(tmp_path.glob("*.scsyndef"))) == 1
+    # Simulate a restart with an empty memory cache.
+    warm_cache = SynthDefCache(directory_path=tmp_path)
+    mocker.patch.object(SynthDefCache, "_default_cache", warm_cache)
+    compile_spy = mocker.spy(SynthDefCompiler, "compile_ugen_graph")
+    sort_spy = mocker.spy(supriya.synthdefs.SynthDef, "_sort_ugens_topologically")
+    synthdef_b = build_synthdef(range_=range_)
+    assert compile_spy.call_count == sort_spy.call_count == 0
+    assert synthdef_a.ugens is not synthdef_b.ugens
+    assert synthdef_a.compile() == synthdef_b.compile()
+    assert synthdef_a.anonymous_name == synthdef_b.anonymous_name
+    assert synthdef_b.parameters["amplitude"].range_.maximum == 2
+    # Decompiled from disk, then held in memory
+    assert build_synthdef(range_=range_).ugens is synthdef_b.ugens
+
+
+def test_disk_mismatch(cache, tmp_path):
+    cache.directory_path = tmp_path
+    synthdef_a = build_synthdef(frequency=440)
+    synthdef_b = build_synthdef(frequency=441)
+    key_a, key_b = [cache.hash_ugen_graph(_.ugens) for _ in (synthdef_a, synthdef_b)]
+    (file_path_a,) = tmp_path.glob("{}.scsyndef".format(key_a))
+    (file_path_b,) = tmp_path.glob("{}.scsyndef".format(key_b))
+    assert cache.read(key_a).anonymous_name == synthdef_a.anonymous_name
+    # A file stored under the wrong key is ignored
+    file_path_a.write_bytes(file_path_b.read_bytes())
+    assert cache.read(key_a) is None
+    # As is a truncated one
+    file_path_b.write_bytes(file_path_b.read_bytes()[:-8])
+    assert cache.read(key_b) is None
+
+
+def test_default_is_opt_in(monkeypatch, mocker):
+    monkeypatch.setattr(SynthDefCache, "_default_cache", None)
+    assert SynthDefCache.default() is None
+    spy = mocker.spy(SynthDefCache, "hash_ugen_graph")
+    build_synthdef()
+    assert spy.call_count == 0
+    cache = SynthDefCache()
+    SynthDefCache.set_default(cache)
+    assert SynthDefCache.default() is cache
+    build_synthdef()
+    assert len(cache) == 1
+
+
+def test_disabled(mocker):
+    disabled_cache = SynthDefCache(maximum_size=0)
+    mocker.patch.object(SynthDefCache, "_default_cache", disabled_cache)
+    spy = mocker.spy(SynthDefCache, "hash_ugen_graph")
+    build_synthdef()
+    build_synthdef()
+    assert spy.call_count == 0
+    assert len(disabled_cache) == 0
+
+
+def test_version_salt(cache, monkeypatch):
+    synthdef = build_synthdef()
+    key = cache.hash_ugen_graph(synthdef.ugens)
+    monkeypatch.setattr(supriya, "__version__", "0.0.0")
+    assert cache.hash_ugen_graph(synthdef.ugens) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(SynthDefCache, "_format_version", 0)
+    assert cache.hash_ugen_graph(synthdef.ugens) != key
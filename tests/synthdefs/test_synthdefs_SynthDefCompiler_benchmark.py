@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+import supriya.synthdefs
+import supriya.ugens
+from supriya import SynthDefFactory
+
+
+def build_additive_synthdef(voice_count):
+    def signal_block(builder, source, state):
+        partials = []
+        for i in range(voice_count):
+            frequency = builder["frequency"] * (i + 1)
+            vibrato = supriya.ugens.LFNoise1.kr(frequency=0.1 * i + 1) * frequency
+            partials.append(
+                supriya.ugens.SinOsc.ar(frequency=vibrato * 0.01 + frequency)
+                * (1.0 / (i + 1))
+            )
+        return supriya.ugens.Mix.new(partials) * builder["amplitude"]
+
+    factory = SynthDefFactory(channel_count=2, frequency=440, amplitude=0.1)
+    factory = factory.with_signal_block(signal_block)
+    factory = factory.with_gate()
+    factory = factory.with_output()
+    return factory.build(name="additive")
+
+
+@pytest.mark.parametrize("voice_count", [16, 64])
+def test_benchmark(voice_count):
+    start_time = time.perf_counter()
+    synthdef = build_additive_synthdef(voice_count)
+    build_time = time.perf_counter() - start_time
+    # SynthDef caches its compiled graph at build time, so time a recompile.
+    start_time = time.perf_counter()
+    compiled_ugen_graph = supriya.synthdefs.SynthDefCompiler.compile_ugen_graph(
+        synthdef
+    )
+    compile_time = time.perf_counter() - start_time
+    assert compiled_ugen_graph == synthdef._compiled_ugen_graph
+    # Compiling is linear in the graph, so it stays well below building it.
+    assert compile_time < build_time
+    compiled_synthdef = synthdef.compile()
+    decompiled_synthdef = supriya.synthdefs.SynthDefDecompiler.decompile_synthdefs(
+        compiled_synthdef
+    )[0]
+    assert decompiled_synthdef.compile() == compiled_synthdef
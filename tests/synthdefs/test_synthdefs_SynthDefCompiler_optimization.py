@@ -77,3 +77,73 @@ def test_SynthDefCompiler_optimization_01_supriya_vs_sclang(py_synthdef):
     sc_compiled_synthdef = bytes(sc_synthdef.compile())
     py_compiled_synthdef = py_synthdef.compile()
     assert py_compiled_synthdef == sc_compiled_synthdef
+
+
+def test_SynthDefCompiler_optimization_02_deduplication():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        sine_a = supriya.ugens.SinOsc.ar(frequency=440)
+        sine_b = supriya.ugens.SinOsc.ar(frequency=440)
+        sine_c = supriya.ugens.SinOsc.ar(frequency=sine_a)  # noqa
+        supriya.ugens.Out.ar(bus=0, source=[sine_a * 0.5, sine_b * 0.5])
+    optimized = builder.build("optimized", deduplicate=True)
+    unoptimized = builder.build("optimized", optimize=False)
+    # Deduplication is opt-in, so default compiled bytes are unchanged
+    assert [type(_).__name__ for _ in builder.build("optimized").ugens] == [
+        "SinOsc",
+        "BinaryOpUGen",
+        "SinOsc",
+        "BinaryOpUGen",
+        "Out",
+    ]
+    assert [type(_).__name__ for _ in optimized.ugens] == [
+        "SinOsc",
+        "BinaryOpUGen",
+        "Out",
+    ]
+    assert optimized.ugens[2].inputs[1:] == (
+        optimized.ugens[1][0],
+        optimized.ugens[1][0],
+    )
+    assert len(unoptimized.ugens) == 6
+
+
+def test_SynthDefCompiler_optimization_03_deduplication_skips_random():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        source = supriya.ugens.DC.kr(source=1)
+        rand_a = supriya.synthdefs.UGenMethodMixin._compute_unary_op(
+            source, supriya.UnaryOperator.RAND
+        )
+        rand_b = supriya.synthdefs.UGenMethodMixin._compute_unary_op(
+            source, supriya.UnaryOperator.RAND
+        )
+        supriya.ugens.Out.kr(bus=0, source=[rand_a, rand_b])
+    synthdef = builder.build("optimized", deduplicate=True)
+    assert [type(_).__name__ for _ in synthdef.ugens] == [
+        "DC",
+        "UnaryOpUGen",
+        "UnaryOpUGen",
+        "Out",
+    ]
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        vibrato_a = supriya.ugens.Vibrato.ar(frequency=440, rate_variation=0.5)
+        vibrato_b = supriya.ugens.Vibrato.ar(frequency=440, rate_variation=0.5)
+        supriya.ugens.Out.ar(
+            bus=0,
+            source=[
+                supriya.ugens.SinOsc.ar(vibrato_a),
+                supriya.ugens.SinOsc.ar(vibrato_b),
+            ],
+        )
+    synthdef = builder.build("optimized", deduplicate=True)
+    assert len(synthdef.ugens) == 5
+
+
+def test_SynthDefCompiler_optimization_04_decompile_is_faithful():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        sine_a = supriya.ugens.SinOsc.ar(frequency=440)
+        sine_b = supriya.ugens.SinOsc.ar(frequency=440)
+        supriya.ugens.Out.ar(bus=0, source=[sine_a, sine_b])
+    compiled = builder.build("unoptimized", optimize=False).compile()
+    decompiled = supriya.synthdefs.SynthDefDecompiler.decompile_synthdefs(compiled)[0]
+    assert len(decompiled.ugens) == 3
+    assert decompiled.compile() == compiled
@@ -147,3 +147,33 @@ def test_SynthDefDecompiler_08():
     assert compiled_synthdef == new_synthdef.compile()
     assert old_synthdef.anonymous_name == new_synthdef.anonymous_name
     assert old_synthdef.name == new_synthdef.name
+
+
+def test_SynthDefDecompiler_09(tmp_path):
+    r"""Streaming SynthDefs from a multi-SynthDef file."""
+    import supriya.assets.synthdefs
+
+    old_synthdefs = [
+        supriya.assets.synthdefs.default,
+        supriya.assets.synthdefs.simple_sine,
+        supriya.assets.synthdefs.test,
+    ]
+    compiled_synthdefs = supriya.synthdefs.SynthDefCompiler.compile_synthdefs(
+        old_synthdefs
+    )
+    file_path = tmp_path / "synthdefs.scsyndef"
+    file_path.write_bytes(compiled_synthdefs)
+    iterator = decompiler.iterate_synthdefs(file_path)
+    new_synthdef = next(iterator)
+    assert new_synthdef.compile() == old_synthdefs[0].compile()
+    new_synthdefs = [new_synthdef, *iterator]
+    assert [_.compile() for _ in new_synthdefs] == [
+        _.compile() for _ in old_synthdefs
+    ]
+    assert new_synthdefs == decompiler.decompile_synthdefs(
+        bytearray(compiled_synthdefs)
+    )
+    # Abandoning the iterator early unmaps the file cleanly
+    iterator = decompiler.iterate_synthdefs(str(file_path))
+    assert next(iterator) == new_synthdefs[0]
+    iterator.close()
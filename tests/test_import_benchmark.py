@@ -0,0 +1,92 @@
+import collections
+import json
+import subprocess
+import sys
+
+import pytest
+
+from supriya import CalculationRate
+
+script = """
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+import supriya
+import_time = time.perf_counter() - start_time
+loaded = sorted(
+    name
+    for name in (
+        "pyximport",
+        "supriya.nonrealtime",
+        "supriya.patterns",
+        "supriya.realtime",
+    )
+    if name in sys.modules
+)
+start_time = time.perf_counter()
+import supriya.ugens
+ugens_time = time.perf_counter() - start_time
+print(json.dumps(dict(import_time=import_time, loaded=loaded, ugens_time=ugens_time)))
+"""
+
+
+def run_script():
+    output = subprocess.check_output([sys.executable, "-c", script])
+    return json.loads(output.decode().splitlines()[-1])
+
+
+def test_lazy_submodules():
+    result = run_script()
+    assert result["loaded"] == []
+    # Eager imports took about 1.9s and 1.5s respectively
+    assert result["import_time"] < 0.5
+    assert result["ugens_time"] < 1.0
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    ["supriya.commands", "supriya.nonrealtime", "supriya.patterns", "supriya.provider"],
+)
+def test_standalone_submodules(module_name):
+    # Each subpackage must import cleanly without anything preloaded
+    subprocess.check_call([sys.executable, "-c", "import {}".format(module_name)])
+
+
+def test_lazy_attributes():
+    import supriya
+    import supriya.realtime
+
+    assert "Server" in dir(supriya)
+    assert supriya.Server is supriya.realtime.Server
+    assert supriya.server is supriya.realtime.Server.default()
+    with pytest.raises(AttributeError):
+        supriya.nonexistent
+    namespace = {}
+    exec("from supriya import *", namespace)
+    assert namespace["Server"] is supriya.realtime.Server
+    assert namespace["Session"] is supriya.Session
+
+
+def test_lazy_ugen_methods():
+    from supriya.synthdefs import UGen
+    from supriya.synthdefs.bases import LazyUGenMethod
+
+    class Blip(UGen):
+        _ordered_input_names = collections.OrderedDict(
+            [("frequency", 440.0), ("harmonic_count", 200.0)]
+        )
+        _valid_calculation_rates = (CalculationRate.AUDIO, CalculationRate.CONTROL)
+
+    namespace = vars(Blip)
+    for name in ("__init__", "ar", "kr"):
+        assert isinstance(namespace[name], LazyUGenMethod)
+    ugen = Blip.ar(frequency=443)
+    assert ugen.frequency == 443
+    assert ugen.calculation_rate == CalculationRate.AUDIO
+    assert not isinstance(namespace["__init__"], LazyUGenMethod)
+    assert not isinstance(namespace["ar"], LazyUGenMethod)
+    assert isinstance(namespace["kr"], LazyUGenMethod)
+    assert "def kr(" in Blip._kr_source
+    assert not isinstance(namespace["kr"], LazyUGenMethod)
@@ -0,0 +1,73 @@
+import aifc
+import wave
+
+import pytest
+
+from supriya.soundfiles import join_soundfiles
+
+
+def write(file_path, values, sample_width=2):
+    endianness = "little" if file_path.suffix == ".wav" else "big"
+    opener = wave.open if file_path.suffix == ".wav" else aifc.open
+    with opener(str(file_path), "wb") as writer:
+        if file_path.suffix == ".aiff":
+            writer.aiff()
+        writer.setnchannels(1)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(1000)
+        writer.writeframes(
+            b"".join(
+                value.to_bytes(sample_width, endianness, signed=True)
+                for value in values
+            )
+        )
+
+
+def read(file_path, sample_width=2):
+    endianness = "little" if file_path.suffix == ".wav" else "big"
+    opener = wave.open if file_path.suffix == ".wav" else aifc.open
+    with opener(str(file_path), "rb") as reader:
+        data = reader.readframes(reader.getnframes())
+    return [
+        int.from_bytes(data[i : i + sample_width], endianness, signed=True)
+        for i in range(0, len(data), sample_width)
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".aiff", ".wav"])
+@pytest.mark.parametrize("sample_width", [2, 3])
+def test_join_soundfiles(tmp_path, suffix, sample_width):
+    file_path_a = tmp_path / ("a" + suffix)
+    file_path_b = tmp_path / ("b" + suffix)
+    output_file_path = tmp_path / ("output" + suffix)
+    write(file_path_a, list(range(10)), sample_width)
+    write(file_path_b, [-x for x in range(10)], sample_width)
+    join_soundfiles(output_file_path, [(file_path_a, 2, 3), (file_path_b, 5, None)])
+    assert read(output_file_path, sample_width) == [2, 3, 4, -5, -6, -7, -8, -9]
+
+
+def test_join_soundfiles_crossfade(tmp_path):
+    file_path_a = tmp_path / "a.aiff"
+    file_path_b = tmp_path / "b.aiff"
+    output_file_path = tmp_path / "output.aiff"
+    write(file_path_a, [1000] * 10)
+    write(file_path_b, [3000] * 10)
+    join_soundfiles(
+        output_file_path,
+        [(file_path_a, 0, 4), (file_path_b, 2, None)],
+        crossfade_frame_count=4,
+    )
+    assert read(output_file_path) == [
+        1000,
+        1000,
+        1000,
+        1000,
+        1000,
+        1500,
+        2000,
+        2500,
+        3000,
+        3000,
+        3000,
+        3000,
+    ]